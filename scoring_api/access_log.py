@@ -0,0 +1,140 @@
+"""Структурированный журнал доступа к API.
+
+На каждый запрос пишется одна строка JSON, собранная из контекста запроса: идентификатор запроса, метод,
+учетная запись, код ответа, время обработки и сведения, которые сохранили обработчики (`has`, `nclients`),
+а также время этапов (`timings`), если оно измерялось.
+Строка сериализуется сразу, поэтому фоновый поток журнала не обращается к объектам запроса.
+
+Тело запроса попадает в журнал только для доли запросов `sample_rate`. Значения персональных полей
+(телефон, email, имя, дата рождения) и токен в нем заменяются на `REDACTED`, поэтому в журнал не попадают
+персональные данные.
+"""
+
+import json
+import logging
+import random
+from typing import TYPE_CHECKING
+
+from scoring_api.constants import ACCESS_LOG_SAMPLE_RATE
+
+if TYPE_CHECKING:
+    from typing import Any
+
+logger = logging.getLogger('scoring_api.access')
+
+REDACTED = '***'
+REDACTED_FIELDS = frozenset({'token', 'phone', 'email', 'first_name', 'last_name', 'birthday'})
+CONTEXT_FIELDS = ('method', 'account', 'has', 'nclients', 'timings')  # Поля контекста, которые попадают в журнал
+
+
+def redact(value: 'Any', fields: frozenset[str] = REDACTED_FIELDS) -> 'Any':  # noqa: ANN401
+    """Возвращает копию значения, в которой значения полей `fields` на любом уровне вложенности скрыты.
+
+    Args:
+        value: Декодированное тело запроса или его часть.
+        fields: Имена скрываемых полей.
+
+    Returns:
+        Значение со скрытыми полями.
+    """
+    if isinstance(value, dict):
+        return {key: REDACTED if key in fields else redact(item, fields) for key, item in value.items()}
+    if isinstance(value, list):
+        return [redact(item, fields) for item in value]
+    return value
+
+
+class AccessLog:
+    """Формирует записи журнала доступа с выборочным журналированием тела запроса."""
+
+    def __init__(
+        self,
+        sample_rate: float = ACCESS_LOG_SAMPLE_RATE,
+        redacted_fields: frozenset[str] = REDACTED_FIELDS,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Создает журнал доступа.
+
+        Args:
+            sample_rate: Доля запросов (от 0 до 1), для которых в журнал пишется тело запроса.
+            redacted_fields: Имена полей тела запроса, значения которых скрываются.
+            rng: Генератор случайных чисел для выборки.
+        """
+        self.sample_rate = sample_rate
+        self.redacted_fields = redacted_fields
+        self._random = rng or random.Random()
+
+    def record(  # noqa: PLR0913
+        self,
+        context: dict[str, 'Any'],
+        path: str,
+        status_code: int,
+        latency: float,
+        body: dict[str, 'Any'] | None,
+        error: object = None,
+    ) -> str:
+        """Формирует строку журнала доступа.
+
+        Args:
+            context: Контекст запроса.
+            path: Путь запроса.
+            status_code: Код ответа.
+            latency: Время обработки запроса, в секундах.
+            body: Декодированное тело запроса (None, если его не удалось декодировать).
+            error: Описание ошибки для неуспешного ответа.
+
+        Returns:
+            Запись в формате JSON.
+        """
+        entry: dict[str, Any] = {
+            'request_id': context.get('request_id'),
+            'path': path,
+            'status': status_code,
+            'latency_ms': round(latency * 1000, 3),
+        }
+        entry.update((field, context[field]) for field in CONTEXT_FIELDS if field in context)
+
+        if error is not None:
+            entry['error'] = error
+        if body is not None and self.sample_rate > 0 and self._random.random() < self.sample_rate:
+            entry['body'] = redact(body, self.redacted_fields)
+
+        return json.dumps(entry, ensure_ascii=False, separators=(',', ':'), default=str)
+
+    def log(  # noqa: PLR0913
+        self,
+        context: dict[str, 'Any'],
+        path: str,
+        status_code: int,
+        latency: float,
+        body: dict[str, 'Any'] | None,
+        error: object = None,
+    ) -> None:
+        """Пишет запись журнала доступа (см. `record`), если журнал доступа включен."""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('%s', self.record(context, path, status_code, latency, body, error))
+
+
+_access_log = AccessLog()
+
+
+def configure_access_log(sample_rate: float = ACCESS_LOG_SAMPLE_RATE) -> None:
+    """Настраивает журнал доступа, используемый обработчиком API.
+
+    Args:
+        sample_rate: Доля запросов (от 0 до 1), для которых в журнал пишется тело запроса.
+    """
+    global _access_log  # noqa: PLW0603
+    _access_log = AccessLog(sample_rate)
+
+
+def log_access(  # noqa: PLR0913
+    context: dict[str, 'Any'],
+    path: str,
+    status_code: int,
+    latency: float,
+    body: dict[str, 'Any'] | None,
+    error: object = None,
+) -> None:
+    """Пишет запись журнала доступа настроенным журналом (см. `AccessLog.record`)."""
+    _access_log.log(context, path, status_code, latency, body, error)
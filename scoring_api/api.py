@@ -2,28 +2,61 @@
 
 import json
 import logging
+import time
 import uuid
 from http.server import BaseHTTPRequestHandler
 from typing import TYPE_CHECKING
 
+from scoring_api.access_log import log_access
+from scoring_api.capture import capture_request
 from scoring_api.constants import (
     HTTPStatus,
+    REQUEST_LATENCY_BUCKETS,
 )
-from scoring_api.handlers import method_handler
+from scoring_api.decoder import decode_json_object, DecodeError
+from scoring_api.handlers import method_handler, MethodName, profile_handler
+from scoring_api.metrics import CONTENT_TYPE, REGISTRY, render_metrics
 from scoring_api.models import HTTPErrorResponse
+from scoring_api.rules import render_cache_policy_stats
+from scoring_api.slow_log import log_slow_request, render_slow_requests, start_slow_log, stop_slow_log
+from scoring_api.timing import current_timer, phase, server_timing_enabled, start_timing, stop_timing
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from email.message import Message
     from typing import Any, ClassVar
 
     from scoring_api.storage.interface import StorageInterface
     from scoring_api.types import MethodHandlerType
 
+logger = logging.getLogger(__name__)
+
+UNKNOWN_METHOD = 'unknown'  # Метка метода для запросов, метод которых не удалось определить
+METHOD_LABELS = frozenset(method.value for method in MethodName)
+REQUEST_LABELS = {
+    'method': [*sorted(METHOD_LABELS), UNKNOWN_METHOD],
+    'status': [str(status.value) for status in HTTPStatus],
+}
+
+REQUESTS = REGISTRY.counter('scoring_api_requests_total', 'API requests by method and status.', REQUEST_LABELS)
+REQUEST_DURATION = REGISTRY.histogram(
+    'scoring_api_request_duration_seconds',
+    'API request processing time by method and status.',
+    REQUEST_LATENCY_BUCKETS,
+    REQUEST_LABELS,
+)
+REQUESTS_IN_FLIGHT = REGISTRY.gauge('scoring_api_requests_in_flight', 'API requests being processed.')
+
 
 class APIHandler(BaseHTTPRequestHandler):
     """Обрабатывает входящие HTTP-запросы и направляет их в соответствующий метод."""
 
-    router: 'ClassVar[dict[str, MethodHandlerType]]' = {'method': method_handler}
+    router: 'ClassVar[dict[str, MethodHandlerType]]' = {'method': method_handler, 'profile': profile_handler}
+    get_router: 'ClassVar[dict[str, tuple[Callable[[], str], str]]]' = {
+        'metrics': (render_metrics, CONTENT_TYPE),
+        'slow_requests': (render_slow_requests, 'application/json'),
+        'cache_policy': (render_cache_policy_stats, 'application/json'),
+    }
 
     def __init__(self, *args: 'Any', storage: 'StorageInterface', **kwargs: 'Any') -> None:
         """Инициализирует обработчик API.
@@ -39,54 +72,139 @@ class APIHandler(BaseHTTPRequestHandler):
     def _send_response(self, response: dict[str, 'Any'], status_code: int, context: dict[str, 'Any']) -> None:
         """Отправляет ответ в формате JSON обратно клиенту.
 
+        Курсор следующей страницы из `context['next_cursor']` добавляется в успешный ответ.
+        Если для запроса измеряется время этапов, оно передается в заголовке `Server-Timing`.
+
         Args:
             response: Ответные данные.
             status_code: Код состояния HTTP.
             context: Дополнительная информация о контексте запроса.
         """
-        self.send_response(status_code)
-        self.send_header('Content-Type', 'application/json')
-        self.end_headers()
-
         final_response = (
             {'code': status_code, 'response': response}
             if status_code == HTTPStatus.OK.value
             else {'code': status_code, 'error': response['error']}
         )
+        if status_code == HTTPStatus.OK.value and 'next_cursor' in context:
+            final_response['next_cursor'] = context['next_cursor']
 
-        context.update(final_response)
-        logging.info(context)
+        with phase('serialize'):
+            body = json.dumps(final_response).encode('utf-8')
 
-        self.wfile.write(json.dumps(final_response).encode('utf-8'))
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        timer = current_timer()
+        if timer is not None:
+            self.send_header('Server-Timing', timer.server_timing())
+        self.end_headers()
+
+        self.wfile.write(body)
+
+    def log_request(self, code: int | str = '-', size: int | str = '-') -> None:
+        """Не пишет строку журнала `BaseHTTPRequestHandler`: запрос описывает запись журнала доступа."""
+
+    def log_message(self, format: str, *args: 'Any') -> None:  # noqa: A002
+        """Пишет строку журнала доступа `BaseHTTPRequestHandler` через очередь журнала, а не прямо в stderr."""
+        logger.info('%s - - ' + format, self.address_string(), *args)
 
     def get_request_id(self, headers: 'Message') -> str:  # noqa: ANN001
         """Извлекает или генерирует идентификатор запроса."""
         return str(headers.get('HTTP_X_REQUEST_ID', uuid.uuid4().hex))
 
+    def do_GET(self) -> None:  # noqa N802
+        """Обрабатывает HTTP GET-запросы к служебным страницам (например, `/metrics`)."""
+        route = self.get_router.get(self.path.strip('/'))
+        if route is None:
+            response, status_code = HTTPErrorResponse(HTTPStatus.NOT_FOUND).as_tuple()
+            self._send_response(response, status_code, {})
+            return
+
+        render, content_type = route
+        body = render().encode('utf-8')
+
+        self.send_response(HTTPStatus.OK.value)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def do_POST(self) -> None:  # noqa N802
-        """Обрабатывает HTTP POST-запросы."""
+        """Обрабатывает HTTP POST-запросы.
+
+        Тело, которое не является JSON-объектом, отклоняется с кодом 400 и не передается в обработчик.
+        По завершении запроса в журнал доступа пишется одна структурированная запись (см. `access_log`),
+        а в метрики - количество и время обработки запросов по методу и коду ответа. Если включено
+        измерение этапов (см. `timing`), время этапов сохраняется в `context['timings']`. Запрос медленнее
+        порога журнала медленных запросов (см. `slow_log`) сохраняется вместе с обращениями к хранилищу.
+        Если включена запись трафика (см. `capture`), запрос метода записывается до его обработки.
+        """
+        started = time.perf_counter()
+        timing_token = start_timing()[1] if server_timing_enabled() else None
+        slow_log_token = start_slow_log()
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            self._handle_post(started)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            if timing_token is not None:
+                stop_timing(timing_token)
+            if slow_log_token is not None:
+                stop_slow_log(slow_log_token)
+
+    def _handle_post(self, started: float) -> None:
+        """Читает, маршрутизирует и записывает в журнал и метрики POST-запрос.
+
+        Args:
+            started: Момент начала обработки запроса (`time.perf_counter`).
+        """
         response: dict[str, Any] = {}
         status_code = HTTPStatus.OK.value
-        context = {'request_id': self.get_request_id(self.headers)}
+        context: dict[str, Any] = {'request_id': self.get_request_id(self.headers)}
+        data_string = b''
         request = None
 
         try:
-            data_string = self.rfile.read(int(self.headers['Content-Length']))
-            request = json.loads(data_string)
-        except (json.JSONDecodeError, ValueError):
+            content_length = int(self.headers.get('Content-Length', 0))
+            if content_length < 0:
+                raise DecodeError('Negative Content-Length')
+            with phase('read'):
+                data_string = self.rfile.read(content_length)
+            with phase('decode'):
+                request = decode_json_object(data_string)
+        except ValueError:
             response, status_code = HTTPErrorResponse(HTTPStatus.BAD_REQUEST).as_tuple()
 
         path = self.path.strip('/')
-        logging.info(f'{self.path} {data_string.decode("utf-8")} {context["request_id"]}')
 
-        if path in self.router:
+        if path not in self.router:
+            response, status_code = HTTPErrorResponse(HTTPStatus.NOT_FOUND).as_tuple()
+        elif request is not None:
+            capture_request(path, request)
             try:
                 method = self.router[path]
                 response, status_code = method({'body': request, 'headers': self.headers}, context, self.storage)
             except Exception as error:
-                logging.exception(f'Unexpected error: {error}')
+                logger.exception('Unexpected error: %s', error)
                 response, status_code = HTTPErrorResponse(HTTPStatus.INTERNAL_ERROR).as_tuple()
-        else:
-            response, status_code = HTTPErrorResponse(HTTPStatus.NOT_FOUND).as_tuple()
 
         self._send_response(response, status_code, context)
+
+        latency = time.perf_counter() - started
+        timer = current_timer()
+        if timer is not None:
+            context['timings'] = timer.milliseconds()
+        method_label = context.get('method')
+        labels = (method_label if method_label in METHOD_LABELS else UNKNOWN_METHOD, str(status_code))
+        REQUESTS.inc(labels)
+        REQUEST_DURATION.observe(latency, labels)
+
+        log_access(
+            context,
+            self.path,
+            status_code,
+            latency,
+            request,
+            None if status_code == HTTPStatus.OK.value else response.get('error'),
+        )
+        log_slow_request(context, self.path, status_code, latency)
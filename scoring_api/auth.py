@@ -1,14 +1,37 @@
-"""Модуль аутентификации для проверки доступа к API."""
+"""Модуль аутентификации для проверки доступа к API.
+
+Токен партнера не меняется со временем, поэтому успешные проверки запоминаются в `AuthCache`
+(ограниченный по размеру LRU-кэш с временем жизни записей): повторный запрос того же партнера
+не вычисляет SHA-512. Токен администратора зависит от текущего часа; `AdminTokenRing` вычисляет
+его заранее и пересчитывает только на границах часа. Рядом с границей часа принимаются токены
+обоих часов, чтобы расхождение часов клиента и сервера не приводило к отказам.
+
+Токены сравниваются за постоянное время (`hmac.compare_digest`). Действительный токен - шестнадцатеричная
+строка, поэтому токен, который не является строкой ASCII, отклоняется до сравнения.
+"""
 
 import datetime
 import hashlib
+import hmac
+import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
-from scoring_api.constants import ADMIN_SALT, SALT
+from scoring_api.constants import (
+    ADMIN_SALT,
+    ADMIN_TOKEN_GRACE_SECONDS,
+    AUTH_CACHE_SIZE,
+    AUTH_CACHE_TTL_SECONDS,
+    SALT,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from scoring_api.requests.requests import MethodRequest
 
+type AuthKey = tuple[str, str, str]
+
 
 def generate_auth_token(login: str, account: str = '') -> str:
     """Генерирует токен аутентификации для пользователя.
@@ -20,16 +43,127 @@ def generate_auth_token(login: str, account: str = '') -> str:
     Returns:
         Строка токена.
     """
-    return hashlib.sha512((account + login + SALT).encode('utf-8')).hexdigest()
+    return hashlib.sha512((account + login + SALT).encode('utf-8', 'surrogatepass')).hexdigest()
 
 
-def generate_admin_auth_token() -> str:
+def generate_admin_auth_token(moment: datetime.datetime | None = None) -> str:
     """Генерирует токен аутентификации для администратора.
 
+    Args:
+        moment: Момент времени, для часа которого нужен токен (по умолчанию текущий).
+
     Returns:
         Строка токена администратора.
     """
-    return hashlib.sha512((datetime.datetime.now().strftime('%Y%m%d%H') + ADMIN_SALT).encode('utf-8')).hexdigest()
+    moment = moment or datetime.datetime.now()
+    return hashlib.sha512((moment.strftime('%Y%m%d%H') + ADMIN_SALT).encode('utf-8')).hexdigest()
+
+
+def _tokens_equal(expected: str, token: object) -> bool:
+    """Сравнивает токены за постоянное время; токен, который не является строкой ASCII, не совпадает."""
+    return isinstance(token, str) and token.isascii() and hmac.compare_digest(expected, token)
+
+
+class AuthCache:
+    """LRU-кэш успешных проверок токенов партнеров с временем жизни записей."""
+
+    def __init__(
+        self,
+        max_size: int = AUTH_CACHE_SIZE,
+        ttl: float = AUTH_CACHE_TTL_SECONDS,
+        clock: 'Callable[[], float]' = time.monotonic,
+    ) -> None:
+        """Создает пустой кэш.
+
+        Args:
+            max_size: Максимальное количество записей.
+            ttl: Время жизни записи, в секундах.
+            clock: Источник монотонного времени.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[AuthKey, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Количество записей в кэше."""
+        return len(self._entries)
+
+    def __contains__(self, key: AuthKey) -> bool:
+        """Проверяет, что токен недавно успешно проверен."""
+        expires_at = self._entries.get(key)
+        if expires_at is None:
+            return False
+
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return False
+
+        self._entries.move_to_end(key)
+        return True
+
+    def add(self, key: AuthKey) -> None:
+        """Запоминает успешную проверку токена, вытесняя самую давнюю запись при переполнении."""
+        self._entries[key] = self._clock() + self.ttl
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Очищает кэш."""
+        self._entries.clear()
+
+
+class AdminTokenRing:
+    """Заранее вычисленные токены администратора, действительные в текущий момент."""
+
+    def __init__(self, grace: float = ADMIN_TOKEN_GRACE_SECONDS, clock: 'Callable[[], float]' = time.time) -> None:
+        """Создает набор токенов.
+
+        Args:
+            grace: Сколько секунд до и после границы часа принимаются токены обоих часов.
+            clock: Источник времени (Unix time).
+        """
+        self.grace = grace
+        self._clock = clock
+        self._tokens: tuple[str, ...] = ()
+        self._valid_from = 0.0
+        self._valid_until = 0.0
+
+    def tokens(self) -> tuple[str, ...]:
+        """Возвращает токены, действительные в текущий момент, пересчитывая их только при смене набора."""
+        now = self._clock()
+        if not self._valid_from <= now < self._valid_until:
+            self._rotate(now)
+        return self._tokens
+
+    def is_valid(self, token: object) -> bool:
+        """Проверяет токен администратора, сравнивая его со всеми действительными токенами."""
+        return sum(_tokens_equal(expected, token) for expected in self.tokens()) > 0
+
+    def _rotate(self, now: float) -> None:
+        """Вычисляет токены для момента `now` и интервал, в котором набор токенов не меняется."""
+        moments = (now - self.grace, now, now + self.grace)
+        self._tokens = tuple(
+            dict.fromkeys(generate_admin_auth_token(datetime.datetime.fromtimestamp(moment)) for moment in moments)
+        )
+
+        hour_start = datetime.datetime.fromtimestamp(now).replace(minute=0, second=0, microsecond=0).timestamp()
+        previous_boundary, next_boundary = hour_start, hour_start + 3600
+        changes = (
+            previous_boundary - self.grace,
+            previous_boundary,
+            previous_boundary + self.grace,
+            next_boundary - self.grace,
+            next_boundary,
+            next_boundary + self.grace,
+        )
+        self._valid_from = max((change for change in changes if change <= now), default=now)
+        self._valid_until = min(change for change in changes if change > now)
+
+
+_auth_cache = AuthCache()
+_admin_tokens = AdminTokenRing()
 
 
 def is_authenticated(request: 'MethodRequest') -> bool:
@@ -41,10 +175,20 @@ def is_authenticated(request: 'MethodRequest') -> bool:
     Returns:
         True, если аутентификация подтверждена, False в противном случае.
     """
-    expected_token = (
-        generate_admin_auth_token()
-        if request.is_admin
-        else generate_auth_token(request.validated_data['login'], request.validated_data.get('account', ''))
-    )
+    token = request.validated_data['token']
+
+    if request.is_admin:
+        return _admin_tokens.is_valid(token)
+
+    login = request.validated_data['login']
+    account = request.validated_data.get('account', '')
+    key = (account, login, token)
+
+    if key in _auth_cache:
+        return True
+
+    if not _tokens_equal(generate_auth_token(login, account), token):
+        return False
 
-    return bool(expected_token == request.validated_data['token'])
+    _auth_cache.add(key)
+    return True
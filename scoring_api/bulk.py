@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+
+"""Пакетный (офлайн) расчет скоринга по большим файлам.
+
+Модуль потоково читает входной файл (CSV или NDJSON), проверяет каждую запись через `OnlineScoreRequest`
+и считает скоринг через `get_score` в пуле процессов. Записи обрабатываются порциями фиксированного размера,
+число порций в обработке ограничено, поэтому потребление памяти не зависит от размера файла.
+Результаты пишутся в выходной NDJSON-файл в порядке входных записей.
+
+Использование:
+    Расчет скоринга без обращения к кэшу:
+        $ python -m scoring_api.bulk clients.csv scores.ndjson
+
+    Расчет с заполнением кэша `uid:` и явным числом процессов:
+        $ python -m scoring_api.bulk clients.ndjson scores.ndjson --workers 8 --populate-cache
+"""
+
+import csv
+import json
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from itertools import batched
+from multiprocessing import Pool
+from typing import TYPE_CHECKING
+
+from scoring_api.cli import BulkConfig, parse_bulk_arguments
+from scoring_api.logger import configure_logger
+from scoring_api.requests.exceptions import ValidationError
+from scoring_api.requests.requests import OnlineScoreRequest
+from scoring_api.rules import configure_scoring_models, DEFAULT_SCORING_MODEL, get_scoring_model
+from scoring_api.scoring import get_score
+from scoring_api.storage.constants import DEFAULT_CACHE_EXPIRATION_SECONDS
+from scoring_api.storage.interface import StorageInterface
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from multiprocessing.pool import AsyncResult
+    from typing import Any, TextIO
+
+    from scoring_api.rules import ScoringModel
+
+type Record = tuple[int, str | dict[str, 'Any']]
+type ChunkResult = tuple[str, int, int]
+
+MAX_PENDING_CHUNKS_PER_WORKER = 2  # Сколько порций на процесс может одновременно находиться в обработке
+PROGRESS_LOG_INTERVAL_SECONDS = 10.0  # Период вывода промежуточной статистики
+
+logger = logging.getLogger(__name__)
+
+
+class BulkStorage(StorageInterface):
+    """Хранилище для пакетного расчета.
+
+    Всегда промахивается мимо кэша, чтобы скоринг пересчитывался заново, и при наличии
+    основного хранилища записывает в него рассчитанные значения.
+    """
+
+    def __init__(self, backend: StorageInterface | None = None) -> None:
+        """Создает хранилище для пакетного расчета.
+
+        Args:
+            backend: Хранилище для записи рассчитанных значений. Если нет, значения никуда не пишутся.
+        """
+        self.backend = backend
+
+    def get(self, key: str) -> str | None:
+        """Получает значение из основного хранилища."""
+        return self.backend.get(key) if self.backend is not None else None
+
+    def cache_get(self, key: str) -> str | None:  # noqa: ARG002
+        """Всегда возвращает промах, чтобы скоринг был пересчитан."""
+        return None
+
+    def cache_set(self, key: str, value: str | int | float, expire: int = DEFAULT_CACHE_EXPIRATION_SECONDS) -> None:
+        """Записывает значение в кэш основного хранилища, если оно задано."""
+        if self.backend is not None:
+            self.backend.cache_set(key, value, expire)
+
+
+@dataclass
+class BulkStats:
+    """Статистика пакетного расчета."""
+
+    records: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Количество обработанных записей в секунду."""
+        return self.records / self.elapsed if self.elapsed > 0 else 0.0
+
+
+_storage: StorageInterface = BulkStorage()
+_model: 'ScoringModel' = DEFAULT_SCORING_MODEL
+
+
+def init_worker(populate_cache: bool, scoring_config: str | None = None, account: str | None = None) -> None:
+    """Инициализирует процесс пула: создает хранилище и выбирает модель скоринга.
+
+    Args:
+        populate_cache: Записывать ли рассчитанные значения в Memcached.
+        scoring_config: Путь к файлу конфигурации моделей скоринга.
+        account: Учетная запись партнера, по которой выбирается модель.
+    """
+    global _storage, _model  # noqa: PLW0603
+
+    configure_scoring_models(scoring_config)
+    _model = get_scoring_model(account)
+
+    backend = None
+    if populate_cache:
+        from scoring_api.storage.memcached import MemcacheStorage
+
+        backend = MemcacheStorage()
+
+    _storage = BulkStorage(backend)
+
+
+def read_records(path: str, input_format: str) -> 'Iterator[Record]':
+    """Потоково читает записи входного файла.
+
+    Строки NDJSON не разбираются здесь, а передаются в процессы пула как есть.
+    Пустые значения CSV отбрасываются, а пол приводится к числу.
+
+    Args:
+        path: Путь к входному файлу.
+        input_format: Формат файла: `csv` или `ndjson`.
+
+    Yields:
+        Номер строки и запись (строка NDJSON или словарь CSV).
+    """
+    with open(path, encoding='utf-8', newline='') as file:
+        if input_format == 'csv':
+            reader = csv.DictReader(file)
+            for row in reader:
+                record: dict[str, Any] = {k: v for k, v in row.items() if k and v}
+                gender = record.get('gender')
+                if isinstance(gender, str) and gender.isdigit():
+                    record['gender'] = int(gender)
+                yield reader.line_num, record
+            return
+
+        for line_no, line in enumerate(file, start=1):
+            if line.strip():
+                yield line_no, line
+
+
+def score_record(
+    payload: str | dict[str, 'Any'], storage: StorageInterface, model: 'ScoringModel' = DEFAULT_SCORING_MODEL
+) -> dict[str, 'Any']:
+    """Проверяет одну запись и рассчитывает для нее скоринг.
+
+    Args:
+        payload: Строка NDJSON или уже разобранная запись.
+        storage: Экземпляр хранилища.
+        model: Модель скоринга.
+
+    Returns:
+        Словарь с `score` или `error`.
+    """
+    if isinstance(payload, str):
+        try:
+            payload = json.loads(payload)
+        except json.JSONDecodeError:
+            return {'error': 'Invalid JSON'}
+
+    if not isinstance(payload, dict):
+        return {'error': 'Record must be an object'}
+
+    result: dict[str, Any] = {'id': payload['id']} if 'id' in payload else {}
+
+    score_request = OnlineScoreRequest(payload)
+    if not score_request.is_valid():
+        result['error'] = score_request.errors
+        return result
+
+    try:
+        score_request.validate_required_pairs()
+    except ValidationError as error:
+        result['error'] = str(error)
+        return result
+
+    result['score'] = get_score(storage, model=model, **score_request.validated_data)
+    return result
+
+
+def score_chunk(chunk: tuple['Record', ...]) -> ChunkResult:
+    """Обрабатывает порцию записей в процессе пула.
+
+    Args:
+        chunk: Порция записей с номерами строк.
+
+    Returns:
+        Готовый к записи блок NDJSON, количество записей и количество ошибок.
+    """
+    lines = []
+    errors = 0
+
+    for line_no, payload in chunk:
+        result = score_record(payload, _storage, _model)
+        errors += 'error' in result
+        lines.append(json.dumps({'line': line_no, **result}, ensure_ascii=False))
+
+    lines.append('')
+    return '\n'.join(lines), len(chunk), errors
+
+
+def run_bulk(config: BulkConfig) -> BulkStats:
+    """Выполняет пакетный расчет скоринга.
+
+    Args:
+        config: Конфигурация пакетного расчета.
+
+    Returns:
+        Итоговая статистика.
+    """
+    configure_scoring_models(config.scoring_config)  # Ошибки конфигурации проявятся до запуска пула
+
+    stats = BulkStats()
+    workers = config.workers or os.cpu_count() or 1
+    max_pending = workers * MAX_PENDING_CHUNKS_PER_WORKER
+    started = last_report = time.perf_counter()
+
+    def write(output: 'TextIO', result: 'AsyncResult[ChunkResult]') -> None:
+        nonlocal last_report
+
+        text, records, errors = result.get()
+        output.write(text)
+        stats.records += records
+        stats.errors += errors
+
+        now = time.perf_counter()
+        if now - last_report >= PROGRESS_LOG_INTERVAL_SECONDS:
+            last_report = now
+            stats.elapsed = now - started
+            logger.info(
+                'Processed %d records (%d errors), %.0f records/s', stats.records, stats.errors, stats.throughput
+            )
+
+    with (
+        open(config.output_file, 'w', encoding='utf-8') as output,
+        Pool(
+            workers, initializer=init_worker, initargs=(config.populate_cache, config.scoring_config, config.account)
+        ) as pool,
+    ):
+        pending: deque[AsyncResult[ChunkResult]] = deque()
+
+        for chunk in batched(read_records(config.input_file, config.input_format), config.chunk_size):
+            pending.append(pool.apply_async(score_chunk, (chunk,)))
+            if len(pending) >= max_pending:
+                write(output, pending.popleft())
+
+        while pending:
+            write(output, pending.popleft())
+
+    stats.elapsed = time.perf_counter() - started
+    logger.info(
+        'Bulk scoring finished: %d records, %d errors in %.2fs (%.0f records/s)',
+        stats.records,
+        stats.errors,
+        stats.elapsed,
+        stats.throughput,
+    )
+
+    return stats
+
+
+if __name__ == '__main__':
+    bulk_config = parse_bulk_arguments()
+    configure_logger(bulk_config.log_file)
+
+    run_bulk(bulk_config)
@@ -0,0 +1,187 @@
+"""Адаптивная политика кэширования оценок.
+
+Для простых моделей скоринга расчет оценки занимает сотни наносекунд, а обращение к кэшу - сотни микросекунд,
+и кэш только увеличивает задержку. Политика измеряет стоимость расчета, чтения и записи кэша (скользящее
+среднее) и долю попаданий, после чего отдельно решает, читать ли кэш и записывать ли в него:
+
+    - чтение окупается, если оно дешевле расчета, который оно в среднем заменяет: `read < hit_ratio * compute`;
+    - запись окупается, если она дешевле выигрыша от будущих попаданий по записанному ключу:
+      `write < hit_ratio * (compute - read)`.
+
+Так горячие ключи дешевой модели читаются без платы за запись при промахе (`READ_ONLY`), а кэш, который
+читают другие процессы, остается заполненным, даже если этому процессу выгоднее считать (`WRITE_ONLY`).
+
+Пока решение отличается от `READ_WRITE`, каждый `probe_interval`-й запрос все равно читает кэш и записывает
+в него, чтобы замеры чтения, записи и доли попаданий оставались актуальными.
+"""
+
+import logging
+from enum import Enum
+from typing import TypedDict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SMOOTHING = 0.05  # Вес нового измерения в скользящем среднем
+DEFAULT_WARMUP_SAMPLES = 100  # Количество чтений кэша до первого решения
+DEFAULT_PROBE_INTERVAL = 1000  # Период пробных обращений к кэшу и контрольных расчетов
+
+
+class CacheDecision(str, Enum):
+    """Решение политики кэширования для очередного запроса."""
+
+    READ_WRITE = 'read_write'  # Читать кэш, при промахе рассчитать и записать
+    READ_ONLY = 'read_only'  # Читать кэш, при промахе рассчитать, не записывая
+    WRITE_ONLY = 'write_only'  # Рассчитать оценку и записать ее, не читая кэш
+    BYPASS = 'bypass'  # Рассчитать оценку, не обращаясь к кэшу
+
+    @property
+    def reads(self) -> bool:
+        """Читается ли кэш."""
+        return self in (CacheDecision.READ_WRITE, CacheDecision.READ_ONLY)
+
+    @property
+    def writes(self) -> bool:
+        """Записывается ли рассчитанная оценка в кэш."""
+        return self in (CacheDecision.READ_WRITE, CacheDecision.WRITE_ONLY)
+
+
+class CachePolicyStats(TypedDict):
+    """Текущее решение политики и статистика измерений."""
+
+    decision: str  # Значение `CacheDecision`
+    compute_ns: int  # Время расчета оценки, скользящее среднее
+    read_ns: int  # Время чтения кэша
+    write_ns: int  # Время записи в кэш
+    hit_ratio: float  # Доля попаданий в кэш
+    calls: int  # Количество решений
+    bypasses: int  # Количество запросов, которые не читали кэш
+
+
+class AdaptiveCachePolicy:
+    """Политика кэширования, выбирающая между кэшем и расчетом по измеренной стоимости."""
+
+    __slots__ = (
+        '_calls',
+        '_compute_samples',
+        '_read_samples',
+        'bypasses',
+        'compute_ns',
+        'decision',
+        'hit_ratio',
+        'name',
+        'probe_interval',
+        'read_ns',
+        'smoothing',
+        'warmup_samples',
+        'write_ns',
+    )
+
+    def __init__(
+        self,
+        name: str,
+        smoothing: float = DEFAULT_SMOOTHING,
+        warmup_samples: int = DEFAULT_WARMUP_SAMPLES,
+        probe_interval: int = DEFAULT_PROBE_INTERVAL,
+    ) -> None:
+        """Создает политику кэширования.
+
+        Args:
+            name: Название модели скоринга, к которой относится политика.
+            smoothing: Вес нового измерения в скользящем среднем.
+            warmup_samples: Количество чтений кэша до первого решения.
+            probe_interval: Период пробных обращений к кэшу и контрольных расчетов.
+        """
+        self.name = name
+        self.smoothing = smoothing
+        self.warmup_samples = warmup_samples
+        self.probe_interval = probe_interval
+        self.decision = CacheDecision.READ_WRITE
+        self.compute_ns = 0.0
+        self.read_ns = 0.0
+        self.write_ns = 0.0
+        self.hit_ratio = 0.0
+        self.bypasses = 0
+        self._calls = 0
+        self._compute_samples = 0
+        self._read_samples = 0
+
+    def decide(self) -> CacheDecision:
+        """Возвращает решение для очередного запроса."""
+        self._calls += 1
+
+        if self.decision is not CacheDecision.READ_WRITE:
+            if self._calls % self.probe_interval:
+                if not self.decision.reads:
+                    self.bypasses += 1
+                return self.decision
+            return CacheDecision.READ_WRITE  # Пробное обращение к кэшу
+
+        return self.decision
+
+    @property
+    def needs_compute_sample(self) -> bool:
+        """Нужно ли рассчитать оценку при попадании в кэш, чтобы измерить стоимость расчета."""
+        return self._compute_samples == 0 or self._calls % self.probe_interval == 0
+
+    def record_compute(self, elapsed_ns: int) -> None:
+        """Учитывает время расчета оценки."""
+        self.compute_ns = self._smooth(self.compute_ns, elapsed_ns, self._compute_samples)
+        self._compute_samples += 1
+
+    def record_read(self, elapsed_ns: int, hit: bool) -> None:
+        """Учитывает время чтения кэша и результат чтения."""
+        self.read_ns = self._smooth(self.read_ns, elapsed_ns, self._read_samples)
+        self.hit_ratio = self._smooth(self.hit_ratio, 1.0 if hit else 0.0, self._read_samples)
+        self._read_samples += 1
+        self._update_decision()
+
+    def record_write(self, elapsed_ns: int) -> None:
+        """Учитывает время записи в кэш."""
+        self.write_ns = self._smooth(self.write_ns, elapsed_ns, 0 if self.write_ns == 0 else 1)
+
+    def stats(self) -> CachePolicyStats:
+        """Возвращает текущее решение и статистику измерений."""
+        return {
+            'decision': self.decision.value,
+            'compute_ns': round(self.compute_ns),
+            'read_ns': round(self.read_ns),
+            'write_ns': round(self.write_ns),
+            'hit_ratio': round(self.hit_ratio, 4),
+            'calls': self._calls,
+            'bypasses': self.bypasses,
+        }
+
+    def _smooth(self, current: float, sample: float, samples: int) -> float:
+        """Обновляет экспоненциальное скользящее среднее."""
+        return float(sample) if samples == 0 else current + self.smoothing * (sample - current)
+
+    def _update_decision(self) -> None:
+        """Пересчитывает решение по накопленной статистике."""
+        if self._read_samples < self.warmup_samples or self._compute_samples == 0:
+            return
+
+        saved = self.hit_ratio * self.compute_ns  # Расчет, который в среднем заменяет чтение кэша
+        reads = self.read_ns < saved
+        writes = self.write_ns < saved - self.hit_ratio * self.read_ns
+        decision = _DECISIONS[reads, writes]
+
+        if decision is not self.decision:
+            self.decision = decision
+            logger.info(
+                'Cache policy for scoring model %s switched to %s (compute %.0f ns, read %.0f ns, write %.0f ns, '
+                'hit ratio %.2f)',
+                self.name,
+                decision.value,
+                self.compute_ns,
+                self.read_ns,
+                self.write_ns,
+                self.hit_ratio,
+            )
+
+
+_DECISIONS = {  # Решение по тому, окупаются ли чтение и запись кэша
+    (True, True): CacheDecision.READ_WRITE,
+    (True, False): CacheDecision.READ_ONLY,
+    (False, True): CacheDecision.WRITE_ONLY,
+    (False, False): CacheDecision.BYPASS,
+}
@@ -0,0 +1,125 @@
+"""Запись трафика API для воспроизведения при нагрузочном тестировании.
+
+Для доли `sample_rate` запросов методов в файл пишется одна строка JSON: время поступления запроса
+(Unix-время, секунды), путь и тело запроса без токена:
+
+    {"ts":1700000000.123456,"path":"/method","body":{"account":"horns&hoofs","login":"h&f",...}}
+
+Токен не записывается: при воспроизведении он рассчитывается заново (см. `tests/load/replay.py`).
+Остальные поля тела записываются как есть, поэтому файл содержит персональные данные и создается
+с доступом только для владельца.
+
+Файл открывается в режиме добавления до `fork`, и каждая строка пишется одним системным вызовом `write`,
+поэтому строки рабочих процессов не перемешиваются, а файл не нужно склеивать после записи.
+Ошибка записи (например, нет места на диске) не прерывает обработку запроса: первая ошибка пишется в журнал,
+а следующие запросы, которые не удалось записать, только считаются.
+"""
+
+import json
+import logging
+import os
+import random
+import time
+from typing import TYPE_CHECKING
+
+from scoring_api.constants import CAPTURE_SAMPLE_RATE
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CAPTURED_PATHS = frozenset({'method'})  # Маршруты, запросы которых записываются
+OMITTED_FIELDS = frozenset({'token'})  # Поля тела запроса, которые не записываются
+
+
+class TrafficCapture:
+    """Записывает выборку запросов в файл."""
+
+    def __init__(
+        self,
+        path: str,
+        sample_rate: float = CAPTURE_SAMPLE_RATE,
+        rng: random.Random | None = None,
+        clock: 'Callable[[], float]' = time.time,
+    ) -> None:
+        """Открывает файл записи трафика на добавление.
+
+        Args:
+            path: Путь к файлу.
+            sample_rate: Доля записываемых запросов (от 0 до 1).
+            rng: Генератор случайных чисел для выборки. По умолчанию - общий генератор модуля `random`:
+                он получает новое начальное значение после `fork`, поэтому выборки рабочих процессов независимы.
+            clock: Источник времени поступления запроса (Unix-время).
+        """
+        self.path = path
+        self.sample_rate = sample_rate
+        self._random = rng.random if rng is not None else random.random
+        self._clock = clock
+        self.errors = 0  # Сколько запросов не удалось записать
+        self._descriptor = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+
+    def record(self, path: str, body: dict[str, 'Any']) -> bool:
+        """Записывает запрос, если он попал в выборку.
+
+        Args:
+            path: Путь запроса без начального и конечного `/`.
+            body: Декодированное тело запроса.
+
+        Returns:
+            True, если запрос записан.
+        """
+        if self.sample_rate < 1 and self._random() >= self.sample_rate:
+            return False
+
+        entry = {
+            'ts': round(self._clock(), 6),
+            'path': f'/{path}',
+            'body': {key: value for key, value in body.items() if key not in OMITTED_FIELDS},
+        }
+        line = json.dumps(entry, separators=(',', ':'), default=str) + '\n'  # ASCII: допустимы и одиночные суррогаты
+        os.write(self._descriptor, line.encode('ascii'))
+        return True
+
+    def close(self) -> None:
+        """Закрывает файл."""
+        os.close(self._descriptor)
+
+
+_capture: TrafficCapture | None = None
+
+
+def configure_capture(path: str | None = None, sample_rate: float = CAPTURE_SAMPLE_RATE) -> None:
+    """Включает запись трафика или выключает ее, если путь не задан.
+
+    Вызывается до `fork`, чтобы рабочие процессы писали в общий файл.
+
+    Args:
+        path: Путь к файлу записи трафика.
+        sample_rate: Доля записываемых запросов (от 0 до 1).
+    """
+    global _capture  # noqa: PLW0603
+    if _capture is not None:
+        _capture.close()
+    _capture = TrafficCapture(path, sample_rate) if path is not None else None
+
+
+def capture_request(path: str, body: dict[str, 'Any']) -> None:
+    """Записывает запрос настроенной записью трафика, если она включена и маршрут записывается.
+
+    Ошибка записи не передается вызывающему: первая пишется в журнал, остальные считаются в `errors`.
+
+    Args:
+        path: Путь запроса без начального и конечного `/`.
+        body: Декодированное тело запроса.
+    """
+    if _capture is None or path not in CAPTURED_PATHS:
+        return
+
+    try:
+        _capture.record(path, body)
+    except Exception:
+        if not _capture.errors:
+            logger.exception('Traffic capture failed, further errors are only counted')
+        _capture.errors += 1
@@ -1,25 +1,200 @@
 """Модуль для обработки аргументов командной строки.
 
 Этот модуль предоставляет функции для разбора параметров командной строки,
-используемых при запуске сервера скоринга.
+используемых при запуске сервера скоринга и пакетного расчета скоринга.
 """
 
 from argparse import ArgumentParser
 from collections import namedtuple
 
-ServerConfig = namedtuple('ServerConfig', ['port', 'log_file'])
+from scoring_api.constants import ACCESS_LOG_SAMPLE_RATE, CAPTURE_SAMPLE_RATE, SLOW_REQUEST_BUFFER_SIZE
+
+ServerConfig = namedtuple(
+    'ServerConfig',
+    [
+        'port',
+        'log_file',
+        'scoring_config',
+        'workers',
+        'rate_limit',
+        'rate_burst',
+        'log_sample_rate',
+        'server_timing',
+        'profile_dir',
+        'slow_request_ms',
+        'slow_request_buffer',
+        'storage',
+        'capture_file',
+        'capture_sample_rate',
+    ],
+    defaults=[
+        None,
+        1,
+        None,
+        None,
+        ACCESS_LOG_SAMPLE_RATE,
+        False,
+        None,
+        None,
+        SLOW_REQUEST_BUFFER_SIZE,
+        'memcached',
+        None,
+        CAPTURE_SAMPLE_RATE,
+    ],
+)
+BulkConfig = namedtuple(
+    'BulkConfig',
+    [
+        'input_file',
+        'output_file',
+        'input_format',
+        'workers',
+        'chunk_size',
+        'populate_cache',
+        'log_file',
+        'scoring_config',
+        'account',
+    ],
+    defaults=[None, None],
+)
+
+BULK_INPUT_FORMATS = ('csv', 'ndjson')
+STORAGE_BACKENDS = ('memcached', 'memory')
 
 
 def parse_arguments() -> ServerConfig:
     """Разбор аргументов командной строки.
 
     Returns:
-        Разобранный порт и файл журнала.
+        Разобранный порт, файл журнала, файл конфигурации моделей скоринга, количество рабочих процессов
+        лимит частоты запросов, доля запросов, тело которых пишется в журнал доступа, признак
+        измерения этапов запросов, каталог для файлов профилей, порог и размер буфера журнала медленных запросов,
+        хранилище, файл записи трафика и доля записываемых запросов.
     """
     parser = ArgumentParser(description='Scoring API Server')
     parser.add_argument('-p', '--port', type=int, default=8080, help='Port to run the server on (default: 8080)')
     parser.add_argument('-l', '--log', type=str, default=None, help='Path to the log file (default: stdout)')
+    parser.add_argument('-s', '--scoring-config', type=str, default=None, help='Path to the scoring models JSON config')
+    parser.add_argument('-w', '--workers', type=int, default=1, help='Number of worker processes (default: 1)')
+    parser.add_argument(
+        '--storage',
+        choices=STORAGE_BACKENDS,
+        default='memcached',
+        help='Storage backend; `memory` keeps data in each worker process (default: memcached)',
+    )
+    parser.add_argument(
+        '--rate-limit', type=float, default=None, help='Requests per second per account and login (default: no limit)'
+    )
+    parser.add_argument(
+        '--rate-burst', type=int, default=None, help='Requests allowed in a burst (default: the rate limit)'
+    )
+    parser.add_argument(
+        '--log-sample-rate',
+        type=float,
+        default=ACCESS_LOG_SAMPLE_RATE,
+        help=f'Share of requests whose body is written to the access log (default: {ACCESS_LOG_SAMPLE_RATE})',
+    )
+    parser.add_argument(
+        '--server-timing', action='store_true', help='Measure request phases and return them in Server-Timing'
+    )
+    parser.add_argument(
+        '--profile-dir', type=str, default=None, help='Directory for on-demand profiles (default: system temp dir)'
+    )
+    parser.add_argument(
+        '--slow-request-ms',
+        type=float,
+        default=None,
+        help='Log requests slower than this many milliseconds with their storage calls (default: off)',
+    )
+    parser.add_argument(
+        '--slow-request-buffer',
+        type=int,
+        default=SLOW_REQUEST_BUFFER_SIZE,
+        help=f'Slow requests kept in memory for GET /slow_requests (default: {SLOW_REQUEST_BUFFER_SIZE})',
+    )
+    parser.add_argument(
+        '--capture-file', type=str, default=None, help='Append method requests to this file for replay (default: off)'
+    )
+    parser.add_argument(
+        '--capture-sample-rate',
+        type=float,
+        default=CAPTURE_SAMPLE_RATE,
+        help=f'Share of requests written to the capture file (default: {CAPTURE_SAMPLE_RATE})',
+    )
 
     args = parser.parse_args()
 
-    return ServerConfig(args.port, args.log)
+    if args.workers < 1:
+        parser.error('--workers must be a positive integer')
+    if args.rate_limit is not None and args.rate_limit <= 0:
+        parser.error('--rate-limit must be positive')
+    if args.rate_burst is not None and args.rate_burst < 1:
+        parser.error('--rate-burst must be a positive integer')
+    if not 0 <= args.log_sample_rate <= 1:
+        parser.error('--log-sample-rate must be between 0 and 1')
+    if args.slow_request_ms is not None and args.slow_request_ms < 0:
+        parser.error('--slow-request-ms must not be negative')
+    if args.slow_request_buffer < 1:
+        parser.error('--slow-request-buffer must be a positive integer')
+    if not 0 < args.capture_sample_rate <= 1:
+        parser.error('--capture-sample-rate must be greater than 0 and at most 1')
+
+    return ServerConfig(
+        args.port,
+        args.log,
+        args.scoring_config,
+        args.workers,
+        args.rate_limit,
+        args.rate_burst,
+        args.log_sample_rate,
+        args.server_timing,
+        args.profile_dir,
+        args.slow_request_ms,
+        args.slow_request_buffer,
+        args.storage,
+        args.capture_file,
+        args.capture_sample_rate,
+    )
+
+
+def parse_bulk_arguments() -> BulkConfig:
+    """Разбор аргументов командной строки для пакетного расчета скоринга.
+
+    Формат входного файла по умолчанию определяется по расширению: `.csv` - CSV, иначе NDJSON.
+
+    Returns:
+        Конфигурация пакетного расчета.
+    """
+    parser = ArgumentParser(description='Scoring API bulk scoring')
+    parser.add_argument('input', type=str, help='Path to the input file (CSV or NDJSON)')
+    parser.add_argument('output', type=str, help='Path to the output NDJSON file')
+    parser.add_argument(
+        '-f', '--format', choices=BULK_INPUT_FORMATS, default=None, help='Input format (default: by extension)'
+    )
+    parser.add_argument('-w', '--workers', type=int, default=None, help='Number of worker processes (default: CPUs)')
+    parser.add_argument('-c', '--chunk-size', type=int, default=1000, help='Records per work unit (default: 1000)')
+    parser.add_argument('--populate-cache', action='store_true', help='Write computed scores to the `uid:` cache')
+    parser.add_argument('-l', '--log', type=str, default=None, help='Path to the log file (default: stdout)')
+    parser.add_argument('-s', '--scoring-config', type=str, default=None, help='Path to the scoring models JSON config')
+    parser.add_argument('-a', '--account', type=str, default=None, help='Partner account to select the scoring model')
+
+    args = parser.parse_args()
+
+    if args.workers is not None and args.workers < 1:
+        parser.error('--workers must be a positive integer')
+    if args.chunk_size < 1:
+        parser.error('--chunk-size must be a positive integer')
+
+    input_format = args.format or ('csv' if args.input.lower().endswith('.csv') else 'ndjson')
+
+    return BulkConfig(
+        args.input,
+        args.output,
+        input_format,
+        args.workers,
+        args.chunk_size,
+        args.populate_cache,
+        args.log,
+        args.scoring_config,
+        args.account,
+    )
@@ -14,6 +14,7 @@ class HTTPStatus(Enum):
     FORBIDDEN = 403, 'Forbidden'
     NOT_FOUND = 404, 'Not Found'
     INVALID_REQUEST = 422, 'Unprocessable Entity'
+    TOO_MANY_REQUESTS = 429, 'Too Many Requests'
     INTERNAL_ERROR = 500, 'Internal Server Error'
 
     def __new__(cls, code: int, message: str) -> 'HTTPStatus':
@@ -47,6 +48,33 @@ ADMIN_LOGIN = 'admin'
 ADMIN_SALT = '42'
 ADMIN_SCORE = 42
 
+AUTH_CACHE_SIZE = 10_000  # Количество запоминаемых успешных проверок токенов партнеров
+AUTH_CACHE_TTL_SECONDS = 300.0  # Время жизни запомненной проверки токена
+ADMIN_TOKEN_GRACE_SECONDS = 60.0  # Сколько секунд у границы часа принимаются токены администратора обоих часов
+
+LOG_QUEUE_SIZE = 10_000  # Максимальное количество записей журнала, ожидающих записи
+REQUEST_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)  # Секунды
+
+DEFAULT_PROFILE_DURATION_SECONDS = 30  # Длительность профиля по умолчанию
+MAX_PROFILE_DURATION_SECONDS = 300  # Максимальная длительность профиля
+PROFILE_SAMPLE_INTERVAL_SECONDS = 0.005  # Интервал между снимками стеков выборочного профиля
+
+ACCESS_LOG_SAMPLE_RATE = 0.01  # Доля запросов, для которых тело запроса пишется в журнал доступа
+SLOW_REQUEST_BUFFER_SIZE = 50  # Сколько медленных запросов хранится в памяти для просмотра
+CAPTURE_SAMPLE_RATE = 1.0  # Доля запросов, которые пишутся в файл записи трафика
+
+RATE_LIMIT_STRIPES = 64  # Количество полос таблицы лимитов (и блокировок)
+RATE_LIMIT_SLOTS_PER_STRIPE = 64  # Количество ведер токенов в полосе
+RATE_LIMIT_MAX_PROBES = 8  # Сколько ячеек полосы просматривается в поисках ведра
+
 PHONE_COUNTRY_CODE = 7
 PHONE_LENGTH = 11
 MAX_AGE = 70
+
+MAX_INTERESTS_PAGE_SIZE = 1000  # Максимальное количество клиентов на странице ответа `clients_interests`
+
+DEFAULT_TOP_INTERESTS_LIMIT = 10  # Размер топа интересов по умолчанию
+MAX_TOP_INTERESTS_LIMIT = 1000  # Максимальный размер топа интересов
+MAX_TOP_INTERESTS_CLIENTS = 100_000  # Максимальное количество разных клиентов в запросе `clients_interests_top`
+
+READ_LEGACY_SCORE_KEYS = True  # Читать ключи кэша оценок прежнего формата `uid:<md5>`, пока они не истекли
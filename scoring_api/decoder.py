@@ -0,0 +1,42 @@
+"""Декодирование тела HTTP-запроса API.
+
+Тело декодируется одним вызовом `json.loads` прямо из байтов, без промежуточной строки. Дальше запрос
+проверяется схемами полей `BaseRequest`: сгенерированные методы `validate` читают только объявленные поля,
+поэтому лишние ключи не обходятся, а некорректные типы отклоняются без преобразования значений.
+"""
+
+import json
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+class DecodeError(ValueError):
+    """Исключение, возникающее, если тело запроса не является JSON-объектом."""
+
+
+def decode_json_object(raw: bytes) -> dict[str, 'Any']:
+    """Декодирует тело запроса.
+
+    Args:
+        raw: Тело запроса.
+
+    Returns:
+        Декодированный JSON-объект.
+
+    Raises:
+        DecodeError: Если тело пустое, не является корректным JSON в UTF-8 или не является объектом.
+    """
+    if not raw:
+        raise DecodeError('Request body is empty')
+
+    try:
+        data = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError) as error:
+        raise DecodeError(f'Invalid JSON: {error}') from error
+
+    if not isinstance(data, dict):
+        raise DecodeError('Request body must be a JSON object')
+
+    return data
@@ -4,10 +4,28 @@ from enum import Enum
 from typing import TYPE_CHECKING
 
 from scoring_api.auth import is_authenticated
-from scoring_api.constants import ADMIN_SCORE, HTTPStatus
+from scoring_api.constants import (
+    ADMIN_SCORE,
+    DEFAULT_PROFILE_DURATION_SECONDS,
+    DEFAULT_TOP_INTERESTS_LIMIT,
+    HTTPStatus,
+    MAX_INTERESTS_PAGE_SIZE,
+)
+from scoring_api.interests import get_top_interests, unique_client_ids
+from scoring_api.pagination import decode_cursor, encode_cursor, request_fingerprint
+from scoring_api.profiling import get_profiling_session, ProfileMode, ProfilingError
+from scoring_api.ratelimit import allow_request
 from scoring_api.requests.exceptions import ValidationError
-from scoring_api.requests.requests import ClientsInterestsRequest, MethodRequest, OnlineScoreRequest
+from scoring_api.requests.requests import (
+    ClientsInterestsRequest,
+    ClientsInterestsTopRequest,
+    MethodRequest,
+    OnlineScoreRequest,
+    ProfileRequest,
+)
+from scoring_api.rules import get_scoring_model
 from scoring_api.scoring import get_interests, get_score
+from scoring_api.timing import phase
 
 if TYPE_CHECKING:
     from typing import Any
@@ -20,6 +38,15 @@ class MethodName(str, Enum):
 
     ONLINE_SCORE = 'online_score'
     CLIENTS_INTERESTS = 'clients_interests'
+    CLIENTS_INTERESTS_TOP = 'clients_interests_top'
+
+
+class ProfileAction(str, Enum):
+    """Действия маршрута `/profile`."""
+
+    START = 'start'
+    STOP = 'stop'
+    STATUS = 'status'
 
 
 def handle_online_score(
@@ -39,30 +66,23 @@ def handle_online_score(
     Raises:
         ValidationError: Если запрос содержит ошибки или не переданы обязательные пары полей.
     """
-    score_request = OnlineScoreRequest(data)
+    with phase('arguments'):
+        score_request = OnlineScoreRequest(data)
+        valid = score_request.is_valid()
 
-    if not score_request.is_valid():
-        raise ValidationError([{k: v for k, v in score_request.errors.items()}])
-
-    required_pairs = [('phone', 'email'), ('first_name', 'last_name'), ('gender', 'birthday')]
+    if not valid:
+        raise ValidationError([score_request.errors])
 
     if not req.is_admin:
-        is_valid_pair_present = any(
-            score_request.validated_data.get(a) is not None and score_request.validated_data.get(b) is not None
-            for a, b in required_pairs
-        )
-
-        if not is_valid_pair_present:
-            raise ValidationError(
-                [
-                    f'At least one of the following required field pairs must be provided: '
-                    f'{", ".join(str(pair) for pair in required_pairs)}'
-                ]
-            )
+        score_request.validate_required_pairs()
 
     ctx['has'] = [field for field, value in score_request.validated_data.items() if value is not None]
 
-    score = ADMIN_SCORE if req.is_admin else get_score(storage, **score_request.validated_data)
+    if req.is_admin:
+        return {'score': ADMIN_SCORE}
+
+    model = get_scoring_model(req.validated_data.get('account'))
+    score = get_score(storage, model=model, cache_policy=model.cache_policy, **score_request.validated_data)
 
     return {'score': score}
 
@@ -72,6 +92,10 @@ def handle_clients_interests(
 ) -> dict[str, list[str]]:
     """Обрабатывает метод `clients_interests`.
 
+    Повторяющиеся идентификаторы учитываются один раз. Ответ содержит не больше `page_size` клиентов.
+    Если в запросе остались необработанные идентификаторы,
+    курсор следующей страницы сохраняется в `ctx['next_cursor']`, а из хранилища читается только текущая страница.
+
     Args:
         data: Аргументы метода.
         ctx: Контекст запроса.
@@ -83,19 +107,67 @@ def handle_clients_interests(
     Raises:
         ValidationError: Если переданы некорректные данные.
     """
-    interests_request = ClientsInterestsRequest(data)
+    with phase('arguments'):
+        interests_request = ClientsInterestsRequest(data)
+        valid = interests_request.is_valid()
 
-    if not interests_request.is_valid():
+    if not valid:
         raise ValidationError(', '.join(f'{k}: {v}' for k, v in interests_request.errors.items()))
 
-    client_ids = interests_request.validated_data['client_ids']
-    ctx['nclients'] = len(client_ids)
+    client_ids = unique_client_ids(interests_request.validated_data['client_ids'])
+    date = interests_request.validated_data.get('date')
+    cursor = interests_request.validated_data.get('cursor')
+    page_size = interests_request.validated_data.get('page_size', MAX_INTERESTS_PAGE_SIZE)
+
+    offset = 0
+    fingerprint = b''
+    if cursor or len(client_ids) > page_size:
+        fingerprint = request_fingerprint(client_ids, date)
+    if cursor:
+        offset = decode_cursor(cursor, fingerprint, len(client_ids))
 
-    interests = get_interests(storage, client_ids)
+    page = client_ids[offset : offset + page_size]
+    ctx['nclients'] = len(page)
+    if offset + page_size < len(client_ids):
+        ctx['next_cursor'] = encode_cursor(offset + page_size, fingerprint)
+
+    interests = get_interests(storage, page, date)
 
     return interests
 
 
+def handle_clients_interests_top(
+    data: dict[str, 'Any'], ctx: dict[str, 'Any'], storage: 'StorageInterface'
+) -> dict[str, 'Any']:
+    """Обрабатывает метод `clients_interests_top`.
+
+    Args:
+        data: Аргументы метода.
+        ctx: Контекст запроса.
+        storage: Экземпляр хранилища.
+
+    Returns:
+        Словарь с количеством клиентов и самыми частыми интересами.
+
+    Raises:
+        ValidationError: Если переданы некорректные данные.
+    """
+    with phase('arguments'):
+        top_request = ClientsInterestsTopRequest(data)
+        valid = top_request.is_valid()
+
+    if not valid:
+        raise ValidationError(', '.join(f'{k}: {v}' for k, v in top_request.errors.items()))
+
+    client_ids = top_request.validated_data['client_ids']
+    ctx['nclients'] = len(client_ids)
+
+    as_of = top_request.validated_data.get('date')
+    limit = top_request.validated_data.get('limit', DEFAULT_TOP_INTERESTS_LIMIT)
+
+    return get_top_interests(storage, client_ids, limit, as_of)
+
+
 def method_handler(
     request: dict[str, 'Any'], ctx: dict[str, 'Any'], storage: 'StorageInterface'
 ) -> tuple[dict[str, 'Any'], int]:
@@ -109,14 +181,25 @@ def method_handler(
     Returns:
         Кортеж с ответом и кодом состояния HTTP.
     """
-    req: MethodRequest = MethodRequest(request['body'])
+    with phase('validate'):
+        req: MethodRequest = MethodRequest(request['body'])
+        valid = req.is_valid()
 
-    if not req.is_valid():
+    if not valid:
         return {'error': req.errors}, HTTPStatus.INVALID_REQUEST.value
 
-    if not is_authenticated(req):
+    ctx['method'] = req.validated_data['method']
+    ctx['account'] = req.validated_data.get('account')
+
+    with phase('auth'):
+        authenticated = is_authenticated(req)
+
+    if not authenticated:
         return {'error': HTTPStatus.FORBIDDEN.message}, HTTPStatus.FORBIDDEN.value
 
+    if not allow_request(req.validated_data.get('account', ''), req.validated_data['login']):
+        return {'error': HTTPStatus.TOO_MANY_REQUESTS.message}, HTTPStatus.TOO_MANY_REQUESTS.value
+
     method = req.validated_data.get('method')
     arguments = req.validated_data.get('arguments', {})
 
@@ -129,6 +212,8 @@ def method_handler(
                 response = handle_online_score(req, arguments, ctx, storage)
             case MethodName.CLIENTS_INTERESTS:
                 response = handle_clients_interests(arguments, ctx, storage)
+            case MethodName.CLIENTS_INTERESTS_TOP:
+                response = handle_clients_interests_top(arguments, ctx, storage)
             case _:
                 status_code = HTTPStatus.NOT_FOUND.value
     except ValidationError as error:
@@ -136,3 +221,83 @@ def method_handler(
         status_code = HTTPStatus.INVALID_REQUEST.value
 
     return response, status_code
+
+
+def start_profile(arguments: dict[str, 'Any']) -> dict[str, 'Any']:
+    """Запускает профилирование процесса.
+
+    Args:
+        arguments: Аргументы запроса: `mode` (`sampling` по умолчанию или `deterministic`) и `duration` -
+            через сколько секунд профиль остановится сам.
+
+    Returns:
+        Состояние запущенного профиля.
+
+    Raises:
+        ValidationError: Если аргументы запроса недопустимы.
+        ProfilingError: Если профиль уже запущен.
+    """
+    profile_request = ProfileRequest(arguments)
+    if not profile_request.is_valid():
+        raise ValidationError(', '.join(f'{k}: {v}' for k, v in profile_request.errors.items()))
+
+    try:
+        mode = ProfileMode(profile_request.validated_data.get('mode') or ProfileMode.SAMPLING)
+    except ValueError as error:
+        raise ValidationError(
+            f'mode: Unknown profile mode, expected one of {[m.value for m in ProfileMode]}'
+        ) from error
+
+    session = get_profiling_session()
+    session.start(mode, profile_request.validated_data.get('duration') or DEFAULT_PROFILE_DURATION_SECONDS)
+    return session.status()
+
+
+def profile_handler(
+    request: dict[str, 'Any'],
+    ctx: dict[str, 'Any'],
+    storage: 'StorageInterface',  # noqa: ARG001
+) -> tuple[dict[str, 'Any'], int]:
+    """Управляет профилированием сервера. Доступно только администратору.
+
+    Метод запроса - действие `ProfileAction`: `start` запускает профиль (см. `start_profile`), `stop`
+    останавливает его и возвращает путь к файлу профиля, `status` возвращает состояние профиля.
+
+    Args:
+        request: Данные входящего запроса.
+        ctx: Контекст запроса.
+        storage: Экземпляр хранилища (не используется).
+
+    Returns:
+        Кортеж с ответом и кодом состояния HTTP.
+    """
+    req = MethodRequest(request['body'])
+
+    if not req.is_valid():
+        return {'error': req.errors}, HTTPStatus.INVALID_REQUEST.value
+
+    ctx['method'] = req.validated_data['method']
+    ctx['account'] = req.validated_data.get('account')
+
+    if not req.is_admin or not is_authenticated(req):
+        return {'error': HTTPStatus.FORBIDDEN.message}, HTTPStatus.FORBIDDEN.value
+
+    session = get_profiling_session()
+    status_code = HTTPStatus.OK.value
+    response: dict[str, Any] = {'error': HTTPStatus.NOT_FOUND.message}
+
+    try:
+        match req.validated_data['method']:
+            case ProfileAction.START:
+                response = start_profile(req.validated_data.get('arguments') or {})
+            case ProfileAction.STOP:
+                response = {'output': session.stop()}
+            case ProfileAction.STATUS:
+                response = session.status()
+            case _:
+                status_code = HTTPStatus.NOT_FOUND.value
+    except (ValidationError, ProfilingError) as error:
+        response = {'error': str(error)}
+        status_code = HTTPStatus.INVALID_REQUEST.value
+
+    return response, status_code
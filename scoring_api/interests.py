@@ -0,0 +1,318 @@
+"""Хранение интересов клиентов с разбиением по дням.
+
+Интересы клиента на дату хранятся в отдельных корзинах `i:<cid>:<YYYYMMDD>`. Список дат, для которых
+у клиента есть корзины, хранится в ключе индекса `ix:<cid>` (порядковые номера дней через запятую),
+а в памяти процесса - в виде отсортированного массива `array('I')`. Интересы на дату - это содержимое
+последней корзины не позже этой даты. Благодаря индексу запрос на дату читает ровно нужные корзины
+одним пакетным обращением к хранилищу (и еще одним - за недостающими записями индекса), не перебирая историю.
+
+Недатированные интересы по-прежнему хранятся в ключе `i:<cid>`.
+
+Идентификаторы клиентов передаются массивом `array('q')` (см. `ClientIDsField`). Ключи хранилища
+для всех клиентов формируются одним проходом, а каждый идентификатор преобразуется в строку один раз.
+"""
+
+import datetime
+import json
+import logging
+import time
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from heapq import nsmallest
+from sys import intern
+from typing import TYPE_CHECKING
+
+from scoring_api.storage.constants import NO_EXPIRATION
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from typing import Any
+
+    from scoring_api.storage.interface import StorageInterface
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_TTL_SECONDS = 60.0  # Через сколько запись индекса в памяти перечитывается из хранилища
+DEFAULT_INDEX_MAX_CLIENTS = 100_000  # Максимальное количество клиентов в индексе в памяти
+DEFAULT_TOP_INTERESTS_CHUNK_SIZE = 1000  # Количество клиентов в одном пакетном чтении `get_top_interests`
+
+INTERESTS_KEY_PREFIX = 'i:'
+
+
+def interests_key(cid: int) -> str:
+    """Возвращает ключ недатированных интересов клиента."""
+    return f'{INTERESTS_KEY_PREFIX}{cid}'
+
+
+def unique_client_ids(client_ids: 'Iterable[int]') -> 'array[int]':
+    """Удаляет повторы идентификаторов клиентов, сохраняя порядок первого появления.
+
+    Args:
+        client_ids: Идентификаторы клиентов.
+
+    Returns:
+        Массив уникальных идентификаторов.
+    """
+    return array('q', dict.fromkeys(client_ids))
+
+
+def bucket_key(cid: int, day: int) -> str:
+    """Возвращает ключ корзины интересов клиента за день.
+
+    Args:
+        cid: Идентификатор клиента.
+        day: Порядковый номер дня (`datetime.date.toordinal()`).
+    """
+    return f'i:{cid}:{datetime.date.fromordinal(day):%Y%m%d}'
+
+
+def index_key(cid: int) -> str:
+    """Возвращает ключ индекса корзин клиента."""
+    return f'ix:{cid}'
+
+
+def _parse_index(cid: int, value: str | None) -> 'array[int]':
+    """Разбирает сохраненный индекс корзин клиента.
+
+    Поврежденный индекс записывается в журнал и считается отсутствующим, как и ненайденный ключ,
+    чтобы он не прерывал запрос по остальным клиентам.
+    """
+    if not value:
+        return array('I')
+    try:
+        return array('I', sorted(map(int, value.split(','))))
+    except (ValueError, OverflowError):
+        logger.warning('Corrupted interests index %s: %.100r', index_key(cid), value)
+        return array('I')
+
+
+def _last_day(days: 'array[int]', day: int) -> int | None:
+    """Возвращает последний день из отсортированных `days` не позже `day` или None, если такого нет."""
+    position = bisect_right(days, day)
+    return days[position - 1] if position else None
+
+
+class InterestsIndex:
+    """Индекс корзин интересов клиентов в памяти процесса.
+
+    Записи индекса перечитываются из хранилища по истечении `ttl`, чтобы корзины,
+    добавленные другими процессами, становились видны. Размер индекса ограничен.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_INDEX_TTL_SECONDS, max_clients: int = DEFAULT_INDEX_MAX_CLIENTS) -> None:
+        """Создает пустой индекс.
+
+        Args:
+            ttl: Время жизни записи индекса в памяти, в секундах.
+            max_clients: Максимальное количество клиентов в индексе.
+        """
+        self.ttl = ttl
+        self.max_clients = max_clients
+        self._days: dict[int, tuple[float, array[int]]] = {}
+
+    def __len__(self) -> int:
+        """Количество клиентов в индексе."""
+        return len(self._days)
+
+    def load(self, storage: 'StorageInterface', client_ids: 'Iterable[int]') -> dict[int, 'array[int]']:
+        """Загружает из хранилища отсутствующие или устаревшие записи индекса одним обращением.
+
+        Записи возвращаются вызывающему, а не читаются затем из индекса, поэтому они верны, даже если
+        клиентов больше `max_clients`. Загруженные записи не вытесняют друг друга: если их больше
+        `max_clients`, в индексе в памяти сохраняются только первые из них.
+
+        Args:
+            storage: Экземпляр хранилища.
+            client_ids: Идентификаторы клиентов.
+
+        Returns:
+            Отсортированные дни корзин по идентификаторам клиентов.
+        """
+        now = time.monotonic()
+        days: dict[int, array[int]] = {}
+        missing = []
+        for cid in client_ids:
+            entry = self._days.get(cid)
+            if entry is not None and now - entry[0] < self.ttl:
+                days[cid] = entry[1]
+            else:
+                missing.append(cid)
+        if not missing:
+            return days
+
+        values = storage.get_many([index_key(cid) for cid in missing])
+        for position, cid in enumerate(missing):
+            days[cid] = _parse_index(cid, values.get(index_key(cid)))
+            if position < self.max_clients:
+                self._put(cid, days[cid], now)
+        return days
+
+    def add(self, storage: 'StorageInterface', cid: int, day: int) -> None:
+        """Добавляет корзину клиента в индекс в памяти и в хранилище.
+
+        Args:
+            storage: Экземпляр хранилища.
+            cid: Идентификатор клиента.
+            day: Порядковый номер дня корзины.
+        """
+        days = _parse_index(cid, storage.get(index_key(cid)))
+        position = bisect_right(days, day)
+
+        if not position or days[position - 1] != day:
+            days.insert(position, day)
+            storage.cache_set(index_key(cid), ','.join(map(str, days)), NO_EXPIRATION)
+
+        self._put(cid, days, time.monotonic())
+
+    def _put(self, cid: int, days: 'array[int]', loaded_at: float) -> None:
+        """Сохраняет запись индекса, вытесняя самую старую при переполнении."""
+        self._days.pop(cid, None)
+        if len(self._days) >= self.max_clients:
+            del self._days[next(iter(self._days))]
+        self._days[cid] = (loaded_at, days)
+
+
+_index = InterestsIndex()
+
+
+def record_interests(
+    storage: 'StorageInterface',
+    cid: int,
+    date: datetime.date,
+    interests: list[str],
+    index: InterestsIndex = _index,
+) -> None:
+    """Сохраняет интересы клиента на дату.
+
+    Индекс в хранилище обновляется чтением и записью, поэтому запись интересов одного клиента
+    должна выполняться одним процессом.
+
+    Args:
+        storage: Экземпляр хранилища.
+        cid: Идентификатор клиента.
+        date: Дата, на которую действительны интересы.
+        interests: Интересы клиента.
+        index: Индекс корзин.
+    """
+    day = date.toordinal()
+    storage.cache_set(bucket_key(cid, day), json.dumps(interests), NO_EXPIRATION)
+    index.add(storage, cid, day)
+
+
+def get_current_interests(storage: 'StorageInterface', client_ids: 'Sequence[int]') -> dict[str, list[str]]:
+    """Возвращает текущие (недатированные) интересы клиентов одним пакетным обращением к хранилищу.
+
+    Args:
+        storage: Экземпляр хранилища.
+        client_ids: Идентификаторы клиентов.
+
+    Returns:
+        Интересы по идентификаторам клиентов. Если интересы не сохранены, список пуст.
+
+    Raises:
+        ConnectionError: Если хранилище недоступно.
+    """
+    ids = list(map(str, client_ids))
+    keys = [INTERESTS_KEY_PREFIX + cid for cid in ids]
+    values = storage.get_many(keys)
+
+    loads = json.loads
+    return {cid: loads(data) if (data := values.get(key)) else [] for cid, key in zip(ids, keys, strict=True)}
+
+
+def get_interests_as_of(
+    storage: 'StorageInterface',
+    client_ids: 'Sequence[int]',
+    date: datetime.date,
+    index: InterestsIndex = _index,
+) -> dict[str, list[str]]:
+    """Возвращает интересы клиентов на дату.
+
+    Args:
+        storage: Экземпляр хранилища.
+        client_ids: Идентификаторы клиентов.
+        date: Дата, на которую нужны интересы.
+        index: Индекс корзин.
+
+    Returns:
+        Интересы по идентификаторам клиентов. Если корзин не позже даты нет, список пуст.
+
+    Raises:
+        ConnectionError: Если хранилище недоступно.
+    """
+    values = _read_buckets(storage, client_ids, date, index)
+    return {str(cid): json.loads(data) if (data := values.get(cid)) else [] for cid in client_ids}
+
+
+def get_top_interests(
+    storage: 'StorageInterface',
+    client_ids: 'Sequence[int]',
+    limit: int,
+    date: datetime.date | None = None,
+    index: InterestsIndex = _index,
+    chunk_size: int = DEFAULT_TOP_INTERESTS_CHUNK_SIZE,
+) -> dict[str, 'Any']:
+    """Возвращает самые частые интересы группы клиентов.
+
+    Интересы читаются пакетными обращениями к хранилищу по `chunk_size` клиентов, а счетчик
+    накапливается по всем частям, поэтому топ точный для любого числа клиентов. Одинаковые сохраненные
+    списки разбираются один раз, а строки интересов интернируются, поэтому счетчик хранит
+    по одному объекту на интерес независимо от числа клиентов.
+
+    Args:
+        storage: Экземпляр хранилища.
+        client_ids: Идентификаторы клиентов. Повторы учитываются один раз.
+        limit: Количество интересов в ответе.
+        date: Дата, на которую нужны интересы. Если нет, используются текущие интересы.
+        index: Индекс корзин.
+        chunk_size: Количество клиентов в одном пакетном чтении.
+
+    Returns:
+        Количество клиентов `clients` и список `top` пар `[интерес, число клиентов]`,
+        упорядоченный по убыванию числа клиентов, а при равенстве - по интересу.
+
+    Raises:
+        ConnectionError: Если хранилище недоступно.
+    """
+    unique_ids = list(dict.fromkeys(client_ids))
+    raw_lists: Counter[str] = Counter()
+    for start in range(0, len(unique_ids), chunk_size):
+        chunk = unique_ids[start : start + chunk_size]
+        if date is None:
+            values = storage.get_many([f'{INTERESTS_KEY_PREFIX}{cid}' for cid in chunk])
+        else:
+            values = {str(cid): data for cid, data in _read_buckets(storage, chunk, date, index).items()}
+        raw_lists.update(data for data in values.values() if data)
+
+    counts: Counter[str] = Counter()
+    for data, clients in raw_lists.items():
+        for interest in set(json.loads(data)):
+            counts[intern(interest)] += clients
+
+    top = nsmallest(limit, counts.items(), key=lambda item: (-item[1], item[0]))
+    return {'clients': len(unique_ids), 'top': [[interest, clients] for interest, clients in top]}
+
+
+def _read_buckets(
+    storage: 'StorageInterface',
+    client_ids: 'Iterable[int]',
+    date: datetime.date,
+    index: InterestsIndex,
+) -> dict[int, str]:
+    """Читает корзины интересов клиентов на дату одним пакетным обращением.
+
+    Returns:
+        Неразобранные списки интересов по идентификаторам клиентов, для которых они найдены.
+    """
+    days = index.load(storage, client_ids)
+
+    day = date.toordinal()
+    keys: dict[int, str] = {}
+    for cid, client_days in days.items():
+        bucket_day = _last_day(client_days, day)
+        if bucket_day is not None:
+            keys[cid] = bucket_key(cid, bucket_day)
+
+    values = storage.get_many(list(keys.values())) if keys else {}
+    return {cid: values[key] for cid, key in keys.items() if key in values}
@@ -0,0 +1,83 @@
+"""Формирование ключей кэша для рассчитанных оценок.
+
+Ключи имеют версионированное пространство имен `<namespace>:v2:`. Идентификатор пользователя хэшируется
+BLAKE2b и кодируется в URL-safe base64 без выравнивания, что дешевле и короче прежнего `md5(...).hexdigest()`.
+Ключи прежнего формата `uid:<md5>` формирует `legacy_score_key`: они читаются как запасной вариант,
+пока не истечет время жизни записей, созданных старой версией сервиса.
+"""
+
+import binascii
+import hashlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import datetime
+
+SCORE_KEY_NAMESPACE = 'uid'
+SCORE_KEY_VERSION = 'v2'
+
+_DIGEST_SIZE = 15  # 120 бит, кратно 3 байтам - base64 без символов выравнивания
+_FIELD_SEPARATOR = '\x1f'  # Разделитель частей ключа, чтобы ('ab', '') и ('a', 'b') не совпадали
+
+_URLSAFE_TRANSLATION = bytes.maketrans(b'+/', b'-_')
+
+_blake2b = hashlib.blake2b
+_b2a_base64 = binascii.b2a_base64
+
+
+def score_key(
+    first_name: str | None,
+    last_name: str | None,
+    phone: str | int | None,
+    birthday: 'datetime.date | None',
+    namespace: str = SCORE_KEY_NAMESPACE,
+) -> str:
+    """Формирует ключ кэша оценки пользователя.
+
+    Args:
+        first_name: Имя пользователя.
+        last_name: Фамилия пользователя.
+        phone: Номер телефона пользователя.
+        birthday: День рождения пользователя.
+        namespace: Пространство имен ключа.
+
+    Returns:
+        Ключ вида `<namespace>:v2:<digest>`.
+    """
+    raw = (
+        f'{first_name or ""}{_FIELD_SEPARATOR}{last_name or ""}{_FIELD_SEPARATOR}'
+        f'{"" if phone is None else phone}{_FIELD_SEPARATOR}{birthday.isoformat() if birthday else ""}'
+    )
+    digest = _blake2b(raw.encode('utf-8'), digest_size=_DIGEST_SIZE).digest()
+    encoded = _b2a_base64(digest, newline=False).translate(_URLSAFE_TRANSLATION).decode('ascii')
+
+    return f'{namespace}:{SCORE_KEY_VERSION}:{encoded}'
+
+
+def legacy_score_key(
+    first_name: str | None,
+    last_name: str | None,
+    phone: str | int | None,
+    birthday: 'datetime.date | None',
+) -> str:
+    """Формирует ключ кэша прежнего формата.
+
+    Повторяет исходный алгоритм вместе с его особенностью: отсутствующий телефон
+    превращается в строку `'None'`. Используется только для чтения.
+
+    Args:
+        first_name: Имя пользователя.
+        last_name: Фамилия пользователя.
+        phone: Номер телефона пользователя.
+        birthday: День рождения пользователя.
+
+    Returns:
+        Ключ вида `uid:<md5>`.
+    """
+    key_parts: list[str] = [
+        first_name or '',
+        last_name or '',
+        str(phone) or '',
+        birthday.strftime('%Y%m%d') if birthday else '',
+    ]
+    return 'uid:' + hashlib.md5(''.join(key_parts).encode('utf-8')).hexdigest()
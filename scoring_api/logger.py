@@ -1,20 +1,193 @@
 """Модуль настройки ведения журнала.
 
-Этот модуль предоставляет функцию для настройки параметров ведения журнала для приложения.
+Записи журнала не пишутся в файл в потоке, обрабатывающем запрос: корневой логгер получает
+`BoundedQueueHandler`, который только кладет запись в ограниченную очередь, а форматирует и пишет их
+фоновый `QueueListener`. Сообщение форматируется в фоновом потоке, поэтому аргументы записи (`%s`)
+не должны изменяться после вызова логгера.
+
+Если очередь заполнена, запрос не ждет: запись отбрасывается согласно `OverflowPolicy`, а количество
+отброшенных записей сообщается в журнал, как только в очереди появляется место.
+
+Перед `fork` фоновый поток дописывает очередь и останавливается, чтобы процесс копировался без работающих
+потоков и без недописанных записей. После `fork` дочерний процесс сразу запускает свой поток записи, а родитель -
+при следующей записи журнала: так несколько `fork` подряд (рабочие процессы сервера) не запускают и не
+останавливают поток между ними, а Python не предупреждает о `fork` многопоточного процесса.
 """
 
+import atexit
+import contextlib
 import logging
+import os
+import queue
+import threading
+from enum import Enum
+from logging.handlers import QueueHandler, QueueListener
+
+from scoring_api.constants import LOG_QUEUE_SIZE
+
+LOG_FORMAT = '[%(asctime)s] %(levelname).1s %(message)s'
+LOG_DATE_FORMAT = '%Y.%m.%d %H:%M:%S'
+
+
+class OverflowPolicy(Enum):
+    """Что делать с записью журнала, если очередь заполнена."""
+
+    DROP_NEW = 'drop_new'  # Отбросить новую запись
+    DROP_OLDEST = 'drop_oldest'  # Отбросить самую старую запись в очереди и добавить новую
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Обработчик, который кладет записи в ограниченную очередь и никогда не ждет."""
+
+    def __init__(self, queue_size: int = LOG_QUEUE_SIZE, overflow: OverflowPolicy = OverflowPolicy.DROP_NEW) -> None:
+        """Создает обработчик с пустой очередью.
+
+        Args:
+            queue_size: Максимальное количество записей в очереди.
+            overflow: Политика при переполнении очереди.
+        """
+        self.records: queue.Queue[logging.LogRecord | None] = queue.Queue(queue_size)
+        super().__init__(self.records)
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Передает запись в очередь без форматирования: его выполняет фоновый поток."""
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Кладет запись в очередь, не дожидаясь свободного места."""
+        if _listener_paused:
+            _resume_listener()
+
+        if self.dropped and self._try_put(self._dropped_record()):
+            self.dropped = 0
+
+        if self._try_put(record):
+            return
+
+        if self.overflow is OverflowPolicy.DROP_OLDEST:
+            with contextlib.suppress(queue.Empty):
+                self.records.get_nowait()
+            if self._try_put(record):
+                self.dropped += 1
+                return
+
+        self.dropped += 1
+
+    def _try_put(self, record: logging.LogRecord) -> bool:
+        """Кладет запись в очередь, если в ней есть место."""
+        try:
+            self.records.put_nowait(record)
+        except queue.Full:
+            return False
+        return True
+
+    def _dropped_record(self) -> logging.LogRecord:
+        """Создает запись о количестве отброшенных записей."""
+        return logging.LogRecord(
+            __name__, logging.WARNING, __file__, 0, 'Log queue overflow: %d records dropped', (self.dropped,), None
+        )
+
+
+class _Listener(QueueListener):
+    """Фоновый поток записи журнала, который при остановке дожидается места в очереди."""
+
+    def __init__(self, records: 'queue.Queue[logging.LogRecord | None]', *handlers: logging.Handler) -> None:
+        """Создает поток записи журнала.
+
+        Args:
+            records: Очередь записей.
+            *handlers: Обработчики, которые пишут записи.
+        """
+        super().__init__(records, *handlers, respect_handler_level=True)
+        self.records = records
 
+    def enqueue_sentinel(self) -> None:
+        """Кладет в очередь признак остановки, дожидаясь свободного места."""
+        self.records.put(None)
 
-def configure_logger(log_file: str | None) -> None:
+
+_queue_handler: BoundedQueueHandler | None = None
+_listener: _Listener | None = None
+_listener_paused = False
+_listener_lock = threading.Lock()
+
+
+def configure_logger(
+    log_file: str | None,
+    queue_size: int = LOG_QUEUE_SIZE,
+    overflow: OverflowPolicy = OverflowPolicy.DROP_NEW,
+) -> None:
     """Настраивает параметры ведения журнала в приложении.
 
     Args:
         log_file: Путь к файлу журнала. Если нет, то журнал выводится в stdout.
+        queue_size: Максимальное количество записей, ожидающих записи в журнал.
+        overflow: Политика при переполнении очереди записей.
     """
-    logging.basicConfig(
-        filename=log_file,
-        level=logging.INFO,
-        format='[%(asctime)s] %(levelname).1s %(message)s',
-        datefmt='%Y.%m.%d %H:%M:%S',
-    )
+    global _queue_handler, _listener  # noqa: PLW0603
+
+    stop_logger()
+
+    target: logging.Handler = logging.FileHandler(log_file) if log_file else logging.StreamHandler()
+    target.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT))
+
+    _queue_handler = BoundedQueueHandler(queue_size, overflow)
+    _listener = _Listener(_queue_handler.records, target)
+    _listener.start()
+
+    root = logging.getLogger()
+    root.addHandler(_queue_handler)
+    root.setLevel(logging.INFO)
+
+
+def stop_logger() -> None:
+    """Дописывает записи из очереди в журнал и отключает очередь от корневого логгера."""
+    global _queue_handler, _listener  # noqa: PLW0603
+
+    _resume_listener()
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        if _queue_handler.dropped:
+            _queue_handler.records.put(_queue_handler._dropped_record())
+        _queue_handler = None
+
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def _pause_listener() -> None:
+    """Дописывает очередь и останавливает поток записи журнала перед `fork`."""
+    global _listener_paused  # noqa: PLW0603
+
+    with _listener_lock:
+        if _listener is not None and not _listener_paused:
+            _listener.stop()
+            _listener_paused = True
+
+
+def _resume_listener() -> None:
+    """Запускает поток записи журнала, остановленный перед `fork`."""
+    global _listener_paused  # noqa: PLW0603
+
+    with _listener_lock:
+        if _listener is not None and _listener_paused:
+            _listener.start()
+        _listener_paused = False
+
+
+def _reset_listener_lock() -> None:
+    """Создает новую блокировку в дочернем процессе и запускает его поток записи журнала."""
+    global _listener_lock  # noqa: PLW0603
+
+    _listener_lock = threading.Lock()
+    _resume_listener()
+
+
+os.register_at_fork(before=_pause_listener, after_in_child=_reset_listener_lock)
+atexit.register(stop_logger)
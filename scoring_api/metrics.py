@@ -0,0 +1,303 @@
+"""Метрики сервера в текстовом формате Prometheus.
+
+Модули объявляют метрики при импорте (`REGISTRY.counter`, `REGISTRY.gauge`, `REGISTRY.histogram`) с заранее
+известными значениями меток, поэтому каждый ряд метрики получает постоянный номер ячейки в таблице
+64-битных чисел. Запись метрики - это прибавление к одной ячейке под блокировкой процесса, без поиска
+по словарям меток и без межпроцессного взаимодействия.
+
+Для сервера с несколькими рабочими процессами `configure_metrics` до `fork` создает таблицу в разделяемой
+памяти, в которой у каждого процесса своя часть: процессы пишут только в свою часть, а `/metrics` суммирует
+части всех процессов. Без настройки таблица хранится в памяти процесса.
+"""
+
+import bisect
+import math
+import os
+import threading
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+type Labels = tuple[str, ...]
+
+
+class MetricsTable:
+    """Таблица значений метрик, разделенная на части по рабочим процессам."""
+
+    def __init__(self, size: int, workers: int = 1, shared: bool = False) -> None:
+        """Создает таблицу с нулевыми значениями.
+
+        Args:
+            size: Количество ячеек в части одного процесса.
+            workers: Количество рабочих процессов.
+            shared: Разместить таблицу в разделяемой памяти.
+        """
+        self.size = size
+        self.workers = workers
+        self._owner_pid = os.getpid()
+        self._memory = SharedMemory(create=True, size=max(1, size * workers) * 8) if shared else None
+        buffer = self._memory.buf if self._memory is not None else bytearray(max(1, size * workers) * 8)
+        buffer[:] = bytes(len(buffer))
+        self._values = memoryview(buffer).cast('d')
+        self._base = 0
+        self._lock = threading.Lock()
+
+    @property
+    def shared(self) -> bool:
+        """Размещена ли таблица в разделяемой памяти."""
+        return self._memory is not None
+
+    def set_worker(self, index: int) -> None:
+        """Выбирает часть таблицы, в которую пишет текущий процесс."""
+        self._base = index * self.size
+
+    def add(self, slot: int, amount: float) -> None:
+        """Прибавляет значение к ячейке части текущего процесса."""
+        with self._lock:
+            self._values[self._base + slot] += amount
+
+    def add_pair(self, first: int, second: int, amount: float) -> None:
+        """Прибавляет 1 к ячейке `first` и `amount` к ячейке `second` под одной блокировкой."""
+        base = self._base
+        with self._lock:
+            self._values[base + first] += 1
+            self._values[base + second] += amount
+
+    def totals(self) -> list[float]:
+        """Возвращает значения ячеек, просуммированные по всем процессам."""
+        values = self._values
+        return [math.fsum(values[slot :: self.size]) for slot in range(self.size)] if self.size else []
+
+    def own_values(self) -> list[float]:
+        """Возвращает значения части текущего процесса."""
+        return [float(value) for value in self._values[self._base : self._base + self.size]]
+
+    def close(self) -> None:
+        """Освобождает таблицу; процесс, создавший разделяемую память, удаляет ее."""
+        self._values.release()
+        if self._memory is not None:
+            self._memory.close()
+            if os.getpid() == self._owner_pid:
+                self._memory.unlink()
+
+
+class Metric:
+    """Метрика с фиксированным набором рядов (сочетаний значений меток)."""
+
+    type_name = ''
+    slots_per_series = 1
+
+    def __init__(
+        self, registry: 'MetricsRegistry', name: str, documentation: str, labels: 'Mapping[str, Sequence[str]]'
+    ) -> None:
+        """Объявляет метрику и занимает ячейки для всех ее рядов.
+
+        Args:
+            registry: Реестр метрик.
+            name: Имя метрики.
+            documentation: Описание метрики.
+            labels: Имена меток и их допустимые значения.
+        """
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self.series: list[Labels] = [()]
+        for values in labels.values():
+            self.series = [(*series, value) for series in self.series for value in values]
+        self.offset = registry.allocate(len(self.series) * self.slots_per_series)
+        self._slots = {series: self.offset + index * self.slots_per_series for index, series in enumerate(self.series)}
+
+    def slot(self, labels: Labels) -> int:
+        """Возвращает первую ячейку ряда.
+
+        Raises:
+            KeyError: Если значения меток не объявлены.
+        """
+        return self._slots[labels]
+
+    def render(self, values: list[float]) -> 'Iterable[str]':
+        """Возвращает строки метрики в текстовом формате Prometheus."""
+        yield f'# HELP {self.name} {self.documentation}'
+        yield f'# TYPE {self.name} {self.type_name}'
+        for series in self.series:
+            yield f'{self.name}{self._format_labels(series)} {_format_value(values[self._slots[series]])}'
+
+    def _format_labels(self, series: Labels, extra: str = '') -> str:
+        """Форматирует метки ряда."""
+        pairs = [f'{name}="{value}"' for name, value in zip(self.label_names, series, strict=True)]
+        if extra:
+            pairs.append(extra)
+        return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class Counter(Metric):
+    """Счетчик, который только увеличивается."""
+
+    type_name = 'counter'
+
+    def inc(self, labels: Labels = (), amount: float = 1.0) -> None:
+        """Увеличивает счетчик ряда."""
+        self.registry.table.add(self._slots[labels], amount)
+
+
+class Gauge(Metric):
+    """Значение, которое может увеличиваться и уменьшаться."""
+
+    type_name = 'gauge'
+
+    def inc(self, labels: Labels = (), amount: float = 1.0) -> None:
+        """Увеличивает значение ряда."""
+        self.registry.table.add(self._slots[labels], amount)
+
+    def dec(self, labels: Labels = (), amount: float = 1.0) -> None:
+        """Уменьшает значение ряда."""
+        self.registry.table.add(self._slots[labels], -amount)
+
+
+class Histogram(Metric):
+    """Гистограмма: количество наблюдений по корзинам и их сумма."""
+
+    type_name = 'histogram'
+
+    def __init__(
+        self,
+        registry: 'MetricsRegistry',
+        name: str,
+        documentation: str,
+        labels: 'Mapping[str, Sequence[str]]',
+        buckets: 'Sequence[float]',
+    ) -> None:
+        """Объявляет гистограмму.
+
+        Args:
+            registry: Реестр метрик.
+            name: Имя метрики.
+            documentation: Описание метрики.
+            labels: Имена меток и их допустимые значения.
+            buckets: Верхние границы корзин по возрастанию (корзина +Inf добавляется автоматически).
+        """
+        self.buckets = tuple(buckets)
+        self.slots_per_series = len(self.buckets) + 2  # Корзины, корзина +Inf и сумма
+        super().__init__(registry, name, documentation, labels)
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        """Добавляет наблюдение в ряд."""
+        first = self._slots[labels]
+        self.registry.table.add_pair(
+            first + bisect.bisect_left(self.buckets, value), first + self.slots_per_series - 1, value
+        )
+
+    def render(self, values: list[float]) -> 'Iterable[str]':
+        """Возвращает строки гистограммы в текстовом формате Prometheus (корзины накопительные)."""
+        yield f'# HELP {self.name} {self.documentation}'
+        yield f'# TYPE {self.name} {self.type_name}'
+        for series in self.series:
+            first = self._slots[series]
+            count = 0.0
+            for index, bound in enumerate((*self.buckets, math.inf)):
+                count += values[first + index]
+                le = '+Inf' if bound == math.inf else _format_value(bound)
+                yield f'{self.name}_bucket{self._format_labels(series, f'le="{le}"')} {_format_value(count)}'
+            labels = self._format_labels(series)
+            yield f'{self.name}_sum{labels} {_format_value(values[first + self.slots_per_series - 1])}'
+            yield f'{self.name}_count{labels} {_format_value(count)}'
+
+
+class MetricsRegistry:
+    """Реестр метрик и таблица их значений."""
+
+    def __init__(self) -> None:
+        """Создает пустой реестр с таблицей в памяти процесса."""
+        self.metrics: list[Metric] = []
+        self.size = 0
+        self.table = MetricsTable(0)
+
+    def allocate(self, slots: int) -> int:
+        """Занимает ячейки для новой метрики и возвращает номер первой из них.
+
+        Raises:
+            RuntimeError: Если таблица уже размещена в разделяемой памяти.
+        """
+        if self.table.shared:
+            raise RuntimeError('Metrics must be declared before configure_metrics()')
+
+        offset = self.size
+        self.size += slots
+        values = self.table.own_values()
+        self.table.close()
+        self.table = MetricsTable(self.size)
+        for slot, value in enumerate(values):
+            self.table.add(slot, value)
+        return offset
+
+    def counter(self, name: str, documentation: str, labels: 'Mapping[str, Sequence[str]] | None' = None) -> Counter:
+        """Объявляет счетчик."""
+        return self._register(Counter(self, name, documentation, labels or {}))
+
+    def gauge(self, name: str, documentation: str, labels: 'Mapping[str, Sequence[str]] | None' = None) -> Gauge:
+        """Объявляет изменяемое значение."""
+        return self._register(Gauge(self, name, documentation, labels or {}))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        buckets: 'Sequence[float]',
+        labels: 'Mapping[str, Sequence[str]] | None' = None,
+    ) -> Histogram:
+        """Объявляет гистограмму."""
+        return self._register(Histogram(self, name, documentation, labels or {}, buckets))
+
+    def configure(self, workers: int = 1, shared: bool = False) -> None:
+        """Создает новую пустую таблицу значений.
+
+        Args:
+            workers: Количество рабочих процессов.
+            shared: Разместить таблицу в разделяемой памяти.
+        """
+        self.table.close()
+        self.table = MetricsTable(self.size, workers, shared)
+
+    def render(self) -> str:
+        """Возвращает все метрики в текстовом формате Prometheus."""
+        values = self.table.totals()
+        return '\n'.join(line for metric in self.metrics for line in metric.render(values)) + '\n'
+
+    def _register[MetricType: Metric](self, metric: MetricType) -> MetricType:
+        """Добавляет метрику в реестр."""
+        self.metrics.append(metric)
+        return metric
+
+
+def _format_value(value: float) -> str:
+    """Форматирует значение метрики."""
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+REGISTRY = MetricsRegistry()
+
+
+def configure_metrics(workers: int = 1) -> None:
+    """Готовит таблицу метрик для сервера.
+
+    Вызывается до `fork`: для нескольких рабочих процессов таблица размещается в разделяемой памяти.
+
+    Args:
+        workers: Количество рабочих процессов.
+    """
+    REGISTRY.configure(workers, shared=workers > 1)
+
+
+def set_metrics_worker(index: int) -> None:
+    """Выбирает часть таблицы метрик, в которую пишет текущий рабочий процесс."""
+    REGISTRY.table.set_worker(index)
+
+
+def render_metrics() -> str:
+    """Возвращает метрики всех рабочих процессов в текстовом формате Prometheus."""
+    return REGISTRY.render()
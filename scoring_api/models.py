@@ -9,7 +9,7 @@ if TYPE_CHECKING:
     from scoring_api.constants import HTTPStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class HTTPErrorResponse:
     """Представляет собой стандартизированный ответ на ошибку HTTP."""
 
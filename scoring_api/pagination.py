@@ -0,0 +1,78 @@
+"""Курсоры постраничной выдачи для запросов с большим списком идентификаторов.
+
+Курсор не хранит состояния на сервере: клиент повторяет тот же запрос, передавая курсор из предыдущего
+ответа, и получает следующую страницу. Курсор содержит смещение следующей страницы и отпечаток запроса
+(BLAKE2b массива идентификаторов и даты), поэтому курсор от другого запроса отклоняется. Для клиента курсор
+непрозрачен: это URL-safe base64 без выравнивания.
+"""
+
+import base64
+import binascii
+import hashlib
+import struct
+from typing import TYPE_CHECKING
+
+from scoring_api.requests.exceptions import ValidationError
+
+if TYPE_CHECKING:
+    import datetime
+    from array import array
+
+_CURSOR_FORMAT = struct.Struct('>I8s')  # Смещение и 8 байт отпечатка запроса
+_CURSOR_LENGTH = 16  # Длина курсора в символах base64 (12 байт без выравнивания)
+
+
+def request_fingerprint(client_ids: 'array[int]', date: 'datetime.date | None') -> bytes:
+    """Вычисляет отпечаток запроса, к которому привязан курсор.
+
+    Args:
+        client_ids: Идентификаторы клиентов запроса.
+        date: Дата запроса.
+
+    Returns:
+        8 байт отпечатка.
+    """
+    fingerprint = hashlib.blake2b(client_ids.tobytes(), digest_size=8)
+    fingerprint.update(date.isoformat().encode('ascii') if date else b'')
+    return fingerprint.digest()
+
+
+def encode_cursor(offset: int, fingerprint: bytes) -> str:
+    """Формирует курсор следующей страницы.
+
+    Args:
+        offset: Смещение первого идентификатора следующей страницы.
+        fingerprint: Отпечаток запроса.
+
+    Returns:
+        Непрозрачный курсор.
+    """
+    return base64.urlsafe_b64encode(_CURSOR_FORMAT.pack(offset, fingerprint)).decode('ascii')
+
+
+def decode_cursor(cursor: str, fingerprint: bytes, total: int) -> int:
+    """Проверяет курсор и возвращает смещение страницы.
+
+    Args:
+        cursor: Курсор из предыдущего ответа.
+        fingerprint: Отпечаток текущего запроса.
+        total: Количество идентификаторов в запросе.
+
+    Returns:
+        Смещение первого идентификатора страницы.
+
+    Raises:
+        ValidationError: Если курсор поврежден, относится к другому запросу или выходит за пределы списка.
+    """
+    if len(cursor) != _CURSOR_LENGTH:
+        raise ValidationError('cursor: Invalid cursor')
+
+    try:
+        offset, cursor_fingerprint = _CURSOR_FORMAT.unpack(base64.urlsafe_b64decode(cursor))
+    except (binascii.Error, ValueError, struct.error) as error:
+        raise ValidationError('cursor: Invalid cursor') from error
+
+    if cursor_fingerprint != fingerprint or not 0 < offset < total:
+        raise ValidationError('cursor: Cursor does not match the request')
+
+    return int(offset)
@@ -0,0 +1,240 @@
+"""Профилирование работающего сервера по запросу.
+
+Профиль запускается и останавливается без перезапуска сервера: сигналами (`SIGUSR1` - выборочный профиль,
+`SIGUSR2` - детерминированный; повторный сигнал останавливает профиль) или методами `start`/`stop`/`status`
+маршрута `/profile`, доступного только администратору.
+
+Режимы:
+    - `deterministic` - `cProfile`, результат в формате pstats (`*.pstats`), открывается `snakeviz`,
+      `python -m pstats` или преобразуется во flamegraph (`flameprof`);
+    - `sampling` - фоновый поток раз в `PROFILE_SAMPLE_INTERVAL_SECONDS` снимает стеки всех потоков
+      и считает одинаковые стеки. Результат - свернутые стеки (`*.folded`) для `flamegraph.pl` или speedscope.
+      Накладные расходы почти не зависят от нагрузки.
+
+Профиль всегда ограничен по времени и останавливается сам, даже если его забыли остановить.
+Файл профиля пишется в каталог `configure_profiling` под именем с режимом, PID процесса и временем запуска,
+поэтому профили разных рабочих процессов не перезаписывают друг друга.
+"""
+
+import cProfile
+import datetime
+import logging
+import os
+import signal
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from scoring_api.constants import (
+    DEFAULT_PROFILE_DURATION_SECONDS,
+    MAX_PROFILE_DURATION_SECONDS,
+    PROFILE_SAMPLE_INTERVAL_SECONDS,
+)
+
+if TYPE_CHECKING:
+    from types import FrameType
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileMode(str, Enum):
+    """Режимы профилирования."""
+
+    DETERMINISTIC = 'deterministic'
+    SAMPLING = 'sampling'
+
+
+class ProfilingError(Exception):
+    """Исключение, возникающее при недопустимом действии с профилем."""
+
+
+def _frame_label(frame: 'FrameType') -> str:
+    """Возвращает подпись кадра стека для свернутых стеков."""
+    code = frame.f_code
+    return f'{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})'
+
+
+class StackSampler:
+    """Выборочный профилировщик: периодически снимает стеки всех потоков процесса."""
+
+    def __init__(self, interval: float = PROFILE_SAMPLE_INTERVAL_SECONDS) -> None:
+        """Создает остановленный профилировщик.
+
+        Args:
+            interval: Интервал между снимками стеков, в секундах.
+        """
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Запускает поток, снимающий стеки."""
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Останавливает поток, снимающий стеки."""
+        self._stopped.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def sample(self) -> None:
+        """Снимает стеки всех потоков, кроме своего."""
+        own_id = threading.get_ident()
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            labels = []
+            current: FrameType | None = frame
+            while current is not None:
+                labels.append(_frame_label(current))
+                current = current.f_back
+            self.stacks[';'.join(reversed(labels))] += 1
+
+    def write_folded(self, path: str) -> None:
+        """Пишет свернутые стеки: одна строка `кадр;кадр;... количество` на стек."""
+        with open(path, 'w', encoding='utf-8') as output:
+            output.writelines(f'{stack} {count}\n' for stack, count in self.stacks.most_common())
+
+    def _run(self) -> None:
+        """Снимает стеки, пока профилировщик не остановлен."""
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+
+class ProfilingSession:
+    """Текущий профиль процесса: не больше одного одновременно, с ограничением по времени."""
+
+    def __init__(self, output_dir: str | None = None) -> None:
+        """Создает сессию без активного профиля.
+
+        Args:
+            output_dir: Каталог для файлов профилей (по умолчанию временный каталог системы).
+        """
+        self.output_dir = output_dir or tempfile.gettempdir()
+        self.mode: ProfileMode | None = None
+        self.output = ''
+        self.deadline = 0.0
+        self._profiler: cProfile.Profile | None = None
+        self._sampler: StackSampler | None = None
+        self._timer: threading.Timer | None = None
+        self._lock = threading.RLock()  # Сигнал может прийти, пока основной поток держит блокировку
+
+    @property
+    def active(self) -> bool:
+        """Запущен ли профиль."""
+        return self.mode is not None
+
+    def start(self, mode: ProfileMode, duration: float = DEFAULT_PROFILE_DURATION_SECONDS) -> str:
+        """Запускает профиль.
+
+        Args:
+            mode: Режим профилирования.
+            duration: Через сколько секунд профиль остановится сам (не больше `MAX_PROFILE_DURATION_SECONDS`).
+
+        Returns:
+            Путь к файлу, в который будет записан профиль.
+
+        Raises:
+            ProfilingError: Если профиль уже запущен или длительность недопустима.
+        """
+        if not 0 < duration <= MAX_PROFILE_DURATION_SECONDS:
+            raise ProfilingError(f'Duration must be between 0 and {MAX_PROFILE_DURATION_SECONDS} seconds')
+
+        with self._lock:
+            if self.active:
+                raise ProfilingError('A profile is already running')
+
+            started = datetime.datetime.now().strftime('%Y%m%d-%H%M%S')
+            extension = 'pstats' if mode is ProfileMode.DETERMINISTIC else 'folded'
+            self.output = os.path.join(self.output_dir, f'{mode.value}-{os.getpid()}-{started}.{extension}')
+
+            if mode is ProfileMode.DETERMINISTIC:
+                self._profiler = cProfile.Profile()
+                self._profiler.enable()
+            else:
+                self._sampler = StackSampler()
+                self._sampler.start()
+
+            self.mode = mode
+            self.deadline = time.monotonic() + duration
+            self._timer = threading.Timer(duration, self.stop)
+            self._timer.daemon = True
+            self._timer.start()
+
+        logger.info('Started %s profile for %.0fs, output: %s', mode.value, duration, self.output)
+        return self.output
+
+    def stop(self) -> str | None:
+        """Останавливает профиль и записывает его в файл.
+
+        Returns:
+            Путь к файлу профиля или None, если профиль не был запущен.
+        """
+        with self._lock:
+            if not self.active:
+                return None
+
+            if self._timer is not None and self._timer is not threading.current_thread():
+                self._timer.cancel()
+
+            output = self.output
+            if self._profiler is not None:
+                self._profiler.disable()
+                self._profiler.dump_stats(output)
+            if self._sampler is not None:
+                self._sampler.stop()
+                self._sampler.write_folded(output)
+
+            self.mode, self.output = None, ''
+            self._profiler, self._sampler, self._timer = None, None, None
+
+        logger.info('Profile written to %s', output)
+        return output
+
+    def status(self) -> dict[str, str | float | None]:
+        """Возвращает режим текущего профиля, файл и оставшееся время."""
+        return {
+            'mode': self.mode.value if self.mode else None,
+            'output': self.output or None,
+            'remaining': round(max(0.0, self.deadline - time.monotonic()), 1) if self.active else None,
+        }
+
+
+_session = ProfilingSession()
+
+
+def configure_profiling(output_dir: str | None = None) -> None:
+    """Останавливает текущий профиль и задает каталог для файлов профилей."""
+    global _session  # noqa: PLW0603
+    _session.stop()
+    _session = ProfilingSession(output_dir)
+
+
+def get_profiling_session() -> ProfilingSession:
+    """Возвращает сессию профилирования процесса."""
+    return _session
+
+
+def _toggle(mode: ProfileMode) -> None:
+    """Запускает профиль в режиме `mode` или останавливает запущенный профиль."""
+    if _session.active:
+        _session.stop()
+    else:
+        _session.start(mode)
+
+
+def _handle_signal(signum: int, frame: 'FrameType | None') -> None:  # noqa: ARG001
+    """Запускает или останавливает профиль по сигналу `SIGUSR1` (выборочный) или `SIGUSR2` (детерминированный)."""
+    _toggle(ProfileMode.SAMPLING if signum == signal.SIGUSR1 else ProfileMode.DETERMINISTIC)
+
+
+def install_profiling_signals() -> None:
+    """Устанавливает обработчики сигналов профилирования."""
+    signal.signal(signal.SIGUSR1, _handle_signal)
+    signal.signal(signal.SIGUSR2, _handle_signal)
@@ -0,0 +1,157 @@
+"""Ограничение частоты запросов партнеров, общее для всех процессов сервера.
+
+Для каждой пары (`account`, `login`) хранится "ведро токенов": ведро вмещает `burst` токенов, пополняется
+со скоростью `rate` токенов в секунду, и каждый запрос забирает один токен. Ведра хранятся в таблице
+в разделяемой памяти (`multiprocessing.shared_memory`), поэтому рабочие процессы сервера, созданные `fork`,
+видят одни и те же ведра и лимит соблюдается суммарно, без сетевых обращений.
+
+Таблица разбита на полосы (stripes), у каждой полосы своя блокировка. Ключ попадает в полосу по хэшу
+и ищется внутри нее линейным пробированием, поэтому обновление ведра занимает одну блокировку
+и не мешает запросам других партнеров из других полос. Если свободной ячейки в пределах пробирования нет,
+вытесняется ведро, которое дольше всех не использовалось.
+
+Лимитер создается до `fork`, чтобы рабочие процессы унаследовали и разделяемую память, и блокировки.
+"""
+
+import hashlib
+import logging
+import math
+import multiprocessing
+import os
+import struct
+import time
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING
+
+from scoring_api.constants import (
+    RATE_LIMIT_MAX_PROBES,
+    RATE_LIMIT_SLOTS_PER_STRIPE,
+    RATE_LIMIT_STRIPES,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+_SLOT = struct.Struct('<Qdd')  # Хэш ключа (0 - свободная ячейка), токены, время последнего обновления
+
+
+def _key_hash(account: str, login: str) -> int:
+    """Возвращает ненулевой 64-битный хэш пары учетной записи и логина."""
+    digest = hashlib.blake2b(f'{account}\x1f{login}'.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'little') or 1
+
+
+class RateLimiter:
+    """Ограничитель частоты запросов на основе ведер токенов в разделяемой памяти."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        rate: float,
+        burst: int,
+        stripes: int = RATE_LIMIT_STRIPES,
+        slots_per_stripe: int = RATE_LIMIT_SLOTS_PER_STRIPE,
+        max_probes: int = RATE_LIMIT_MAX_PROBES,
+        clock: 'Callable[[], float]' = time.monotonic,
+    ) -> None:
+        """Создает таблицу ведер в разделяемой памяти.
+
+        Args:
+            rate: Скорость пополнения ведра, запросов в секунду.
+            burst: Вместимость ведра - сколько запросов можно сделать подряд.
+            stripes: Количество полос таблицы (и блокировок).
+            slots_per_stripe: Количество ячеек в полосе.
+            max_probes: Сколько ячеек полосы просматривается в поисках ключа.
+            clock: Источник монотонного времени, общего для процессов.
+        """
+        self.rate = rate
+        self.burst = float(burst)
+        self.stripes = stripes
+        self.slots_per_stripe = slots_per_stripe
+        self.max_probes = min(max_probes, slots_per_stripe)
+        self._clock = clock
+        self._owner_pid = os.getpid()
+
+        self._memory = SharedMemory(create=True, size=stripes * slots_per_stripe * _SLOT.size)
+        self._memory.buf[:] = bytes(len(self._memory.buf))
+        self._locks = [multiprocessing.Lock() for _ in range(stripes)]
+
+    def allow(self, account: str, login: str) -> bool:
+        """Забирает токен из ведра партнера.
+
+        Args:
+            account: Учетная запись партнера.
+            login: Логин пользователя.
+
+        Returns:
+            True, если запрос укладывается в лимит, иначе False.
+        """
+        key = _key_hash(account, login)
+        stripe, start = divmod(key % (self.stripes * self.slots_per_stripe), self.slots_per_stripe)
+        base = stripe * self.slots_per_stripe
+        buffer = self._memory.buf
+
+        with self._locks[stripe]:
+            now = self._clock()
+            victim_offset, victim_updated = -1, math.inf
+
+            for probe in range(self.max_probes):
+                offset = (base + (start + probe) % self.slots_per_stripe) * _SLOT.size
+                slot_key, tokens, updated = _SLOT.unpack_from(buffer, offset)
+
+                if slot_key == key:
+                    tokens = min(self.burst, tokens + (now - updated) * self.rate)
+                    allowed: bool = tokens >= 1.0
+                    _SLOT.pack_into(buffer, offset, key, tokens - 1.0 if allowed else tokens, now)
+                    return allowed
+
+                if slot_key == 0:
+                    victim_offset = offset
+                    break
+
+                if updated < victim_updated:
+                    victim_offset, victim_updated = offset, updated
+
+            _SLOT.pack_into(buffer, victim_offset, key, self.burst - 1.0, now)
+            return True
+
+    def close(self) -> None:
+        """Отключается от разделяемой памяти; процесс, создавший таблицу, удаляет ее."""
+        self._memory.close()
+        if os.getpid() == self._owner_pid:
+            self._memory.unlink()
+
+
+_limiter: RateLimiter | None = None
+
+
+def configure_rate_limiter(rate: float | None, burst: int | None = None) -> None:
+    """Включает или отключает ограничение частоты запросов, используемое обработчиками API.
+
+    Args:
+        rate: Допустимое количество запросов в секунду на пару (`account`, `login`). Если нет или 0, лимита нет.
+        burst: Вместимость ведра (по умолчанию `rate`, округленная вверх, но не меньше 1).
+    """
+    global _limiter  # noqa: PLW0603
+
+    if _limiter is not None:
+        _limiter.close()
+        _limiter = None
+
+    if rate:
+        _limiter = RateLimiter(rate, burst or max(1, math.ceil(rate)))
+        logger.info('Rate limit: %s requests/s per account and login, burst %d', rate, _limiter.burst)
+
+
+def allow_request(account: str, login: str) -> bool:
+    """Проверяет лимит частоты запросов партнера.
+
+    Args:
+        account: Учетная запись партнера.
+        login: Логин пользователя.
+
+    Returns:
+        True, если лимит не настроен или запрос в него укладывается.
+    """
+    return _limiter is None or _limiter.allow(account, login)
@@ -4,14 +4,64 @@
 from typing import TYPE_CHECKING
 
 from scoring_api.requests.exceptions import ValidationError
-from scoring_api.requests.fields import Field
+from scoring_api.requests.fields import CHECK_NAMESPACE, Field
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from typing import Any
 
 
+def _compile_validate(name: str, fields: dict[str, Field]) -> 'Callable[[Any, dict[str, Any]], None]':
+    """Генерирует метод `validate` класса запроса со встроенными проверками полей.
+
+    Сгенерированный метод эквивалентен `BaseRequest.validate`: поля проверяются в порядке объявления,
+    для каждого поля записывается первая ошибка с тем же сообщением, что и у `Field.validate`,
+    а в `validated_data` сохраняется преобразованное значение.
+
+    Args:
+        name: Имя класса запроса.
+        fields: Поля запроса.
+
+    Returns:
+        Функция, используемая как метод `validate`.
+    """
+    lines = [
+        'def validate(self, data):',
+        '    validated_data = self.validated_data',
+        '    get = data.get',
+    ]
+
+    for field_name, field in fields.items():
+        key = repr(field_name)
+        lines.append(f'    value = get({key})')
+        lines.append('    if value is None:')
+        lines.append(f"        self.add_error({key}, 'Field is required')" if field.required else '        pass')
+        for condition, message in field.checks():
+            lines.append(f'    elif {condition}:')
+            lines.append(f'        self.add_error({key}, {message!r})')
+        lines.append('    else:')
+        lines.append(f'        validated_data[{key}] = {field.cleaned_expression()}')
+
+    if not fields:
+        lines.append('    pass')
+
+    source = '\n'.join(lines)
+    namespace = dict(CHECK_NAMESPACE)
+    exec(compile(source, f'<validate {name}>', 'exec'), namespace)
+
+    validate: Callable[[Any, dict[str, Any]], None] = namespace['validate']
+    validate.__qualname__ = f'{name}.validate'
+    validate.__doc__ = 'Проверяет и валидирует все поля запроса (сгенерировано `RequestMeta`).'
+    return validate
+
+
 class RequestMeta(type):
-    """Метакласс, в котором собраны определения полей."""
+    """Метакласс, в котором собраны определения полей.
+
+    Для каждого класса запроса, не определяющего `validate` явно, метакласс генерирует метод `validate`
+    со встроенными проверками полей, чтобы не перебирать поля и не вызывать цепочку `Field.validate`
+    на каждом запросе. Классы запросов получают пустые `__slots__`, поэтому экземпляры не создают `__dict__`.
+    """
 
     def __new__(cls, name: str, bases: tuple[type, ...], attrs: dict[str, 'Any']) -> type:
         fields = {k: v for k, v in attrs.items() if isinstance(v, Field)}
@@ -20,36 +70,64 @@ class RequestMeta(type):
             attrs.pop(k)
 
         attrs['_fields'] = fields
+        attrs.setdefault('__slots__', ())
+
+        if 'validate' not in attrs:
+            attrs['validate'] = _compile_validate(name, fields)
 
         return super().__new__(cls, name, bases, attrs)
 
 
 class BaseRequest(metaclass=RequestMeta):
-    """Базовый класс для всех типов запросов с автоматической проверкой полей."""
+    """Базовый класс для всех типов запросов с автоматической проверкой полей.
+
+    Словарь ошибок создается только при первой ошибке, поэтому корректный запрос выделяет
+    единственный словарь - `validated_data`.
+    """
+
+    __slots__ = ('_errors', 'validated_data')
 
     _fields: dict[str, Field] = {}
 
     def __init__(self, data: dict[str, 'Any']) -> None:
-        self.errors: dict[str, list[str]] = {}
+        self._errors: dict[str, list[str]] | None = None
         self.validated_data: dict[str, Any] = {}
         self.validate(data)
 
+    @property
+    def errors(self) -> dict[str, list[str]]:
+        """Ошибки проверки по полям (пустой словарь, если ошибок нет)."""
+        return self._errors if self._errors is not None else {}
+
+    def add_error(self, field_name: str, message: str) -> None:
+        """Добавляет ошибку проверки поля.
+
+        Args:
+            field_name: Имя поля.
+            message: Сообщение об ошибке.
+        """
+        if self._errors is None:
+            self._errors = {}
+        self._errors.setdefault(field_name, []).append(message)
+
     def validate(self, data: dict[str, 'Any']) -> None:
-        """Проверяет и валидирует все поля запроса."""
+        """Проверяет поля запроса и сохраняет их преобразованные значения в `validated_data`.
+
+        Подклассы получают от `RequestMeta` эквивалентный сгенерированный метод.
+        """
         for field_name, field in self._fields.items():
             value = data.get(field_name)
 
             if value is None:
                 if field.required:
-                    self.errors.setdefault(field_name, []).append('Field is required')
+                    self.add_error(field_name, 'Field is required')
                 continue
 
             try:
-                field.validate(value)
-                self.validated_data[field_name] = value
+                self.validated_data[field_name] = field.validate(value)
             except ValidationError as e:
-                self.errors.setdefault(field_name, []).append(str(e))
+                self.add_error(field_name, str(e))
 
     def is_valid(self) -> bool:
         """Проверяет, что запрос действителен."""
-        return not bool(self.errors)
+        return self._errors is None
@@ -1,16 +1,105 @@
 # ruff: noqa: D102, D107, ANN401
-"""Определение типов полей и их валидации."""
+"""Определение типов полей, их валидации и преобразования значений.
+
+Проверки поля описываются методом `checks` как упорядоченный список пар "выражение Python над значением
+`value`, истинное для некорректного значения" и "сообщение об ошибке". Выражение может сохранить
+промежуточный результат оператором `:=`, а `cleaned_expression` - использовать его, чтобы значение
+разбиралось один раз. Из этих описаний `RequestMeta` собирает функцию проверки всего запроса,
+а `Field.validate` проверяет и преобразует отдельное значение.
+"""
 
 import datetime
 from abc import ABC, abstractmethod
+from array import array
+from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING
 
 from scoring_api.constants import MAX_AGE, PHONE_COUNTRY_CODE, PHONE_LENGTH
 from scoring_api.requests.exceptions import ValidationError
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from typing import Any
 
+type Check = tuple[str, str]
+
+DATE_CACHE_SIZE = 1024  # Количество запоминаемых разобранных дат
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_date(value: str) -> datetime.date | None:
+    """Разбирает дату в формате DD.MM.YYYY.
+
+    Строки ровно такого вида разбираются срезами без `strptime`. Остальные строки (например, `1.7.2017`,
+    которую тоже принимает `strptime`) разбираются `strptime`. Результаты запоминаются.
+
+    Args:
+        value: Строка даты.
+
+    Returns:
+        Дата или None, если строка не является корректной датой.
+    """
+    if len(value) == 10 and value[2] == '.' and value[5] == '.':  # noqa: PLR2004
+        day, month, year = value[:2], value[3:5], value[6:]
+        if (day + month + year).isascii() and (day + month + year).isdigit():
+            try:
+                return datetime.date(int(year), int(month), int(day))
+            except ValueError:
+                return None
+
+    try:
+        return datetime.datetime.strptime(value, '%d.%m.%Y').date()
+    except ValueError:
+        return None
+
+
+def client_id_array(value: list['Any']) -> 'array[int] | None':
+    """Преобразует список идентификаторов клиентов в массив 64-битных целых.
+
+    Массив строится в C за один проход, который заодно проверяет, что все элементы - целые числа.
+
+    Args:
+        value: Список идентификаторов.
+
+    Returns:
+        Массив идентификаторов или None, если список содержит не целые числа или числа вне диапазона int64.
+    """
+    try:
+        return array('q', value)
+    except (TypeError, OverflowError):
+        return None
+
+
+CHECK_NAMESPACE: dict[str, 'Any'] = {
+    'datetime': datetime,
+    'parse_date': parse_date,
+    'client_id_array': client_id_array,
+    'ValidationError': ValidationError,
+}
+"""Имена, доступные выражениям проверок."""
+
+
+def compile_validator(checks: list[Check], cleaned: str, name: str) -> 'Callable[[Any], Any]':
+    """Компилирует проверки поля в функцию проверки и преобразования значения.
+
+    Args:
+        checks: Проверки поля.
+        cleaned: Выражение, вычисляющее преобразованное значение после проверок.
+        name: Имя функции для трассировок.
+
+    Returns:
+        Функция, принимающая непустое значение и возвращающая преобразованное значение.
+        При нарушении проверки функция выбрасывает `ValidationError` с сообщением первой нарушенной проверки.
+    """
+    lines = [f'def {name}(value):']
+    lines += [f'    if {condition}:\n        raise ValidationError({message!r})' for condition, message in checks]
+    lines.append(f'    return {cleaned}')
+
+    namespace = dict(CHECK_NAMESPACE)
+    exec(compile('\n'.join(lines), f'<checks {name}>', 'exec'), namespace)
+    validator: Callable[[Any], Any] = namespace[name]
+    return validator
+
 
 class Field(ABC):
     """Базовый класс для полей запроса с проверкой."""
@@ -20,103 +109,146 @@ class Field(ABC):
         self.nullable = nullable
 
     @abstractmethod
-    def validate(self, value: 'Any') -> None:
-        if self.required and value is None:
-            raise ValidationError('This field is required')
+    def checks(self) -> list[Check]:
+        """Возвращает проверки непустого (не None) значения поля в порядке выполнения."""
 
-        if not self.nullable and not value:
-            raise ValidationError('This field cannot be empty')
+    def cleaned_expression(self) -> str:
+        """Возвращает выражение, вычисляющее значение поля после успешных проверок."""
+        return 'value'
+
+    def empty_checks(self) -> list[Check]:
+        """Возвращает проверку на пустое значение, если поле не допускает пустых значений."""
+        return [] if self.nullable else [('not value', 'This field cannot be empty')]
+
+    def validate(self, value: 'Any') -> 'Any':
+        """Проверяет значение поля.
+
+        Returns:
+            Преобразованное значение поля (для None - None).
+
+        Raises:
+            ValidationError: Если значение некорректно.
+        """
+        if value is None:
+            if self.required:
+                raise ValidationError('This field is required')
+            return None
+
+        return self._validator(value)
+
+    @cached_property
+    def _validator(self) -> 'Callable[[Any], Any]':
+        """Скомпилированные проверки поля."""
+        return compile_validator(self.checks(), self.cleaned_expression(), type(self).__name__.lower())
 
 
 class CharField(Field):
     """Строковое поле."""
 
-    def validate(self, value: 'Any') -> None:
-        super().validate(value)
-
-        if value is not None and not isinstance(value, str):
-            raise ValidationError('Must be a string')
+    def checks(self) -> list[Check]:
+        return [*self.empty_checks(), ('not isinstance(value, str)', 'Must be a string')]
 
 
 class ArgumentsField(Field):
     """Dictionary field."""
 
-    def validate(self, value: 'Any') -> None:
-        if value is not None and not isinstance(value, dict):
-            raise ValidationError('Must be a dictionary')
+    def checks(self) -> list[Check]:
+        return [('not isinstance(value, dict)', 'Must be a dictionary')]
 
 
 class EmailField(CharField):
     """Поле электронной почты с валидацией '@'."""
 
-    def validate(self, value: 'Any') -> None:
-        super().validate(value)
-        if value and '@' not in value:
-            raise ValidationError('Invalid email format')
+    def checks(self) -> list[Check]:
+        return [*super().checks(), ("value and '@' not in value", 'Invalid email format')]
 
 
 class PhoneField(Field):
     """Поле номера телефона, который должен начинаться с '7' и состоять из 11 цифр."""
 
-    def validate(self, value: 'Any') -> None:
-        if value is None:
-            return
-
-        if not isinstance(value, (str | int)):
-            raise ValidationError('Must be a string or an integer')
-
-        value_str = str(value)
-        if not value_str.startswith(str(PHONE_COUNTRY_CODE)) or len(value_str) != PHONE_LENGTH:
-            raise ValidationError('Invalid phone number format')
+    def checks(self) -> list[Check]:
+        return [
+            ('not isinstance(value, str | int)', 'Must be a string or an integer'),
+            (
+                f'not str(value).startswith({str(PHONE_COUNTRY_CODE)!r}) or len(str(value)) != {PHONE_LENGTH}',
+                'Invalid phone number format',
+            ),
+        ]
 
 
 class DateField(Field):
-    """Поле даты в формате DD.MM.YYYY."""
-
-    def validate(self, value: 'Any') -> None:
-        if value is None:
-            return
+    """Поле даты в формате DD.MM.YYYY. Значение преобразуется в `datetime.date`."""
 
-        if not isinstance(value, str):
-            raise ValidationError('Must be a string')
+    def checks(self) -> list[Check]:
+        return [
+            ('not isinstance(value, str)', 'Must be a string'),
+            ('(parsed_date := parse_date(value)) is None', 'Invalid date format'),
+        ]
 
-        try:
-            datetime.datetime.strptime(value, '%d.%m.%Y')
-        except ValueError as error:
-            raise ValidationError('Invalid date format') from error
+    def cleaned_expression(self) -> str:
+        return 'parsed_date'
 
 
 class BirthDayField(DateField):
     """Date field with an age restriction (max 70 years)."""
 
-    def validate(self, value: 'Any') -> None:
-        if value is None:
-            return
-
-        super().validate(value)
-        birth_date = datetime.datetime.strptime(value, '%d.%m.%Y')
-
-        if (datetime.datetime.now().year - birth_date.year) > MAX_AGE:
-            raise ValidationError('Date is too old')
+    def checks(self) -> list[Check]:
+        return [
+            *super().checks(),
+            (f'datetime.date.today().year - parsed_date.year > {MAX_AGE}', 'Date is too old'),
+        ]
 
 
 class GenderField(Field):
     """Поле пола, которое должно быть равно 0, 1 или 2."""
 
-    def validate(self, value: 'Any') -> None:
-        if value is None:
-            return
-
-        if not isinstance(value, int) or value not in {0, 1, 2}:
-            raise ValidationError('Invalid gender value')
+    def checks(self) -> list[Check]:
+        return [('not isinstance(value, int) or value not in {0, 1, 2}', 'Invalid gender value')]
 
 
 class ClientIDsField(Field):
-    """Поле для списка целочисленных идентификаторов клиентов."""
-
-    def validate(self, value: 'Any') -> None:
-        if not isinstance(value, list) or not all(isinstance(i, int) for i in value):
-            raise ValidationError('Must be a list of integers')
-
-        if not value:
-            raise ValidationError('Client IDs cannot be empty')
+    """Поле для списка целочисленных идентификаторов клиентов с необязательным ограничением количества.
+
+    Значение преобразуется в `array('q')`. Ограничение `max_items` относится к разным идентификаторам:
+    повторы не учитываются.
+    """
+
+    def __init__(self, required: bool = False, nullable: bool = False, max_items: int | None = None) -> None:
+        super().__init__(required, nullable)
+        self.max_items = max_items
+
+    def checks(self) -> list[Check]:
+        checks = [
+            (
+                'not isinstance(value, list) or (client_ids := client_id_array(value)) is None',
+                'Must be a list of integers',
+            ),
+            ('not value', 'Client IDs cannot be empty'),
+        ]
+        if self.max_items is not None:
+            checks.append(
+                (
+                    f'len(client_ids) > {self.max_items} and len(set(client_ids)) > {self.max_items}',
+                    f'Must contain at most {self.max_items} distinct client IDs',
+                )
+            )
+        return checks
+
+    def cleaned_expression(self) -> str:
+        return 'client_ids'
+
+
+class PositiveIntField(Field):
+    """Поле положительного целого числа с необязательным верхним пределом."""
+
+    def __init__(self, required: bool = False, nullable: bool = False, max_value: int | None = None) -> None:
+        super().__init__(required, nullable)
+        self.max_value = max_value
+
+    def checks(self) -> list[Check]:
+        checks = [
+            ('not isinstance(value, int) or isinstance(value, bool) or value <= 0', 'Must be a positive integer'),
+        ]
+        if self.max_value is not None:
+            checks.append((f'value > {self.max_value}', f'Must not be greater than {self.max_value}'))
+        return checks
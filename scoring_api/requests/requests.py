@@ -1,11 +1,17 @@
 # ruff: noqa: D102, D107, ANN401
 """Проверка и обработка запросов."""
 
-from datetime import datetime
 from typing import TYPE_CHECKING
 
-from scoring_api.constants import ADMIN_LOGIN
+from scoring_api.constants import (
+    ADMIN_LOGIN,
+    MAX_INTERESTS_PAGE_SIZE,
+    MAX_PROFILE_DURATION_SECONDS,
+    MAX_TOP_INTERESTS_CLIENTS,
+    MAX_TOP_INTERESTS_LIMIT,
+)
 from scoring_api.requests.base import BaseRequest
+from scoring_api.requests.exceptions import ValidationError
 from scoring_api.requests.fields import (
     ArgumentsField,
     BirthDayField,
@@ -15,6 +21,7 @@ from scoring_api.requests.fields import (
     EmailField,
     GenderField,
     PhoneField,
+    PositiveIntField,
 )
 
 if TYPE_CHECKING:
@@ -26,6 +33,29 @@ class ClientsInterestsRequest(BaseRequest):
 
     client_ids: 'ClassVar[ClientIDsField]' = ClientIDsField(required=True)
     date: 'ClassVar[DateField]' = DateField(required=False, nullable=True)
+    cursor: 'ClassVar[CharField]' = CharField(required=False, nullable=True)
+    page_size: 'ClassVar[PositiveIntField]' = PositiveIntField(
+        required=False, nullable=True, max_value=MAX_INTERESTS_PAGE_SIZE
+    )
+
+
+class ClientsInterestsTopRequest(BaseRequest):
+    """Запрос самых частых интересов группы клиентов."""
+
+    client_ids: 'ClassVar[ClientIDsField]' = ClientIDsField(required=True, max_items=MAX_TOP_INTERESTS_CLIENTS)
+    date: 'ClassVar[DateField]' = DateField(required=False, nullable=True)
+    limit: 'ClassVar[PositiveIntField]' = PositiveIntField(
+        required=False, nullable=True, max_value=MAX_TOP_INTERESTS_LIMIT
+    )
+
+
+class ProfileRequest(BaseRequest):
+    """Запрос запуска профиля сервера."""
+
+    mode: 'ClassVar[CharField]' = CharField(required=False, nullable=True)
+    duration: 'ClassVar[PositiveIntField]' = PositiveIntField(
+        required=False, nullable=True, max_value=MAX_PROFILE_DURATION_SECONDS
+    )
 
 
 class OnlineScoreRequest(BaseRequest):
@@ -38,18 +68,30 @@ class OnlineScoreRequest(BaseRequest):
     birthday: 'ClassVar[BirthDayField]' = BirthDayField(required=False, nullable=True)
     gender: 'ClassVar[GenderField]' = GenderField(required=False, nullable=True)
 
-    def is_valid(self) -> bool:
-        """Дополнительная валидация после основного метода."""
-        valid = super().is_valid()
-
-        if valid and 'birthday' in self.validated_data and isinstance(self.validated_data['birthday'], str):
-            try:
-                self.validated_data['birthday'] = datetime.strptime(self.validated_data['birthday'], '%d.%m.%Y').date()
-            except ValueError:
-                self.errors['birthday'] = 'Invalid date format. Expected DD.MM.YYYY'
-                return False
-
-        return valid
+    required_pairs: 'ClassVar[tuple[tuple[str, str], ...]]' = (
+        ('phone', 'email'),
+        ('first_name', 'last_name'),
+        ('gender', 'birthday'),
+    )
+
+    def validate_required_pairs(self) -> None:
+        """Проверяет, что передана хотя бы одна обязательная пара полей.
+
+        Raises:
+            ValidationError: Если ни одна из пар `required_pairs` не заполнена.
+        """
+        is_valid_pair_present = any(
+            self.validated_data.get(a) is not None and self.validated_data.get(b) is not None
+            for a, b in self.required_pairs
+        )
+
+        if not is_valid_pair_present:
+            raise ValidationError(
+                [
+                    f'At least one of the following required field pairs must be provided: '
+                    f'{", ".join(str(pair) for pair in self.required_pairs)}'
+                ]
+            )
 
 
 class MethodRequest(BaseRequest):
@@ -0,0 +1,315 @@
+"""Реестр моделей скоринга с правилами, загружаемыми из конфигурации.
+
+Модель скоринга - это набор правил вида "условия на поля -> вес". При создании модели правила
+компилируются в плоскую таблицу: каждое уникальное условие получает бит маски, а для каждой маски
+заранее вычисляется сумма весов выполненных правил. Расчет оценки сводится к сгенерированной функции,
+которая вычисляет маску и берет значение из таблицы, поэтому его стоимость не зависит от числа правил.
+
+Формат файла конфигурации (JSON):
+
+    {
+      "default": "base",
+      "accounts": {"horns&hoofs": "strict"},
+      "models": {
+        "base": {
+          "cache_namespace": "uid",
+          "cache_policy": "adaptive",
+          "rules": [{"when": {"phone": "present"}, "weight": 1.5}]
+        },
+        "strict": {"rules": [{"when": {"phone": "present", "email": "present"}, "weight": 3.0}]}
+      }
+    }
+"""
+
+import json
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from scoring_api.cache_policy import AdaptiveCachePolicy
+from scoring_api.keys import SCORE_KEY_NAMESPACE
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    from scoring_api.cache_policy import CachePolicyStats
+
+type Evaluator = Callable[..., float]
+
+SCORE_FIELDS = ('phone', 'email', 'birthday', 'gender', 'first_name', 'last_name')
+DEFAULT_MODEL_NAME = 'default'
+
+CACHE_POLICY_ADAPTIVE = 'adaptive'  # Кэш используется, только если это быстрее расчета
+CACHE_POLICY_ALWAYS = 'always'  # Оценка всегда читается из кэша и записывается в него
+CACHE_POLICIES = (CACHE_POLICY_ADAPTIVE, CACHE_POLICY_ALWAYS)
+
+DEFAULT_MODEL_CONFIG: dict[str, 'Any'] = {
+    'cache_namespace': SCORE_KEY_NAMESPACE,
+    'cache_policy': CACHE_POLICY_ADAPTIVE,
+    'rules': [
+        {'when': {'phone': 'present'}, 'weight': 1.5},
+        {'when': {'email': 'present'}, 'weight': 1.5},
+        {'when': {'birthday': 'present', 'gender': 'not_null'}, 'weight': 1.5},
+        {'when': {'first_name': 'present', 'last_name': 'present'}, 'weight': 0.5},
+    ],
+}
+
+
+class ScoringConfigError(ValueError):
+    """Исключение, возникающее при некорректной конфигурации моделей скоринга."""
+
+
+class Condition(str, Enum):
+    """Условие, накладываемое правилом на значение поля."""
+
+    PRESENT = 'present'  # Значение непустое
+    NOT_NULL = 'not_null'  # Значение передано, даже если оно ложное (например, пол 0)
+
+
+def _condition_source(field: str, condition: Condition) -> str:
+    """Возвращает выражение Python, проверяющее условие для поля."""
+    return field if condition is Condition.PRESENT else f'{field} is not None'
+
+
+class ScoringModel:
+    """Скомпилированная модель скоринга."""
+
+    __slots__ = ('cache_namespace', 'cache_policy', 'evaluate', 'name', 'rules_count')
+
+    def __init__(
+        self,
+        name: str,
+        rules: list[dict[str, 'Any']],
+        cache_namespace: str | None = None,
+        cache_policy: str = CACHE_POLICY_ADAPTIVE,
+    ) -> None:
+        """Компилирует правила модели.
+
+        Args:
+            name: Название модели.
+            rules: Правила вида `{"when": {<поле>: <условие>}, "weight": <вес>}`.
+            cache_namespace: Пространство имен ключей кэша (по умолчанию название модели).
+            cache_policy: Политика кэширования оценок: `adaptive` или `always`.
+
+        Raises:
+            ScoringConfigError: Если правила или политика кэширования некорректны.
+        """
+        if cache_policy not in CACHE_POLICIES:
+            raise ScoringConfigError(f'Model {name}: unknown cache policy {cache_policy!r}')
+        if cache_namespace is not None and not isinstance(cache_namespace, str):
+            raise ScoringConfigError(f'Model {name}: "cache_namespace" must be a string')
+
+        self.name = name
+        self.cache_namespace = cache_namespace or name
+        self.cache_policy = AdaptiveCachePolicy(name) if cache_policy == CACHE_POLICY_ADAPTIVE else None
+        self.rules_count = len(rules)
+        self.evaluate: Evaluator = self._compile(rules)
+
+    def _compile(self, rules: list[dict[str, 'Any']]) -> 'Evaluator':
+        """Строит таблицу весов и функцию расчета оценки."""
+        atoms: dict[tuple[str, Condition], int] = {}
+        compiled_rules: list[tuple[int, float]] = []
+
+        for rule in rules:
+            when, weight = self._parse_rule(rule)
+            rule_mask = 0
+            for field, condition in when.items():
+                atom = (field, condition)
+                rule_mask |= 1 << atoms.setdefault(atom, len(atoms))
+            compiled_rules.append((rule_mask, weight))
+
+        table = tuple(
+            sum((weight for rule_mask, weight in compiled_rules if mask & rule_mask == rule_mask), 0.0)
+            for mask in range(1 << len(atoms))
+        )
+
+        mask_source = ' | '.join(
+            f'({1 << bit} if {_condition_source(field, condition)} else 0)' for (field, condition), bit in atoms.items()
+        )
+        arguments = ', '.join(f'{field}=None' for field in SCORE_FIELDS)
+        source = f'def evaluate({arguments}):\n    return table[{mask_source or 0}]\n'
+
+        namespace: dict[str, Any] = {'table': table}
+        exec(compile(source, f'<scoring model {self.name}>', 'exec'), namespace)
+
+        evaluator: Evaluator = namespace['evaluate']
+        return evaluator
+
+    def _parse_rule(self, rule: object) -> tuple[dict[str, Condition], float]:
+        """Проверяет правило и возвращает условия и вес."""
+        when = rule.get('when') if isinstance(rule, dict) else None
+        weight = rule.get('weight') if isinstance(rule, dict) else None
+
+        if not isinstance(when, dict) or not when:
+            raise ScoringConfigError(f'Model {self.name}: rule must have a non-empty "when" object')
+        if not isinstance(weight, int | float) or isinstance(weight, bool):
+            raise ScoringConfigError(f'Model {self.name}: rule weight must be a number')
+
+        conditions: dict[str, Condition] = {}
+        for field, condition in when.items():
+            if field not in SCORE_FIELDS:
+                raise ScoringConfigError(f'Model {self.name}: unknown field {field!r}')
+            try:
+                conditions[field] = Condition(condition)
+            except ValueError as error:
+                raise ScoringConfigError(f'Model {self.name}: unknown condition {condition!r}') from error
+
+        return conditions, float(weight)
+
+
+class ScoringModelRegistry:
+    """Реестр моделей скоринга с выбором модели по учетной записи партнера."""
+
+    def __init__(self, models: dict[str, ScoringModel], default: str, accounts: dict[str, str] | None = None) -> None:
+        """Создает реестр моделей.
+
+        Пространства имен кэша моделей не должны совпадать, иначе модели читают и перезаписывают оценки
+        друг друга. Пространство `uid` (`SCORE_KEY_NAMESPACE`) зарезервировано за моделью по умолчанию:
+        для него при промахе читаются ключи прежнего формата, рассчитанные встроенными правилами.
+
+        Args:
+            models: Модели по названиям.
+            default: Название модели по умолчанию.
+            accounts: Названия моделей по учетным записям партнеров.
+
+        Raises:
+            ScoringConfigError: Если указана несуществующая модель или пространства имен кэша некорректны.
+        """
+        accounts = accounts or {}
+        for model_name in (default, *accounts.values()):
+            if not isinstance(model_name, str) or model_name not in models:
+                raise ScoringConfigError(f'Unknown scoring model {model_name!r}')
+
+        namespaces: dict[str, str] = {}
+        for name, model in models.items():
+            if model.cache_namespace == SCORE_KEY_NAMESPACE and name != default:
+                raise ScoringConfigError(
+                    f'Model {name}: cache namespace {SCORE_KEY_NAMESPACE!r} is reserved for the default model'
+                )
+            other = namespaces.setdefault(model.cache_namespace, name)
+            if other != name:
+                raise ScoringConfigError(f'Models {other} and {name} share cache namespace {model.cache_namespace!r}')
+
+        self.models = models
+        self.default = models[default]
+        self._accounts = {account: models[model_name] for account, model_name in accounts.items()}
+
+    @classmethod
+    def from_config(cls, config: dict[str, 'Any']) -> 'ScoringModelRegistry':
+        """Создает реестр из словаря конфигурации.
+
+        Args:
+            config: Конфигурация в формате, описанном в документации модуля.
+
+        Returns:
+            Реестр моделей.
+
+        Raises:
+            ScoringConfigError: Если конфигурация некорректна.
+        """
+        models_config = config.get('models')
+        if not isinstance(models_config, dict) or not models_config:
+            raise ScoringConfigError('Config must have a non-empty "models" object')
+
+        models = {}
+        for name, model_config in models_config.items():
+            rules = model_config.get('rules') if isinstance(model_config, dict) else None
+            if not isinstance(rules, list):
+                raise ScoringConfigError(f'Model {name}: "rules" must be a list')
+            models[name] = ScoringModel(
+                name,
+                rules,
+                model_config.get('cache_namespace'),
+                model_config.get('cache_policy', CACHE_POLICY_ADAPTIVE),
+            )
+
+        default = config.get('default', next(iter(models)))
+        accounts = config.get('accounts', {})
+        if not isinstance(accounts, dict):
+            raise ScoringConfigError('"accounts" must be an object')
+
+        return cls(models, default, accounts)
+
+    @classmethod
+    def from_file(cls, path: str) -> 'ScoringModelRegistry':
+        """Создает реестр из JSON-файла конфигурации.
+
+        Args:
+            path: Путь к файлу конфигурации.
+
+        Returns:
+            Реестр моделей.
+
+        Raises:
+            ScoringConfigError: Если файл не является корректной конфигурацией.
+        """
+        with open(path, encoding='utf-8') as file:
+            try:
+                config = json.load(file)
+            except json.JSONDecodeError as error:
+                raise ScoringConfigError(f'Invalid scoring config {path}: {error}') from error
+
+        if not isinstance(config, dict):
+            raise ScoringConfigError(f'Invalid scoring config {path}: must be an object')
+
+        return cls.from_config(config)
+
+    @classmethod
+    def default_registry(cls) -> 'ScoringModelRegistry':
+        """Создает реестр, содержащий только встроенную модель по умолчанию."""
+        return cls.from_config({'models': {DEFAULT_MODEL_NAME: DEFAULT_MODEL_CONFIG}})
+
+    def get(self, account: str | None) -> ScoringModel:
+        """Возвращает модель для учетной записи партнера.
+
+        Args:
+            account: Учетная запись партнера.
+
+        Returns:
+            Модель учетной записи или модель по умолчанию.
+        """
+        return self._accounts.get(account, self.default) if account else self.default
+
+
+DEFAULT_SCORING_MODEL = ScoringModel(
+    DEFAULT_MODEL_NAME, DEFAULT_MODEL_CONFIG['rules'], SCORE_KEY_NAMESPACE, CACHE_POLICY_ALWAYS
+)
+
+_registry = ScoringModelRegistry.default_registry()
+
+
+def configure_scoring_models(config_file: str | None) -> None:
+    """Загружает модели скоринга, используемые обработчиками API.
+
+    Args:
+        config_file: Путь к файлу конфигурации. Если нет, используется встроенная модель.
+    """
+    global _registry  # noqa: PLW0603
+
+    _registry = ScoringModelRegistry.from_file(config_file) if config_file else ScoringModelRegistry.default_registry()
+
+
+def get_scoring_model(account: str | None) -> ScoringModel:
+    """Возвращает модель скоринга для учетной записи партнера.
+
+    Args:
+        account: Учетная запись партнера.
+
+    Returns:
+        Модель скоринга.
+    """
+    return _registry.get(account)
+
+
+def get_cache_policy_stats() -> dict[str, 'CachePolicyStats']:
+    """Возвращает решения и статистику адаптивных политик кэширования по моделям.
+
+    Returns:
+        Статистика политик по названиям моделей.
+    """
+    return {name: model.cache_policy.stats() for name, model in _registry.models.items() if model.cache_policy}
+
+
+def render_cache_policy_stats() -> str:
+    """Возвращает статистику адаптивных политик кэширования процесса в формате JSON (см. `get_cache_policy_stats`)."""
+    return json.dumps(get_cache_policy_stats())
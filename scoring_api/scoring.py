@@ -1,11 +1,20 @@
 """Модуль содержит функции для подсчета оценок пользователей и поиска интересов клиентов."""
 
 import datetime
-import hashlib
-import json
+from time import perf_counter_ns
 from typing import TYPE_CHECKING
 
+from scoring_api.cache_policy import CacheDecision
+from scoring_api.constants import READ_LEGACY_SCORE_KEYS
+from scoring_api.interests import get_current_interests, get_interests_as_of
+from scoring_api.keys import legacy_score_key, score_key, SCORE_KEY_NAMESPACE
+from scoring_api.rules import DEFAULT_SCORING_MODEL
+
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from scoring_api.cache_policy import AdaptiveCachePolicy
+    from scoring_api.rules import ScoringModel
     from scoring_api.storage.interface import StorageInterface
 
 type Phone = str | int | None
@@ -24,15 +33,22 @@ def get_score(  # noqa: PLR0913
     gender: Gender = None,
     first_name: FirstName = None,
     last_name: LastName = None,
+    model: 'ScoringModel' = DEFAULT_SCORING_MODEL,
+    cache_policy: 'AdaptiveCachePolicy | None' = None,
 ) -> float:
     """Рассчитывает оценку на основе предоставленных атрибутов пользователя.
 
-    Система подсчета очков соответствует этим правилам:
+    Оценка рассчитывается правилами модели скоринга. Модель по умолчанию соответствует этим правилам:
     - +1,5, если указан `телефон`.
     - +1,5, если указана `email`.
     - +1,5, если указаны `день рождения` и `гендер`.
     - +0.5, если указаны `первое_имя` и `последнее_имя`.
 
+    Оценка кэшируется по ключу из `scoring_api.keys` в пространстве имен модели. Для пространства `uid`
+    при промахе читается ключ прежнего формата, и найденное значение переносится под новый ключ.
+    Если передана политика кэширования, она решает, читать ли кэш и записывать ли в него (см. `CacheDecision`),
+    и получает замеры времени.
+
     Args:
         storage: Экземпляр хранилища.
         phone: Номер телефона пользователя.
@@ -41,42 +57,85 @@ def get_score(  # noqa: PLR0913
         gender: Пол пользователя (0, 1 или 2).
         first_name: Имя пользователя.
         last_name: Фамилия пользователя.
+        model: Модель скоринга.
+        cache_policy: Политика кэширования. Если нет, кэш используется всегда.
 
     Returns:
         Расчетная оценка.
     """
-    # TODO: Вынести в отдельную encode функцию (хэш-функцию)
-    key_parts: list[str] = [
-        first_name or '',
-        last_name or '',
-        str(phone) or '',
-        birthday.strftime('%Y%m%d') if birthday else '',
-    ]
-    key = 'uid:' + hashlib.md5(''.join(key_parts).encode('utf-8')).hexdigest()
+    if cache_policy is None:
+        key = score_key(first_name, last_name, phone, birthday, model.cache_namespace)
+
+        cached_score = _read_cached_score(storage, key, model, first_name, last_name, phone, birthday)
+        if cached_score is not None:
+            return float(cached_score)
+
+        score = model.evaluate(phone, email, birthday, gender, first_name, last_name)
+
+        storage.cache_set(key, score, 60 * 60)
+        return score
+
+    decision = cache_policy.decide()
+    if decision is CacheDecision.BYPASS:
+        started = perf_counter_ns()
+        score = model.evaluate(phone, email, birthday, gender, first_name, last_name)
+        cache_policy.record_compute(perf_counter_ns() - started)
+        return score
+
+    key = score_key(first_name, last_name, phone, birthday, model.cache_namespace)
+
+    cached_score = None
+    if decision.reads:
+        started = perf_counter_ns()
+        cached_score = _read_cached_score(storage, key, model, first_name, last_name, phone, birthday)
+        cache_policy.record_read(perf_counter_ns() - started, cached_score is not None)
+
+        if cached_score is not None and not cache_policy.needs_compute_sample:
+            return float(cached_score)
+
+    started = perf_counter_ns()
+    score = model.evaluate(phone, email, birthday, gender, first_name, last_name)
+    cache_policy.record_compute(perf_counter_ns() - started)
 
-    cached_score = storage.cache_get(key)
     if cached_score is not None:
         return float(cached_score)
 
-    score: float = sum(
-        [
-            1.5 if phone else float(0),
-            1.5 if email else float(0),
-            1.5 if birthday and gender is not None else float(0),
-            0.5 if first_name and last_name else float(0),
-        ]
-    )
-
-    storage.cache_set(key, score, 60 * 60)
+    if decision.writes:
+        started = perf_counter_ns()
+        storage.cache_set(key, score, 60 * 60)
+        cache_policy.record_write(perf_counter_ns() - started)
     return score
 
 
-def get_interests(storage: 'StorageInterface', client_ids: list[int]) -> dict[str, list[str]]:
+def _read_cached_score(  # noqa: PLR0913
+    storage: 'StorageInterface',
+    key: str,
+    model: 'ScoringModel',
+    first_name: FirstName,
+    last_name: LastName,
+    phone: Phone,
+    birthday: Birthday,
+) -> str | None:
+    """Читает оценку из кэша, при необходимости по ключу прежнего формата."""
+    cached_score = storage.cache_get(key)
+
+    if cached_score is None and READ_LEGACY_SCORE_KEYS and model.cache_namespace == SCORE_KEY_NAMESPACE:
+        cached_score = storage.cache_get(legacy_score_key(first_name, last_name, phone, birthday))
+        if cached_score is not None:
+            storage.cache_set(key, cached_score, 60 * 60)
+
+    return cached_score
+
+
+def get_interests(
+    storage: 'StorageInterface', client_ids: 'Sequence[int]', date: datetime.date | None = None
+) -> dict[str, list[str]]:
     """Возвращает интересы пользователя из кэша. Ошибка при недоступности хранилища.
 
     Args:
         storage: Экземпляр хранилища.
         client_ids: Идентификаторы клиентов.
+        date: Дата, на которую нужны интересы. Если нет, возвращаются текущие интересы.
 
     Returns:
         Список интересов.
@@ -84,11 +143,7 @@ def get_interests(storage: 'StorageInterface', client_ids: list[int]) -> dict[st
     Raises:
         ConnectionError: Если хранилище недоступно.
     """
-    interests: dict[str, list[str]] = {}
-
-    for cid in client_ids:
-        key = f'i:{cid}'
-        data = storage.get(key)
-        interests[str(cid)] = json.loads(data) if data else []
+    if date is not None:
+        return get_interests_as_of(storage, client_ids, date)
 
-    return interests
+    return get_current_interests(storage, client_ids)
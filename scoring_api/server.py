@@ -11,18 +11,51 @@
 
     Запуск с указание порта и файл журнала:
         $ python -m scoring_api.server --port 8081 --log server.log
+
+    Запуск с моделями скоринга из файла конфигурации:
+        $ python -m scoring_api.server --scoring-config scoring.json
+
+    Запуск с четырьмя рабочими процессами и лимитом 100 запросов в секунду на партнера:
+        $ python -m scoring_api.server --workers 4 --rate-limit 100 --rate-burst 200
+
+    Запуск без Memcached, с хранилищем в памяти процесса (для нагрузочных тестов на изолированной машине):
+        $ python -m scoring_api.server --storage memory
+
+    Запуск с журналом запросов медленнее 50 мс (последние и самые медленные - в GET /slow_requests):
+        $ python -m scoring_api.server --slow-request-ms 50
+
+    Запуск с записью 10% запросов для воспроизведения (python -m tests.load.replay):
+        $ python -m scoring_api.server --capture-file traffic.jsonl --capture-sample-rate 0.1
+
+    Выборочный профиль работающего процесса на 30 секунд (повторный сигнал останавливает его раньше):
+        $ kill -USR1 <pid>
 """
 
+import contextlib
 import logging
+import os
+import signal
+import threading
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from typing import TYPE_CHECKING
 
+from scoring_api.access_log import configure_access_log
 from scoring_api.api import APIHandler
+from scoring_api.capture import configure_capture
 from scoring_api.cli import parse_arguments, ServerConfig
-from scoring_api.logger import configure_logger
+from scoring_api.logger import configure_logger, stop_logger
+from scoring_api.metrics import configure_metrics, set_metrics_worker
+from scoring_api.profiling import configure_profiling, get_profiling_session, install_profiling_signals
+from scoring_api.ratelimit import configure_rate_limiter
+from scoring_api.rules import configure_scoring_models
+from scoring_api.slow_log import configure_slow_log
+from scoring_api.storage.instrumented import InstrumentedStorage
 from scoring_api.storage.memcached import MemcacheStorage
+from scoring_api.storage.memory import MemoryStorage
+from scoring_api.timing import configure_server_timing
 
 if TYPE_CHECKING:
+    from types import FrameType
     from typing import Any
 
     from scoring_api.storage.interface import StorageInterface
@@ -31,11 +64,26 @@ if TYPE_CHECKING:
 def run_server(config: ServerConfig, storage: 'StorageInterface') -> None:
     """Запускает сервер API скоринга.
 
+    Если задано несколько рабочих процессов, слушающий сокет создается до `fork`, и все процессы
+    принимают соединения с него. Лимитер частоты запросов и таблица метрик также создаются до `fork`,
+    поэтому лимиты общие для всех процессов, а `/metrics` показывает сумму по всем процессам.
+
     Args:
-        config: Конфигурация, содержащая порт и файл журнала.
-        storage: Экземпляр хранилища.
+        config: Конфигурация сервера (см. `ServerConfig`).
+        storage: Экземпляр хранилища. Соединение должно устанавливаться лениво, после `fork`.
     """
     configure_logger(config.log_file)
+    configure_access_log(config.log_sample_rate)
+    configure_scoring_models(config.scoring_config)
+    configure_rate_limiter(config.rate_limit, config.rate_burst)
+    configure_metrics(config.workers)
+    configure_server_timing(config.server_timing)
+    configure_profiling(config.profile_dir)
+    configure_slow_log(
+        config.slow_request_ms / 1000 if config.slow_request_ms is not None else None, config.slow_request_buffer
+    )
+    configure_capture(config.capture_file, config.capture_sample_rate)
+    storage = InstrumentedStorage(storage)
 
     def handler_factory(*args: 'Any', **kwargs: 'Any') -> BaseHTTPRequestHandler:
         """Фабрика обработчиков для HTTP-сервера.
@@ -50,19 +98,72 @@ def run_server(config: ServerConfig, storage: 'StorageInterface') -> None:
         return APIHandler(*args, storage=storage, **kwargs)
 
     server = HTTPServer(('localhost', config.port), handler_factory)
-    logging.info(f'Starting server at port {config.port}')
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, _interrupt)
+        install_profiling_signals()
+    logging.info('Starting server at port %d', config.port)
 
     try:
-        server.serve_forever()
+        if config.workers > 1:
+            _serve_workers(server, config.workers)
+        else:
+            server.serve_forever()
     except KeyboardInterrupt:
         logging.info('Shutting down server...')
     finally:
         server.server_close()
+        configure_rate_limiter(None)
+        configure_metrics()
+        configure_profiling()
+        configure_capture()
         logging.info('Server stopped.')
 
 
+def _interrupt(signum: int, frame: 'FrameType | None') -> None:  # noqa: ARG001
+    """Обрабатывает SIGTERM так же, как Ctrl+C, чтобы сервер освободил ресурсы."""
+    raise KeyboardInterrupt
+
+
+def _serve_workers(server: HTTPServer, workers: int) -> None:
+    """Запускает рабочие процессы, обслуживающие общий слушающий сокет, и ждет их завершения.
+
+    Args:
+        server: HTTP-сервер с открытым слушающим сокетом.
+        workers: Количество рабочих процессов.
+    """
+    pids = []
+
+    try:
+        for index in range(workers):
+            pid = os.fork()
+            if pid == 0:
+                set_metrics_worker(index)
+                try:
+                    with contextlib.suppress(KeyboardInterrupt):
+                        server.serve_forever()
+                    signal.pthread_sigmask(
+                        signal.SIG_BLOCK, {signal.SIGINT, signal.SIGTERM, signal.SIGUSR1, signal.SIGUSR2}
+                    )
+                    get_profiling_session().stop()
+                    stop_logger()
+                finally:
+                    os._exit(0)
+            pids.append(pid)
+
+        logging.info('Started %d worker processes: %s', workers, pids)
+        for pid in pids:
+            os.waitpid(pid, 0)
+    finally:
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except (ChildProcessError, ProcessLookupError):
+                pass
+
+
 if __name__ == '__main__':
     config = parse_arguments()
-    storage = MemcacheStorage()
+    storage = MemoryStorage() if config.storage == 'memory' else MemcacheStorage()
 
     run_server(config, storage)
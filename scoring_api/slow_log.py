@@ -0,0 +1,212 @@
+"""Журнал медленных запросов.
+
+Если время обработки запроса превысило порог `configure_slow_log`, в журнал пишется одна подробная
+запись: метод, форма аргументов (`nclients`, `has`) и каждое обращение к хранилищу с ключом, временем
+и признаком попадания. Обращения к хранилищу записывает `InstrumentedStorage` в список текущего
+запроса, который хранится в `ContextVar` (как набор измерений в `scoring_api.timing`). Пока журнал
+выключен, список не создается, и запись обращения стоит одной проверки `ContextVar`.
+
+Кроме журнала, записи хранятся в памяти процесса: `SLOW_REQUEST_BUFFER_SIZE` самых медленных
+и столько же последних медленных запросов. Их отдает `GET /slow_requests`; у каждого рабочего
+процесса свой буфер. Маршрут не требует аутентификации, поэтому в его ответе нет учетной записи
+партнера и ключей хранилища (в ключах - идентификаторы клиентов): они есть только в журнале.
+"""
+
+import datetime
+import heapq
+import itertools
+import json
+import logging
+import threading
+from collections import deque
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+from scoring_api.constants import SLOW_REQUEST_BUFFER_SIZE
+
+if TYPE_CHECKING:
+    from contextvars import Token
+    from typing import Any
+
+logger = logging.getLogger('scoring_api.slow')
+
+CONTEXT_FIELDS = ('method', 'account', 'nclients', 'has')  # Поля контекста, которые попадают в запись
+PRIVATE_FIELDS = frozenset({'account', 'key'})  # Поля записи и обращений к хранилищу, скрытые в `/slow_requests`
+
+type StorageCall = tuple[str, str | list[str], float, bool | int | None]  # Операция, ключ(и), время, попадание
+
+
+def _format_call(call: StorageCall) -> dict[str, 'Any']:
+    """Преобразует обращение к хранилищу в словарь записи.
+
+    Для `get_many` вместо одного ключа записываются количество ключей, первый ключ и количество найденных.
+    """
+    operation, key, seconds, hit = call
+    entry: dict[str, Any] = {'operation': operation, 'latency_ms': round(seconds * 1000, 3)}
+    if isinstance(key, list):
+        entry.update(key=key[0] if key else None, keys=len(key), hits=hit)
+    else:
+        entry['key'] = key
+        if hit is not None:
+            entry['hit'] = hit
+    return entry
+
+
+class SlowRequestLog:
+    """Отбирает медленные запросы, пишет их в журнал и хранит последние и самые медленные из них."""
+
+    def __init__(self, threshold: float, capacity: int = SLOW_REQUEST_BUFFER_SIZE) -> None:
+        """Создает пустой журнал медленных запросов.
+
+        Args:
+            threshold: Порог времени обработки запроса, в секундах.
+            capacity: Сколько самых медленных и сколько последних записей хранить.
+        """
+        self.threshold = threshold
+        self.capacity = capacity
+        self._slowest: list[tuple[float, int, dict[str, Any]]] = []
+        self._recent: deque[dict[str, Any]] = deque(maxlen=capacity)
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def record(  # noqa: PLR0913
+        self,
+        context: dict[str, 'Any'],
+        path: str,
+        status_code: int,
+        latency: float,
+        calls: list[StorageCall],
+    ) -> dict[str, 'Any'] | None:
+        """Сохраняет и пишет в журнал запись о запросе, если он медленнее порога.
+
+        Args:
+            context: Контекст запроса.
+            path: Путь запроса.
+            status_code: Код ответа.
+            latency: Время обработки запроса, в секундах.
+            calls: Обращения к хранилищу во время запроса.
+
+        Returns:
+            Запись о медленном запросе или None, если запрос быстрее порога.
+        """
+        if latency < self.threshold:
+            return None
+
+        entry: dict[str, Any] = {
+            'time': datetime.datetime.now(datetime.UTC).isoformat(timespec='milliseconds'),
+            'request_id': context.get('request_id'),
+            'path': path,
+            'status': status_code,
+            'latency_ms': round(latency * 1000, 3),
+        }
+        entry.update((field, context[field]) for field in CONTEXT_FIELDS if field in context)
+        entry['storage_ms'] = round(sum(call[2] for call in calls) * 1000, 3)
+        entry['storage_calls'] = [_format_call(call) for call in calls]
+
+        with self._lock:
+            self._recent.append(entry)
+            item = (latency, next(self._sequence), entry)
+            if len(self._slowest) < self.capacity:
+                heapq.heappush(self._slowest, item)
+            elif self.capacity:
+                heapq.heappushpop(self._slowest, item)
+
+        logger.warning('Slow request: %s', json.dumps(entry, ensure_ascii=False, separators=(',', ':'), default=str))
+        return entry
+
+    def slowest(self) -> list[dict[str, 'Any']]:
+        """Возвращает самые медленные записи, от самой медленной."""
+        with self._lock:
+            return [entry for _, _, entry in sorted(self._slowest, reverse=True)]
+
+    def recent(self) -> list[dict[str, 'Any']]:
+        """Возвращает последние записи, от самой новой."""
+        with self._lock:
+            return list(reversed(self._recent))
+
+
+_slow_log: SlowRequestLog | None = None
+_current_calls: ContextVar[list[StorageCall] | None] = ContextVar('storage_calls', default=None)
+
+
+def configure_slow_log(threshold: float | None = None, capacity: int = SLOW_REQUEST_BUFFER_SIZE) -> None:
+    """Включает журнал медленных запросов.
+
+    Args:
+        threshold: Порог времени обработки запроса, в секундах. Если None, журнал выключен.
+        capacity: Сколько самых медленных и сколько последних записей хранить.
+    """
+    global _slow_log  # noqa: PLW0603
+    _slow_log = SlowRequestLog(threshold, capacity) if threshold is not None else None
+
+
+def get_slow_log() -> SlowRequestLog | None:
+    """Возвращает журнал медленных запросов или None, если он выключен."""
+    return _slow_log
+
+
+def start_slow_log() -> 'Token[list[StorageCall] | None] | None':
+    """Начинает записывать обращения к хранилищу для текущего запроса, если журнал включен.
+
+    Returns:
+        Токен для `stop_slow_log` или None, если журнал выключен.
+    """
+    return _current_calls.set([]) if _slow_log is not None else None
+
+
+def record_storage_call(operation: str, key: str | list[str], seconds: float, hit: bool | int | None) -> None:
+    """Записывает обращение к хранилищу для текущего запроса, если журнал включен.
+
+    Args:
+        operation: Операция хранилища.
+        key: Ключ или список ключей (`get_many`).
+        seconds: Время обращения.
+        hit: Найдено ли значение (для `get_many` - количество найденных), None для записи.
+    """
+    calls = _current_calls.get()
+    if calls is not None:
+        calls.append((operation, key, seconds, hit))
+
+
+def stop_slow_log(token: 'Token[list[StorageCall] | None]') -> None:
+    """Заканчивает запись обращений к хранилищу, начатую `start_slow_log`."""
+    _current_calls.reset(token)
+
+
+def log_slow_request(context: dict[str, 'Any'], path: str, status_code: int, latency: float) -> None:
+    """Сохраняет запрос с обращениями к хранилищу, если журнал включен и запрос медленнее порога.
+
+    Args:
+        context: Контекст запроса.
+        path: Путь запроса.
+        status_code: Код ответа.
+        latency: Время обработки запроса, в секундах.
+    """
+    calls = _current_calls.get()
+    if _slow_log is not None and calls is not None:
+        _slow_log.record(context, path, status_code, latency, calls)
+
+
+def public_entry(entry: dict[str, 'Any']) -> dict[str, 'Any']:
+    """Возвращает запись без учетной записи партнера и ключей хранилища (`PRIVATE_FIELDS`)."""
+    public = {field: value for field, value in entry.items() if field not in PRIVATE_FIELDS}
+    public['storage_calls'] = [
+        {field: value for field, value in call.items() if field not in PRIVATE_FIELDS}
+        for call in entry.get('storage_calls', [])
+    ]
+    return public
+
+
+def render_slow_requests() -> str:
+    """Возвращает самые медленные и последние медленные запросы процесса в формате JSON (см. `public_entry`)."""
+    if _slow_log is None:
+        return json.dumps({'threshold_ms': None, 'slowest': [], 'recent': []})
+    return json.dumps(
+        {
+            'threshold_ms': round(_slow_log.threshold * 1000, 3),
+            'slowest': [public_entry(entry) for entry in _slow_log.slowest()],
+            'recent': [public_entry(entry) for entry in _slow_log.recent()],
+        },
+        ensure_ascii=False,
+        default=str,
+    )
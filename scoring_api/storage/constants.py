@@ -3,3 +3,5 @@
 DEFAULT_CACHE_EXPIRATION_SECONDS = 3600  # Время жизни кэша (в секундах)
 DEFAULT_STORAGE_MAX_RETRIES = 5  # Максимальное количество попыток запроса к хранилищу
 DEFAULT_STORAGE_RETRY_DELAY_SECONDS = 0.1  # Задержка между повторными запросами (в секундах)
+NO_EXPIRATION = 0  # Значение времени жизни для записей, которые не должны истекать
+STORAGE_LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)  # Секунды
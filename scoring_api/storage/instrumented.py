@@ -0,0 +1,83 @@
+"""Обертка хранилища, которая записывает метрики обращений."""
+
+import time
+from typing import TYPE_CHECKING
+
+from scoring_api.slow_log import record_storage_call
+from scoring_api.storage.constants import DEFAULT_CACHE_EXPIRATION_SECONDS
+from scoring_api.storage.interface import StorageInterface
+from scoring_api.storage.metrics import CACHE_REQUESTS, STORAGE_DURATION
+from scoring_api.timing import add_phase_time
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_GET = ('get',)
+_GET_MANY = ('get_many',)
+_CACHE_GET = ('cache_get',)
+_CACHE_SET = ('cache_set',)
+_HIT = ('hit',)
+_MISS = ('miss',)
+
+
+class InstrumentedStorage(StorageInterface):
+    """Хранилище, которое передает обращения другому хранилищу и измеряет их время.
+
+    Для `cache_get` дополнительно считаются попадания и промахи кэша. Ошибки и повторные подключения
+    считает само хранилище (см. `scoring_api.storage.metrics`). Время обращений добавляется к этапу
+    `storage` текущего запроса (см. `scoring_api.timing`), а сами обращения - в журнал медленных
+    запросов (см. `scoring_api.slow_log`).
+    """
+
+    def __init__(self, storage: StorageInterface) -> None:
+        """Оборачивает хранилище.
+
+        Args:
+            storage: Хранилище, которому передаются обращения.
+        """
+        self.storage = storage
+
+    def get(self, key: str) -> str | None:
+        """Получает значение из хранилища."""
+        started = time.perf_counter()
+        value = None
+        try:
+            value = self.storage.get(key)
+            return value
+        finally:
+            self._observe(started, _GET, key, value is not None)
+
+    def get_many(self, keys: 'Iterable[str]') -> dict[str, str]:
+        """Получает несколько значений из хранилища за одно обращение."""
+        keys = list(keys)
+        started = time.perf_counter()
+        values: dict[str, str] = {}
+        try:
+            values = self.storage.get_many(keys)
+            return values
+        finally:
+            self._observe(started, _GET_MANY, keys, len(values))
+
+    def cache_get(self, key: str) -> str | None:
+        """Получает значение из кэша."""
+        started = time.perf_counter()
+        value = self.storage.cache_get(key)
+        self._observe(started, _CACHE_GET, key, value is not None)
+        CACHE_REQUESTS.inc(_MISS if value is None else _HIT)
+        return value
+
+    def cache_set(self, key: str, value: str | int | float, expire: int = DEFAULT_CACHE_EXPIRATION_SECONDS) -> None:
+        """Устанавливает значение в кэше с временем жизни."""
+        started = time.perf_counter()
+        try:
+            self.storage.cache_set(key, value, expire)
+        finally:
+            self._observe(started, _CACHE_SET, key, None)
+
+    @staticmethod
+    def _observe(started: float, operation: tuple[str], key: str | list[str], hit: bool | int | None) -> None:
+        """Записывает время обращения в метрики, в этап `storage` и в журнал медленных запросов."""
+        elapsed = time.perf_counter() - started
+        STORAGE_DURATION.observe(elapsed, operation)
+        add_phase_time('storage', elapsed)
+        record_storage_call(operation[0], key, elapsed, hit)
@@ -1,9 +1,13 @@
 """Интерфейс для реализации различных хранилищ."""
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 from scoring_api.storage.constants import DEFAULT_CACHE_EXPIRATION_SECONDS
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 
 class StorageInterface(ABC):
     """Интерфейс хранилища для абстрагирования доступа к кэшу."""
@@ -13,6 +17,21 @@ class StorageInterface(ABC):
         """Получает значение из хранилища."""
         pass
 
+    def get_many(self, keys: 'Iterable[str]') -> dict[str, str]:
+        """Получает несколько значений из хранилища за одно обращение.
+
+        Реализация по умолчанию запрашивает ключи по одному; хранилища с пакетным чтением ее переопределяют.
+
+        Returns:
+            Значения найденных ключей. Отсутствующие ключи в результат не попадают.
+        """
+        values = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                values[key] = value
+        return values
+
     @abstractmethod
     def cache_get(self, key: str) -> str | None:
         """Получает значение из кэша, не выбрасывая ошибку при недоступности хранилища."""
@@ -2,6 +2,7 @@
 
 import logging
 import time
+from typing import TYPE_CHECKING
 
 from pymemcache.client.base import Client
 from pymemcache.exceptions import MemcacheError
@@ -12,6 +13,10 @@ from scoring_api.storage.constants import (
     DEFAULT_STORAGE_RETRY_DELAY_SECONDS,
 )
 from scoring_api.storage.interface import StorageInterface
+from scoring_api.storage.metrics import STORAGE_ERRORS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 logger = logging.getLogger(__name__)
 
@@ -54,21 +59,38 @@ class MemcacheStorage(StorageInterface):
     def get(self, key: str) -> str | None:
         """Получает значение из хранилища. Выбрасывает ошибку при недоступности."""
         if self.client is None:
+            STORAGE_ERRORS.inc(('get',))
             raise ConnectionError('Memcached is unavailable.')
 
         try:
             value = self.client.get(key)
             return value.decode('utf-8') if value else None
         except MemcacheError as error:
+            STORAGE_ERRORS.inc(('get',))
             logger.error(f'Error getting key {key} from Memcached: {error}')
             raise
 
+    def get_many(self, keys: 'Iterable[str]') -> dict[str, str]:
+        """Получает несколько значений из хранилища одной командой. Выбрасывает ошибку при недоступности."""
+        if self.client is None:
+            STORAGE_ERRORS.inc(('get_many',))
+            raise ConnectionError('Memcached is unavailable.')
+
+        try:
+            values = self.client.get_many(keys)
+            return {key: value.decode('utf-8') for key, value in values.items() if value}
+        except MemcacheError as error:
+            STORAGE_ERRORS.inc(('get_many',))
+            logger.error(f'Error getting keys from Memcached: {error}')
+            raise
+
     def cache_get(self, key: str) -> str | None:
         """Получает значение из кэша. Не выбрасывает ошибку при недоступности."""
         try:
             value = self.client.get(key)
             return value.decode() if isinstance(value, bytes) else value
         except Exception as error:
+            STORAGE_ERRORS.inc(('cache_get',))
             logging.error(f'Memcached error: {error}')
             return None
 
@@ -80,4 +102,5 @@ class MemcacheStorage(StorageInterface):
         try:
             self.client.set(key, str(value), ttl)
         except MemcacheError as error:
+            STORAGE_ERRORS.inc(('cache_set',))
             logger.error(f'Error setting key {key} in Memcached: {error}')
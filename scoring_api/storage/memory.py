@@ -0,0 +1,39 @@
+"""Модуль реализации хранилища в памяти процесса.
+
+Используется в тестах и для локального запуска без Memcached.
+"""
+
+import time
+
+from scoring_api.storage.constants import DEFAULT_CACHE_EXPIRATION_SECONDS, NO_EXPIRATION
+from scoring_api.storage.interface import StorageInterface
+
+
+class MemoryStorage(StorageInterface):
+    """Реализация хранилища на основе словаря в памяти процесса."""
+
+    def __init__(self) -> None:
+        """Создает пустое хранилище."""
+        self._data: dict[str, tuple[str, float | None]] = {}
+
+    def get(self, key: str) -> str | None:
+        """Получает значение из хранилища."""
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        value, expires_at = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            return None
+
+        return value
+
+    def cache_get(self, key: str) -> str | None:
+        """Получает значение из кэша."""
+        return self.get(key)
+
+    def cache_set(self, key: str, value: str | int | float, expire: int = DEFAULT_CACHE_EXPIRATION_SECONDS) -> None:
+        """Сохраняет значение с временем жизни. Значение `NO_EXPIRATION` означает бессрочное хранение."""
+        expires_at = None if expire == NO_EXPIRATION else time.monotonic() + expire
+        self._data[key] = (str(value), expires_at)
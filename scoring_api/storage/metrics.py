@@ -0,0 +1,19 @@
+"""Метрики обращений к хранилищу."""
+
+from scoring_api.metrics import REGISTRY
+from scoring_api.storage.constants import STORAGE_LATENCY_BUCKETS
+
+STORAGE_OPERATIONS = ('get', 'get_many', 'cache_get', 'cache_set')
+
+STORAGE_DURATION = REGISTRY.histogram(
+    'scoring_api_storage_operation_duration_seconds',
+    'Storage operation time by operation.',
+    STORAGE_LATENCY_BUCKETS,
+    {'operation': STORAGE_OPERATIONS},
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    'scoring_api_storage_cache_requests_total', 'Cache lookups by result.', {'result': ('hit', 'miss')}
+)
+STORAGE_ERRORS = REGISTRY.counter(
+    'scoring_api_storage_errors_total', 'Storage errors by operation.', {'operation': STORAGE_OPERATIONS}
+)
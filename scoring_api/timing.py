@@ -0,0 +1,135 @@
+"""Измерение времени этапов обработки запроса.
+
+Код обработки оборачивает этапы в `with phase('<этап>'):`. Если для запроса включено измерение
+(`start_timing`), время этапов суммируется в `PhaseTimer` текущего запроса, который хранится
+в `ContextVar`, поэтому его не нужно передавать через аргументы функций. Если измерение выключено,
+`phase` возвращает общий пустой контекстный менеджер и стоит порядка сотни наносекунд.
+
+Результат добавляется в контекст запроса и заголовок ответа `Server-Timing`, по которому клиент видит,
+на какой этап ушло время.
+"""
+
+import time
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from contextvars import Token
+    from types import TracebackType
+
+
+class PhaseTimer:
+    """Суммарное время этапов одного запроса, в секундах."""
+
+    __slots__ = ('timings',)
+
+    def __init__(self) -> None:
+        """Создает пустой набор измерений."""
+        self.timings: dict[str, float] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        """Добавляет время к этапу."""
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def milliseconds(self) -> dict[str, float]:
+        """Возвращает время этапов в миллисекундах."""
+        return {name: round(seconds * 1000, 3) for name, seconds in self.timings.items()}
+
+    def server_timing(self) -> str:
+        """Возвращает значение заголовка `Server-Timing`."""
+        return ', '.join(f'{name};dur={duration}' for name, duration in self.milliseconds().items())
+
+
+class _Phase:
+    """Контекстный менеджер, измеряющий время одного этапа."""
+
+    __slots__ = ('name', 'started', 'timer')
+
+    def __init__(self, timer: PhaseTimer, name: str) -> None:
+        self.timer = timer
+        self.name = name
+        self.started = 0.0
+
+    def __enter__(self) -> None:
+        self.started = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: 'TracebackType | None',
+    ) -> None:
+        self.timer.add(self.name, time.perf_counter() - self.started)
+
+
+class _NoPhase:
+    """Пустой контекстный менеджер для выключенного измерения."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: 'TracebackType | None',
+    ) -> None:
+        pass
+
+
+_NO_PHASE = _NoPhase()
+_current_timer: ContextVar[PhaseTimer | None] = ContextVar('phase_timer', default=None)
+_enabled = False
+
+
+def configure_server_timing(enabled: bool) -> None:
+    """Включает или выключает измерение этапов запросов и заголовок `Server-Timing`."""
+    global _enabled  # noqa: PLW0603
+    _enabled = enabled
+
+
+def server_timing_enabled() -> bool:
+    """Проверяет, включено ли измерение этапов запросов."""
+    return _enabled
+
+
+def current_timer() -> PhaseTimer | None:
+    """Возвращает набор измерений текущего запроса или None, если измерение выключено."""
+    return _current_timer.get()
+
+
+def add_phase_time(name: str, seconds: float) -> None:
+    """Добавляет уже измеренное время к этапу текущего запроса, если измерение включено."""
+    timer = _current_timer.get()
+    if timer is not None:
+        timer.add(name, seconds)
+
+
+def phase(name: str) -> _Phase | _NoPhase:
+    """Возвращает контекстный менеджер, измеряющий время этапа текущего запроса.
+
+    Args:
+        name: Название этапа (токен заголовка `Server-Timing`: латиница, цифры, `_`).
+
+    Returns:
+        Контекстный менеджер; если измерение выключено - общий пустой менеджер.
+    """
+    timer = _current_timer.get()
+    return _NO_PHASE if timer is None else _Phase(timer, name)
+
+
+def start_timing() -> tuple[PhaseTimer, 'Token[PhaseTimer | None]']:
+    """Включает измерение этапов для текущего запроса.
+
+    Returns:
+        Набор измерений запроса и токен для `stop_timing`.
+    """
+    timer = PhaseTimer()
+    return timer, _current_timer.set(timer)
+
+
+def stop_timing(token: 'Token[PhaseTimer | None]') -> None:
+    """Выключает измерение этапов, включенное `start_timing`."""
+    _current_timer.reset(token)
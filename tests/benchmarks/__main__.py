@@ -0,0 +1,62 @@
+"""Запуск микробенчмарков горячего пути обработки запроса.
+
+Использование:
+    $ python -m tests.benchmarks
+    $ python -m tests.benchmarks -k requests. --output results.json
+"""
+
+import importlib
+import json
+import pkgutil
+import sys
+from argparse import ArgumentParser
+
+from tests import benchmarks
+from tests.benchmarks.runner import DEFAULT_MIN_TIME, DEFAULT_REPEAT, environment, format_time, run_benchmarks
+
+DEFAULT_OUTPUT = 'benchmark-results.json'
+
+
+def load_benchmarks() -> None:
+    """Импортирует модули `bench_*.py`, которые регистрируют бенчмарки."""
+    for module in pkgutil.iter_modules(benchmarks.__path__):
+        if module.name.startswith('bench_'):
+            importlib.import_module(f'{benchmarks.__name__}.{module.name}')
+
+
+def main() -> None:
+    """Запускает бенчмарки, выводит таблицу результатов и записывает их в JSON."""
+    parser = ArgumentParser(description='Scoring API micro-benchmarks')
+    parser.add_argument('-k', '--filter', default='', help='Run benchmarks whose name contains this substring')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT, help=f'Results JSON file (default: {DEFAULT_OUTPUT})')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help=f'Samples per benchmark ({DEFAULT_REPEAT})')
+    parser.add_argument(
+        '--min-time', type=float, default=DEFAULT_MIN_TIME, help=f'Minimal sample duration, s ({DEFAULT_MIN_TIME})'
+    )
+    args = parser.parse_args()
+
+    if args.repeat < 2:  # noqa: PLR2004
+        parser.error('--repeat must be at least 2')
+
+    load_benchmarks()
+    results = run_benchmarks(args.filter, args.repeat, args.min_time)
+    if not results:
+        parser.error(f'No benchmarks match {args.filter!r}')
+
+    width = max(len(result.name) for result in results)
+    sys.stdout.write(f'{"benchmark":<{width}}  {"median":>12}  {"mean":>12}  {"stdev":>12}\n')
+    for result in results:
+        sys.stdout.write(
+            f'{result.name:<{width}}  {format_time(result.median):>12}  {format_time(result.mean):>12}'
+            f'  {format_time(result.stdev):>12}\n'
+        )
+
+    with open(args.output, 'w', encoding='utf-8') as output:
+        json.dump(
+            {'environment': environment(), 'benchmarks': [result.as_dict() for result in results]}, output, indent=2
+        )
+    sys.stdout.write(f'Results written to {args.output}\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Бенчмарки `APIHandler`: разбор и сериализация JSON и обработка POST-запроса целиком, без сети."""
+
+import io
+import json
+from http.client import HTTPMessage
+from typing import TYPE_CHECKING
+
+from scoring_api.api import APIHandler
+from scoring_api.decoder import decode_json_object
+from scoring_api.interests import interests_key
+from scoring_api.storage.constants import NO_EXPIRATION
+from scoring_api.storage.instrumented import InstrumentedStorage
+from scoring_api.storage.memory import MemoryStorage
+from tests.benchmarks.payloads import client_ids, client_interests, clients_interests_request, online_score_request
+from tests.benchmarks.runner import benchmark
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from scoring_api.storage.interface import StorageInterface
+
+
+class _InProcessHandler(APIHandler):
+    """`APIHandler`, который читает запрос из памяти и пишет ответ в память вместо сокета."""
+
+    def __init__(self, storage: 'StorageInterface', path: str, body: bytes) -> None:  # noqa: D107
+        self.storage = storage
+        self.path = path
+        self.body = body
+        self.command = 'POST'
+        self.request_version = 'HTTP/1.1'
+        self.requestline = f'POST {path} HTTP/1.1'
+        self.client_address = ('127.0.0.1', 0)
+        self.headers = HTTPMessage()
+        self.headers['Content-Length'] = str(len(body))
+
+    def post(self) -> bytes:
+        """Обрабатывает запрос и возвращает ответ вместе с заголовками."""
+        self.rfile = io.BytesIO(self.body)
+        self.wfile = io.BytesIO()
+        self.do_POST()
+        return self.wfile.getvalue()
+
+
+def _storage(count: int) -> InstrumentedStorage:
+    """Возвращает хранилище в памяти с интересами `count` клиентов, обернутое как на сервере."""
+    storage = MemoryStorage()
+    for cid in client_ids(count):
+        storage.cache_set(interests_key(cid), json.dumps(client_interests(cid)), NO_EXPIRATION)
+    return InstrumentedStorage(storage)
+
+
+@benchmark('api.decode_request')
+def decode_request() -> 'Callable[[], object]':
+    """Разбор тела запроса `clients_interests` для 100 клиентов."""
+    raw = json.dumps(clients_interests_request(100)).encode('utf-8')
+    return lambda: decode_json_object(raw)
+
+
+@benchmark('api.encode_response')
+def encode_response() -> 'Callable[[], object]':
+    """Сериализация ответа `clients_interests` для 100 клиентов."""
+    response = {'code': 200, 'response': {str(cid): client_interests(cid) for cid in client_ids(100)}}
+    return lambda: json.dumps(response).encode('utf-8')
+
+
+@benchmark('api.post_online_score')
+def post_online_score() -> 'Callable[[], object]':
+    """POST-запрос `online_score` целиком, с оценкой в кэше."""
+    handler = _InProcessHandler(_storage(0), '/method', json.dumps(online_score_request()).encode('utf-8'))
+    return handler.post
+
+
+@benchmark('api.post_clients_interests_100')
+def post_clients_interests_100() -> 'Callable[[], object]':
+    """POST-запрос `clients_interests` для 100 клиентов целиком."""
+    handler = _InProcessHandler(_storage(100), '/method', json.dumps(clients_interests_request(100)).encode('utf-8'))
+    return handler.post
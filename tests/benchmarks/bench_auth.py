@@ -0,0 +1,38 @@
+"""Бенчмарки аутентификации."""
+
+from typing import TYPE_CHECKING
+
+from scoring_api.auth import generate_auth_token, is_authenticated
+from scoring_api.requests.requests import MethodRequest
+from tests.benchmarks.payloads import ACCOUNT, LOGIN, online_score_request
+from tests.benchmarks.runner import benchmark
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _validated_request(admin: bool) -> MethodRequest:
+    """Возвращает проверенный запрос `online_score`."""
+    request = MethodRequest(online_score_request(admin))
+    request.is_valid()
+    return request
+
+
+@benchmark('auth.is_authenticated_user')
+def is_authenticated_user() -> 'Callable[[], object]':
+    """Проверка токена пользователя, уже проверенного раньше (основной случай под нагрузкой)."""
+    request = _validated_request(admin=False)
+    return lambda: is_authenticated(request)
+
+
+@benchmark('auth.is_authenticated_admin')
+def is_authenticated_admin() -> 'Callable[[], object]':
+    """Проверка токена администратора."""
+    request = _validated_request(admin=True)
+    return lambda: is_authenticated(request)
+
+
+@benchmark('auth.generate_auth_token')
+def generate_token() -> 'Callable[[], object]':
+    """Расчет токена пользователя (первая проверка токена)."""
+    return lambda: generate_auth_token(LOGIN, ACCOUNT)
@@ -0,0 +1,42 @@
+"""Бенчмарки проверки полей запросов."""
+
+from typing import TYPE_CHECKING
+
+from scoring_api.requests.requests import (
+    ClientsInterestsRequest,
+    ClientsInterestsTopRequest,
+    MethodRequest,
+    OnlineScoreRequest,
+)
+from tests.benchmarks.payloads import client_ids, clients_interests_request, ONLINE_SCORE_ARGUMENTS
+from tests.benchmarks.runner import benchmark
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@benchmark('requests.method_request')
+def method_request() -> 'Callable[[], object]':
+    """Проверка общего запроса метода."""
+    body = clients_interests_request(10)
+    return lambda: MethodRequest(body).is_valid()
+
+
+@benchmark('requests.online_score_request')
+def online_score_request() -> 'Callable[[], object]':
+    """Проверка аргументов `online_score` со всеми полями."""
+    return lambda: OnlineScoreRequest(ONLINE_SCORE_ARGUMENTS).is_valid()
+
+
+@benchmark('requests.clients_interests_request_100')
+def clients_interests_request_100() -> 'Callable[[], object]':
+    """Проверка аргументов `clients_interests` для 100 клиентов на дату."""
+    arguments = {'client_ids': client_ids(100), 'date': '20.07.2017'}
+    return lambda: ClientsInterestsRequest(arguments).is_valid()
+
+
+@benchmark('requests.clients_interests_top_request_100')
+def clients_interests_top_request_100() -> 'Callable[[], object]':
+    """Проверка аргументов `clients_interests_top` для 100 клиентов."""
+    arguments = {'client_ids': client_ids(100), 'limit': 5}
+    return lambda: ClientsInterestsTopRequest(arguments).is_valid()
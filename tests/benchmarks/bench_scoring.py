@@ -0,0 +1,81 @@
+"""Бенчмарки расчета оценки и чтения интересов."""
+
+import json
+from typing import TYPE_CHECKING
+
+from scoring_api.interests import interests_key
+from scoring_api.keys import score_key
+from scoring_api.rules import DEFAULT_SCORING_MODEL
+from scoring_api.scoring import get_interests, get_score
+from scoring_api.storage.constants import DEFAULT_CACHE_EXPIRATION_SECONDS, NO_EXPIRATION
+from scoring_api.storage.memory import MemoryStorage
+from tests.benchmarks.payloads import client_ids, client_interests, SCORE_FIELDS
+from tests.benchmarks.runner import benchmark
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class _NoCacheStorage(MemoryStorage):
+    """Хранилище в памяти, которое не сохраняет оценки: каждый расчет - промах кэша."""
+
+    def cache_set(self, key: str, value: str | int | float, expire: int = DEFAULT_CACHE_EXPIRATION_SECONDS) -> None:
+        """Ничего не сохраняет."""
+
+
+def _interests_storage(count: int) -> MemoryStorage:
+    """Возвращает хранилище в памяти с интересами `count` клиентов."""
+    storage = MemoryStorage()
+    for cid in client_ids(count):
+        storage.cache_set(interests_key(cid), json.dumps(client_interests(cid)), NO_EXPIRATION)
+    return storage
+
+
+@benchmark('scoring.score_key')
+def score_key_derivation() -> 'Callable[[], object]':
+    """Расчет ключа кэша оценки."""
+    fields = SCORE_FIELDS
+    return lambda: score_key(fields['first_name'], fields['last_name'], fields['phone'], fields['birthday'])
+
+
+@benchmark('scoring.evaluate')
+def evaluate() -> 'Callable[[], object]':
+    """Расчет оценки моделью по умолчанию без кэша."""
+    fields = SCORE_FIELDS
+    return lambda: DEFAULT_SCORING_MODEL.evaluate(
+        fields['phone'],
+        fields['email'],
+        fields['birthday'],
+        fields['gender'],
+        fields['first_name'],
+        fields['last_name'],
+    )
+
+
+@benchmark('scoring.get_score_cache_hit')
+def get_score_cache_hit() -> 'Callable[[], object]':
+    """`get_score`, когда оценка есть в кэше."""
+    storage = MemoryStorage()
+    get_score(storage, **SCORE_FIELDS)
+    return lambda: get_score(storage, **SCORE_FIELDS)
+
+
+@benchmark('scoring.get_score_cache_miss')
+def get_score_cache_miss() -> 'Callable[[], object]':
+    """`get_score`, когда оценки нет в кэше: чтение обоих ключей, расчет и запись."""
+    storage = _NoCacheStorage()
+    return lambda: get_score(storage, **SCORE_FIELDS)
+
+
+@benchmark('scoring.get_interests_10')
+def get_interests_10() -> 'Callable[[], object]':
+    """Текущие интересы 10 клиентов из хранилища в памяти."""
+    storage, ids = _interests_storage(10), client_ids(10)
+    return lambda: get_interests(storage, ids)
+
+
+@benchmark('scoring.get_interests_1000')
+def get_interests_1000() -> 'Callable[[], object]':
+    """Текущие интересы 1000 клиентов из хранилища в памяти."""
+    storage, ids = _interests_storage(1000), client_ids(1000)
+    return lambda: get_interests(storage, ids)
@@ -0,0 +1,267 @@
+"""Сравнение результатов бенчмарков с базовым запуском.
+
+Базовый запуск - это файл результатов `python -m tests.benchmarks` (и, при необходимости, отчет
+`python -m tests.load -o`), записанный на эталонной машине и сохраненный в репозитории. Текущий запуск
+сравнивается с ним по каждому бенчмарку:
+
+    - изменение - отношение медиан текущего и базового запусков; у пропускной способности (`load.rps`)
+      больше - лучше, у времени - меньше;
+    - значимость - двусторонний критерий Манна-Уитни по замерам обоих запусков. Медиана и ранговый
+      критерий не чувствительны к отдельным выбросам, которые дают планировщик и сборщик мусора;
+    - регрессия - ухудшение больше порога шума (`--threshold`, для групп - `--limit`), значимое на уровне
+      `--alpha`. У показателей с одним значением (перцентили задержки нагрузочного теста) значимость
+      не проверяется, учитывается только порог.
+
+Если найдена регрессия, программа завершается с кодом 1. Базовый запуск записывается командой
+`make bench-baseline`; без него сравнение завершается ошибкой с подсказкой.
+
+Использование:
+    $ python -m tests.benchmarks.compare tests/benchmarks/baseline.json benchmark-results.json
+    $ python -m tests.benchmarks.compare baseline.json results.json --load-baseline load-base.json --load load.json
+"""
+
+import json
+import math
+import os
+import statistics
+import sys
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+DEFAULT_THRESHOLD = 0.1  # Изменение медианы, которое считается шумом
+DEFAULT_ALPHA = 0.01  # Уровень значимости критерия Манна-Уитни
+LOAD_LATENCY_FIELDS = ('p50_ms', 'p99_ms')  # Перцентили задержки нагрузочного теста, которые сравниваются
+
+
+class Verdict(Enum):
+    """Итог сравнения бенчмарка с базовым запуском."""
+
+    REGRESSION = 'regression'
+    IMPROVEMENT = 'improvement'
+    UNCHANGED = 'unchanged'
+    NEW = 'new'  # Нет в базовом запуске
+    MISSING = 'missing'  # Нет в текущем запуске
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """Замеры одного показателя."""
+
+    name: str
+    samples: list[float]
+    higher_is_better: bool = False
+
+    @property
+    def median(self) -> float:
+        """Медиана замеров."""
+        return statistics.median(self.samples)
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Сравнение показателя с базовым запуском."""
+
+    name: str
+    verdict: Verdict
+    baseline: float | None = None
+    current: float | None = None
+    change: float | None = None  # Относительное ухудшение: > 0 - хуже, < 0 - лучше
+    p_value: float | None = None
+    limit: float = DEFAULT_THRESHOLD
+
+
+def mann_whitney_u(first: 'Sequence[float]', second: 'Sequence[float]') -> float:
+    """Возвращает p-значение двустороннего критерия Манна-Уитни (нормальное приближение с поправками).
+
+    Args:
+        first: Замеры первой выборки.
+        second: Замеры второй выборки.
+
+    Returns:
+        Вероятность получить такое или большее различие рангов, если распределения выборок совпадают.
+    """
+    n1, n2 = len(first), len(second)
+    if not n1 or not n2:
+        return 1.0
+
+    values = sorted([(value, 0) for value in first] + [(value, 1) for value in second])
+    n = n1 + n2
+    rank_sum = 0.0
+    ties = 0.0
+    index = 0
+    while index < n:
+        end = index
+        while end + 1 < n and values[end + 1][0] == values[index][0]:
+            end += 1
+        rank = (index + end) / 2 + 1  # Средний ранг группы одинаковых значений
+        group = end - index + 1
+        rank_sum += rank * sum(1 for position in range(index, end + 1) if values[position][1] == 0)
+        ties += group**3 - group
+        index = end + 1
+
+    u = rank_sum - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+
+    z = (abs(u - mean) - 0.5) / math.sqrt(variance)
+    return min(1.0, 2 * (1 - statistics.NormalDist().cdf(max(z, 0.0))))
+
+
+def compare(
+    baseline: 'Mapping[str, Measurement]',
+    current: 'Mapping[str, Measurement]',
+    threshold: float = DEFAULT_THRESHOLD,
+    alpha: float = DEFAULT_ALPHA,
+    limits: 'Mapping[str, float] | None' = None,
+) -> list[Comparison]:
+    """Сравнивает показатели текущего запуска с базовым.
+
+    Args:
+        baseline: Показатели базового запуска по именам.
+        current: Показатели текущего запуска по именам.
+        threshold: Порог шума - относительное изменение медианы, которое не считается изменением.
+        alpha: Уровень значимости.
+        limits: Пороги для показателей, имя которых начинается с ключа (побеждает самый длинный ключ).
+
+    Returns:
+        Сравнения в порядке имен показателей.
+    """
+    limits = limits or {}
+    comparisons = []
+
+    for name in sorted(baseline.keys() | current.keys()):
+        limit = max(
+            ((len(prefix), value) for prefix, value in limits.items() if name.startswith(prefix)),
+            default=(0, threshold),
+        )[1]
+        base, new = baseline.get(name), current.get(name)
+        if base is None or new is None:
+            comparisons.append(Comparison(name, Verdict.NEW if base is None else Verdict.MISSING, limit=limit))
+            continue
+
+        change = _relative_change(base.median, new.median, new.higher_is_better)
+        p_value = mann_whitney_u(base.samples, new.samples) if min(len(base.samples), len(new.samples)) > 1 else None
+        significant = p_value is None or p_value < alpha
+
+        if change > limit and significant:
+            verdict = Verdict.REGRESSION
+        elif change < -limit and significant:
+            verdict = Verdict.IMPROVEMENT
+        else:
+            verdict = Verdict.UNCHANGED
+        comparisons.append(Comparison(name, verdict, base.median, new.median, change, p_value, limit))
+
+    return comparisons
+
+
+def _relative_change(baseline: float, current: float, higher_is_better: bool) -> float:
+    """Возвращает относительное ухудшение показателя: > 0 - хуже, < 0 - лучше."""
+    worse, better = (baseline, current) if higher_is_better else (current, baseline)
+    if better == 0:
+        return 0.0 if worse == 0 else math.inf
+    return worse / better - 1
+
+
+def load_benchmarks(path: str) -> dict[str, Measurement]:
+    """Читает результаты `python -m tests.benchmarks`."""
+    with open(path, encoding='utf-8') as results:
+        data = json.load(results)
+    return {item['name']: Measurement(item['name'], item['samples']) for item in data['benchmarks']}
+
+
+def load_load_report(path: str) -> dict[str, Measurement]:
+    """Читает отчет `python -m tests.load`: пропускная способность по окнам и перцентили задержки."""
+    with open(path, encoding='utf-8') as results:
+        data = json.load(results)
+    measurements = {'load.rps': Measurement('load.rps', data['rps_samples'], higher_is_better=True)}
+    for field in LOAD_LATENCY_FIELDS:
+        measurements[f'load.{field}'] = Measurement(f'load.{field}', [data['total'][field]])
+    return measurements
+
+
+def format_report(comparisons: 'Sequence[Comparison]') -> str:
+    """Возвращает сравнения в виде таблицы, сгруппированной по первой части имени показателя."""
+    width = max([len(comparison.name) for comparison in comparisons] + [len('benchmark')])
+    lines = [f'{"benchmark":<{width}}  {"baseline":>12}  {"current":>12}  {"change":>8}  {"p-value":>8}  verdict']
+    group = None
+    for comparison in comparisons:
+        if comparison.name.split('.')[0] != group:
+            group = comparison.name.split('.')[0]
+            lines.append(f'[{group}]')
+        lines.append(
+            f'{comparison.name:<{width}}  {_format_number(comparison.baseline):>12}  '
+            f'{_format_number(comparison.current):>12}  '
+            f'{"" if comparison.change is None else f"{comparison.change:+.1%}":>8}  '
+            f'{"" if comparison.p_value is None else f"{comparison.p_value:.4f}":>8}  {comparison.verdict.value}'
+            + (f' (limit {comparison.limit:.0%})' if comparison.verdict is Verdict.REGRESSION else '')
+        )
+
+    regressions = sum(1 for comparison in comparisons if comparison.verdict is Verdict.REGRESSION)
+    lines.append(f'{regressions} regression(s) in {len(comparisons)} benchmark(s)')
+    return '\n'.join(lines)
+
+
+def _format_number(value: float | None) -> str:
+    """Форматирует медиану показателя."""
+    return '' if value is None else f'{value:.6g}'
+
+
+def _parse_limit(value: str) -> tuple[str, float]:
+    """Разбирает порог группы вида `<префикс имени>=<доля>`."""
+    prefix, separator, limit = value.partition('=')
+    if not separator:
+        raise ValueError(f'Expected PREFIX=LIMIT, got {value!r}')
+    return prefix, float(limit)
+
+
+def main(argv: 'Sequence[str] | None' = None) -> int:
+    """Сравнивает запуски, выводит отчет и возвращает код завершения (1 при регрессии)."""
+    parser = ArgumentParser(description='Compare benchmark results with a baseline')
+    parser.add_argument('baseline', help='Baseline results of python -m tests.benchmarks')
+    parser.add_argument('current', help='Current results of python -m tests.benchmarks')
+    parser.add_argument('--load-baseline', default=None, help='Baseline report of python -m tests.load')
+    parser.add_argument('--load', default=None, help='Current report of python -m tests.load')
+    parser.add_argument(
+        '--threshold', type=float, default=DEFAULT_THRESHOLD, help=f'Noise threshold (default: {DEFAULT_THRESHOLD})'
+    )
+    parser.add_argument('--alpha', type=float, default=DEFAULT_ALPHA, help=f'Significance level ({DEFAULT_ALPHA})')
+    parser.add_argument(
+        '--limit',
+        action='append',
+        default=[],
+        metavar='PREFIX=LIMIT',
+        help='Threshold for benchmarks whose name starts with PREFIX, e.g. api.=0.1 (repeatable)',
+    )
+    args = parser.parse_args(argv)
+
+    if (args.load_baseline is None) != (args.load is None):
+        parser.error('--load-baseline and --load must be given together')
+    try:
+        limits = dict(_parse_limit(value) for value in args.limit)
+    except ValueError as error:
+        parser.error(str(error))
+    if not os.path.exists(args.baseline):
+        parser.error(f'Baseline {args.baseline} not found; record it on the reference machine with make bench-baseline')
+    missing = [path for path in (args.current, args.load_baseline, args.load) if path and not os.path.exists(path)]
+    if missing:
+        parser.error(f'Results not found: {", ".join(missing)}')
+
+    baseline, current = load_benchmarks(args.baseline), load_benchmarks(args.current)
+    if args.load is not None:
+        baseline.update(load_load_report(args.load_baseline))
+        current.update(load_load_report(args.load))
+
+    comparisons = compare(baseline, current, args.threshold, args.alpha, limits)
+    sys.stdout.write(format_report(comparisons) + '\n')
+    return 1 if any(comparison.verdict is Verdict.REGRESSION for comparison in comparisons) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""Постоянные данные запросов для бенчмарков и нагрузочных тестов."""
+
+import datetime
+from typing import TYPE_CHECKING, TypedDict
+
+from scoring_api.constants import ADMIN_LOGIN
+from scoring_api.handlers import MethodName
+from tests.utils.auth import generate_auth_token
+
+if TYPE_CHECKING:
+    from typing import Any
+
+ACCOUNT = 'horns&hoofs'
+LOGIN = 'h&f'
+
+ONLINE_SCORE_ARGUMENTS = {
+    'phone': '79175002040',
+    'email': 'stupnikov@otus.ru',
+    'first_name': 'Stanislav',
+    'last_name': 'Stupnikov',
+    'birthday': '01.01.1990',
+    'gender': 1,
+}
+
+
+class ScoreFields(TypedDict):
+    """Аргументы `get_score` после проверки запроса."""
+
+    phone: str
+    email: str
+    first_name: str
+    last_name: str
+    birthday: datetime.date
+    gender: int
+
+
+SCORE_FIELDS: ScoreFields = {
+    'phone': '79175002040',
+    'email': 'stupnikov@otus.ru',
+    'first_name': 'Stanislav',
+    'last_name': 'Stupnikov',
+    'birthday': datetime.date(1990, 1, 1),
+    'gender': 1,
+}
+INTERESTS = ('cars', 'pets', 'travel', 'hi-tech', 'sport', 'music', 'books', 'tv', 'cinema', 'geek', 'otus')
+
+
+def client_ids(count: int) -> list[int]:
+    """Возвращает `count` идентификаторов клиентов."""
+    return list(range(1, count + 1))
+
+
+def client_interests(cid: int) -> list[str]:
+    """Возвращает постоянный набор из двух интересов клиента."""
+    return [INTERESTS[cid % len(INTERESTS)], INTERESTS[(cid * 7 + 3) % len(INTERESTS)]]
+
+
+def method_request(method: MethodName, arguments: dict[str, 'Any'], login: str = LOGIN) -> dict[str, 'Any']:
+    """Возвращает тело запроса метода с действительным токеном (как в `tests/utils/auth.py`).
+
+    Args:
+        method: Метод API.
+        arguments: Аргументы метода.
+        login: Логин; для `ADMIN_LOGIN` токен администратора действует до конца текущего часа.
+
+    Returns:
+        Тело запроса.
+    """
+    return {
+        'account': ACCOUNT,
+        'login': login,
+        'method': method.value,
+        'token': generate_auth_token(login, ACCOUNT),
+        'arguments': arguments,
+    }
+
+
+def online_score_request(admin: bool = False) -> dict[str, 'Any']:
+    """Возвращает тело запроса `online_score` со всеми полями."""
+    return method_request(MethodName.ONLINE_SCORE, ONLINE_SCORE_ARGUMENTS, ADMIN_LOGIN if admin else LOGIN)
+
+
+def clients_interests_request(count: int, date: str | None = None) -> dict[str, 'Any']:
+    """Возвращает тело запроса `clients_interests` для `count` клиентов."""
+    arguments: dict[str, Any] = {'client_ids': client_ids(count)}
+    if date is not None:
+        arguments['date'] = date
+    return method_request(MethodName.CLIENTS_INTERESTS, arguments)
@@ -0,0 +1,167 @@
+"""Запуск микробенчмарков и запись результатов в JSON.
+
+Бенчмарк - это функция подготовки, зарегистрированная декоратором `benchmark`: она создает данные
+и возвращает функцию без аргументов, время которой измеряется. Измерение устроено как в `timeit`:
+количество вызовов в одном замере подбирается так, чтобы замер длился не меньше `min_time`, сборщик
+мусора на время замера выключается, а результат - `repeat` замеров времени одного вызова.
+Данные бенчмарков постоянны, поэтому результаты разных запусков сравнимы.
+"""
+
+import datetime
+import gc
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+type Setup = Callable[[], Callable[[], object]]
+
+DEFAULT_REPEAT = 20  # Количество замеров одного бенчмарка
+DEFAULT_MIN_TIME = 0.05  # Минимальная длительность одного замера, в секундах
+
+BENCHMARKS: dict[str, 'Setup'] = {}
+
+
+def benchmark(name: str) -> 'Callable[[Setup], Setup]':
+    """Регистрирует функцию подготовки бенчмарка.
+
+    Args:
+        name: Имя бенчмарка вида `<группа>.<сценарий>`.
+
+    Returns:
+        Декоратор, который возвращает функцию подготовки без изменений.
+
+    Raises:
+        ValueError: Если бенчмарк с таким именем уже зарегистрирован.
+    """
+
+    def register(setup: 'Setup') -> 'Setup':
+        if name in BENCHMARKS:
+            raise ValueError(f'Benchmark {name!r} is already registered')
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Результат бенчмарка: время одного вызова в каждом замере, в секундах."""
+
+    name: str
+    loops: int
+    samples: list[float]
+
+    @property
+    def mean(self) -> float:
+        """Среднее время вызова."""
+        return statistics.fmean(self.samples)
+
+    @property
+    def median(self) -> float:
+        """Медиана времени вызова."""
+        return statistics.median(self.samples)
+
+    @property
+    def stdev(self) -> float:
+        """Стандартное отклонение времени вызова."""
+        return statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+    def as_dict(self) -> dict[str, 'Any']:
+        """Возвращает результат в виде словаря для JSON."""
+        return {
+            'name': self.name,
+            'loops': self.loops,
+            'mean': self.mean,
+            'median': self.median,
+            'stdev': self.stdev,
+            'min': min(self.samples),
+            'samples': self.samples,
+        }
+
+
+def _time(func: 'Callable[[], object]', loops: int) -> float:
+    """Возвращает время `loops` вызовов функции с выключенным сборщиком мусора."""
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        return time.perf_counter() - started
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def measure(
+    name: str, func: 'Callable[[], object]', repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME
+) -> BenchmarkResult:
+    """Измеряет время вызова функции.
+
+    Args:
+        name: Имя бенчмарка.
+        func: Измеряемая функция без аргументов.
+        repeat: Количество замеров.
+        min_time: Минимальная длительность одного замера, в секундах.
+
+    Returns:
+        Результат бенчмарка.
+    """
+    loops = 1
+    while (elapsed := _time(func, loops)) < min_time:
+        loops = max(loops * 2, int(loops * min_time / elapsed * 1.1) if elapsed > 0 else loops * 10)
+
+    return BenchmarkResult(name, loops, [_time(func, loops) / loops for _ in range(repeat)])
+
+
+def run_benchmarks(
+    pattern: str = '', repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME
+) -> list[BenchmarkResult]:
+    """Запускает зарегистрированные бенчмарки, имя которых содержит `pattern`.
+
+    Args:
+        pattern: Подстрока имени бенчмарка.
+        repeat: Количество замеров каждого бенчмарка.
+        min_time: Минимальная длительность одного замера, в секундах.
+
+    Returns:
+        Результаты бенчмарков в порядке имен.
+    """
+    return [measure(name, BENCHMARKS[name](), repeat, min_time) for name in sorted(BENCHMARKS) if pattern in name]
+
+
+def environment() -> dict[str, 'Any']:
+    """Возвращает сведения об окружении, без которых результаты разных машин нельзя сравнивать."""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True, timeout=5
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+
+    return {
+        'timestamp': datetime.datetime.now(datetime.UTC).isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'commit': commit,
+    }
+
+
+def format_time(seconds: float) -> str:
+    """Форматирует время с подходящей единицей измерения."""
+    for unit, scale in (('s', 1.0), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f'{seconds / scale:.3f} {unit}'
+    return f'{seconds / 1e-9:.1f} ns'
@@ -19,6 +19,18 @@ if TYPE_CHECKING:
 class Config:
     port: int = 8082
     log_file: str | None = None
+    scoring_config: str | None = None
+    workers: int = 1
+    rate_limit: float | None = None
+    rate_burst: int | None = None
+    log_sample_rate: float = 0.0
+    server_timing: bool = True
+    profile_dir: str | None = None
+    slow_request_ms: float | None = None
+    slow_request_buffer: int = 50
+    storage: str = 'memcached'
+    capture_file: str | None = None
+    capture_sample_rate: float = 1.0
 
 
 @pytest.fixture(scope='module')
@@ -204,3 +216,61 @@ def test_clients_interests__error(
     result = response.json()
 
     assert result.get('code') == HTTPStatus.INVALID_REQUEST.code
+
+
+@pytest.mark.parametrize(
+    'content',
+    [b'{"login": ', b'[1, 2, 3]', b''],
+    ids=['invalid_json', 'json_array', 'empty_body'],
+)
+def test_method__bad_request(client: httpx.Client, test_server: str, content: bytes) -> None:
+    """Тестирует, что тело, не являющееся JSON-объектом, отклоняется с кодом 400."""
+    response = client.post(f'{test_server}/method', content=content)
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST.code
+    assert response.json() == {'code': HTTPStatus.BAD_REQUEST.code, 'error': HTTPStatus.BAD_REQUEST.message}
+
+
+def test_metrics(
+    client: httpx.Client,
+    test_server: str,
+    make_valid_api_request: 'Callable[..., dict[str, Any]]',
+) -> None:
+    """Тестирует, что `/metrics` отдает количество запросов в текстовом формате Prometheus."""
+    client.post(f'{test_server}/method', json=make_valid_api_request(method=MethodName.ONLINE_SCORE))
+    response = client.get(f'{test_server}/metrics')
+
+    assert response.status_code == HTTPStatus.OK.code
+    assert response.headers['Content-Type'].startswith('text/plain')
+    assert '# TYPE scoring_api_request_duration_seconds histogram' in response.text
+    assert 'scoring_api_requests_total{method="online_score",status="200"}' in response.text
+
+
+def test_server_timing(
+    client: httpx.Client,
+    test_server: str,
+    make_valid_api_request: 'Callable[..., dict[str, Any]]',
+) -> None:
+    """Тестирует, что ответ содержит время этапов обработки в заголовке `Server-Timing`."""
+    response = client.post(f'{test_server}/method', json=make_valid_api_request(method=MethodName.ONLINE_SCORE))
+    phases = {item.split(';')[0] for item in response.headers['Server-Timing'].split(', ')}
+
+    assert {'read', 'decode', 'validate', 'auth', 'arguments', 'serialize'} <= phases
+
+
+def test_slow_requests(client: httpx.Client, test_server: str) -> None:
+    """Тестирует, что `/slow_requests` отдает буфер медленных запросов в формате JSON."""
+    response = client.get(f'{test_server}/slow_requests')
+
+    assert response.status_code == HTTPStatus.OK.code
+    assert response.headers['Content-Type'] == 'application/json'
+    assert set(response.json()) == {'threshold_ms', 'slowest', 'recent'}
+
+
+def test_cache_policy(client: httpx.Client, test_server: str) -> None:
+    """Тестирует, что `/cache_policy` отдает статистику адаптивных политик кэширования в формате JSON."""
+    response = client.get(f'{test_server}/cache_policy')
+
+    assert response.status_code == HTTPStatus.OK.code
+    assert response.headers['Content-Type'] == 'application/json'
+    assert set(response.json()['default']) >= {'decision', 'compute_ns', 'read_ns', 'hit_ratio'}
@@ -0,0 +1,54 @@
+"""Нагрузочный тест работающего сервера.
+
+Использование:
+    $ python -m scoring_api.server --storage memory --workers 4 &
+    $ python -m tests.load --model closed --concurrency 16 --duration 30
+    $ python -m tests.load --model open --rate 500 --mix online_score=1,clients_interests=1 --output load.json
+"""
+
+import json
+import sys
+from argparse import ArgumentParser
+
+from tests.load.generator import build_scenarios, DEFAULT_CLIENT_IDS_SIZES, DEFAULT_MIX, LoadGenerator
+
+
+def main() -> None:
+    """Запускает нагрузку, выводит итоги и при необходимости записывает их в JSON."""
+    parser = ArgumentParser(description='Scoring API load generator')
+    parser.add_argument('--url', default='http://localhost:8080/method', help='Method URL of a running server')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f'Scenario weights (default: {DEFAULT_MIX})')
+    parser.add_argument(
+        '--client-ids',
+        default=','.join(map(str, DEFAULT_CLIENT_IDS_SIZES)),
+        help='Comma-separated client_ids sizes for clients_interests (default: %(default)s)',
+    )
+    parser.add_argument('--model', choices=('closed', 'open'), default='closed', help='Arrival model (default: closed)')
+    parser.add_argument('-c', '--concurrency', type=int, default=8, help='Clients of the closed model (default: 8)')
+    parser.add_argument('-r', '--rate', type=float, default=100.0, help='Requests per second of the open model')
+    parser.add_argument('-d', '--duration', type=float, default=10.0, help='Test duration, s (default: 10)')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed for a repeatable request sequence')
+    parser.add_argument('-o', '--output', default=None, help='Write the report to this JSON file')
+    args = parser.parse_args()
+
+    try:
+        scenarios = build_scenarios(args.mix, [int(size) for size in args.client_ids.split(',')])
+    except ValueError as error:
+        parser.error(str(error))
+    if args.concurrency < 1 or args.rate <= 0 or args.duration <= 0:
+        parser.error('--concurrency, --rate and --duration must be positive')
+
+    generator = LoadGenerator(args.url, scenarios, args.seed)
+    if args.model == 'closed':
+        report = generator.run_closed(args.concurrency, args.duration)
+    else:
+        report = generator.run_open(args.rate, args.duration)
+
+    sys.stdout.write(report.format() + '\n')
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            json.dump({'model': args.model, **report.as_dict()}, output, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,267 @@
+"""Генератор HTTP-нагрузки на работающий сервер со смесью методов, похожей на реальный трафик.
+
+Сценарии смеси: `online_score` пользователя и администратора и `clients_interests` с разным количеством
+`client_ids`. Тела запросов создаются на каждый запрос с действительным токеном (как в `tests/utils/auth.py`),
+поэтому токен администратора не устаревает при смене часа.
+
+Модели поступления запросов:
+    - `closed` - `concurrency` клиентов, каждый отправляет следующий запрос после ответа на предыдущий.
+      Пропускная способность ограничена временем ответа сервера;
+    - `open` - запросы поступают пуассоновским потоком с интенсивностью `rate` независимо от ответов.
+      Время ответа считается от запланированного момента отправки, поэтому очередь перед сервером
+      (или перед генератором) входит в задержку, а не скрывает ее.
+"""
+
+import http.client
+import json
+import math
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from tests.benchmarks.payloads import clients_interests_request, online_score_request
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from typing import Any
+
+DEFAULT_MIX = 'online_score=6,online_score_admin=1,clients_interests=3'
+DEFAULT_CLIENT_IDS_SIZES = (1, 10, 100)
+PERCENTILES = (50.0, 95.0, 99.0, 99.9)
+THROUGHPUT_WINDOW_SECONDS = 1.0  # Окно, по которому считается пропускная способность для сравнения запусков
+REQUEST_TIMEOUT_SECONDS = 10.0
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """Сценарий смеси: имя, вес и функция, создающая тело запроса."""
+
+    name: str
+    weight: float
+    make_body: 'Callable[[random.Random], dict[str, Any]]'
+
+
+def build_scenarios(mix: str, client_ids_sizes: 'Sequence[int]' = DEFAULT_CLIENT_IDS_SIZES) -> list[Scenario]:
+    """Разбирает смесь вида `online_score=6,online_score_admin=1,clients_interests=3`.
+
+    Args:
+        mix: Веса сценариев через запятую.
+        client_ids_sizes: Размеры `client_ids` для `clients_interests`, выбираются равновероятно.
+
+    Returns:
+        Сценарии с положительным весом.
+
+    Raises:
+        ValueError: Если сценарий неизвестен, вес не число или сумма весов не положительна.
+    """
+    factories: dict[str, Callable[[random.Random], dict[str, Any]]] = {
+        'online_score': lambda _rng: online_score_request(),
+        'online_score_admin': lambda _rng: online_score_request(admin=True),
+        'clients_interests': lambda rng: clients_interests_request(rng.choice(client_ids_sizes)),
+    }
+
+    scenarios = []
+    for item in mix.split(','):
+        name, _, weight = item.strip().partition('=')
+        if name not in factories:
+            raise ValueError(f'Unknown scenario {name!r}, expected one of {sorted(factories)}')
+        if float(weight) > 0:
+            scenarios.append(Scenario(name, float(weight), factories[name]))
+
+    if not scenarios:
+        raise ValueError('The mix must contain a scenario with a positive weight')
+    return scenarios
+
+
+@dataclass(frozen=True)
+class Sample:
+    """Результат одного запроса."""
+
+    scenario: str
+    latency: float
+    status: int  # 0, если ответ не получен
+    finished: float = 0.0  # Момент получения ответа от начала теста, в секундах
+
+
+def percentile(values: 'Sequence[float]', q: float) -> float:
+    """Возвращает перцентиль `q` (от 0 до 100) отсортированных значений методом ближайшего ранга."""
+    if not values:
+        return 0.0
+    return values[max(1, math.ceil(len(values) * q / 100)) - 1]
+
+
+@dataclass
+class LoadReport:
+    """Результаты нагрузочного теста."""
+
+    elapsed: float
+    samples: list[Sample] = field(default_factory=list)
+
+    def summary(self, samples: 'Sequence[Sample]') -> dict[str, float | int]:
+        """Возвращает количество запросов, пропускную способность, долю ошибок и перцентили задержки, мс."""
+        latencies = sorted(sample.latency for sample in samples)
+        errors = sum(1 for sample in samples if sample.status != http.client.OK)
+        result: dict[str, float | int] = {
+            'requests': len(samples),
+            'rps': round(len(samples) / self.elapsed, 1) if self.elapsed else 0.0,
+            'error_rate': round(errors / len(samples), 4) if samples else 0.0,
+        }
+        result.update((f'p{q:g}_ms', round(percentile(latencies, q) * 1000, 3)) for q in PERCENTILES)
+        return result
+
+    def throughput(self, window: float = THROUGHPUT_WINDOW_SECONDS) -> list[float]:
+        """Возвращает количество ответов в секунду в каждом полном окне `window` секунд."""
+        windows = int(self.elapsed // window)
+        counts = [0] * windows
+        for sample in self.samples:
+            index = int(sample.finished // window)
+            if index < windows:
+                counts[index] += 1
+        return [count / window for count in counts]
+
+    def as_dict(self) -> dict[str, 'Any']:
+        """Возвращает итоги по всем запросам, по сценариям и по кодам ответа.
+
+        `rps_samples` - пропускная способность по окнам (см. `throughput`) для сравнения с базовым запуском.
+        """
+        by_scenario: defaultdict[str, list[Sample]] = defaultdict(list)
+        statuses: defaultdict[str, int] = defaultdict(int)
+        for sample in self.samples:
+            by_scenario[sample.scenario].append(sample)
+            statuses[str(sample.status) if sample.status else 'no_response'] += 1
+
+        return {
+            'elapsed_s': round(self.elapsed, 3),
+            'total': self.summary(self.samples),
+            'scenarios': {name: self.summary(samples) for name, samples in sorted(by_scenario.items())},
+            'statuses': dict(sorted(statuses.items())),
+            'rps_samples': self.throughput(),
+        }
+
+    def format(self) -> str:
+        """Возвращает итоги в виде таблицы."""
+        report = self.as_dict()
+        columns = ('requests', 'rps', 'error_rate', *(f'p{q:g}_ms' for q in PERCENTILES))
+        rows = [('total', report['total']), *report['scenarios'].items()]
+        width = max(len(name) for name, _ in rows)
+        lines = [f'{"scenario":<{width}}' + ''.join(f'{column:>12}' for column in columns)]
+        lines.extend(
+            f'{name:<{width}}' + ''.join(f'{summary[column]:>12}' for column in columns) for name, summary in rows
+        )
+        lines.append('statuses: ' + ', '.join(f'{status}={count}' for status, count in report['statuses'].items()))
+        return '\n'.join(lines)
+
+
+def post(host: str, port: int, path: str, body: bytes) -> int:
+    """Отправляет POST-запрос с телом JSON в новом соединении.
+
+    Returns:
+        Код ответа или 0, если ответ не получен.
+    """
+    connection = http.client.HTTPConnection(host, port, timeout=REQUEST_TIMEOUT_SECONDS)
+    try:
+        connection.request('POST', path, body, {'Content-Type': 'application/json'})
+        response = connection.getresponse()
+        response.read()
+    except (OSError, http.client.HTTPException):
+        return 0
+    else:
+        return response.status
+    finally:
+        connection.close()
+
+
+class LoadGenerator:
+    """Отправляет запросы сценариев смеси на сервер и собирает результаты."""
+
+    def __init__(self, url: str, scenarios: 'Sequence[Scenario]', seed: int | None = None) -> None:
+        """Создает генератор нагрузки.
+
+        Args:
+            url: Адрес метода сервера, например `http://localhost:8080/method`.
+            scenarios: Сценарии смеси.
+            seed: Начальное значение генератора случайных чисел (для повторяемой последовательности запросов).
+        """
+        parts = urlsplit(url)
+        self.host = parts.hostname or 'localhost'
+        self.port = parts.port or 80
+        self.path = parts.path or '/method'
+        self.scenarios = list(scenarios)
+        self._weights = [scenario.weight for scenario in self.scenarios]
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._samples: list[Sample] = []
+        self._started = 0.0
+
+    def run_closed(self, concurrency: int, duration: float) -> LoadReport:
+        """Нагрузка закрытой модели: `concurrency` клиентов отправляют запросы один за другим.
+
+        Args:
+            concurrency: Количество одновременных клиентов.
+            duration: Длительность теста, в секундах.
+
+        Returns:
+            Результаты теста.
+        """
+        self._samples = []
+        self._started = started = time.perf_counter()
+        deadline = started + duration
+
+        def client(seed: int) -> None:
+            rng = random.Random(seed)
+            while time.perf_counter() < deadline:
+                self._send(rng, time.perf_counter())
+
+        threads = [
+            threading.Thread(target=client, args=(self._random.getrandbits(64),), daemon=True)
+            for _ in range(concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return LoadReport(time.perf_counter() - started, self._samples)
+
+    def run_open(self, rate: float, duration: float, max_in_flight: int = 256) -> LoadReport:
+        """Нагрузка открытой модели: пуассоновский поток запросов с интенсивностью `rate`.
+
+        Args:
+            rate: Среднее количество запросов в секунду.
+            duration: Длительность теста, в секундах.
+            max_in_flight: Максимальное количество одновременно отправляемых запросов.
+
+        Returns:
+            Результаты теста.
+        """
+        self._samples = []
+        self._started = started = time.perf_counter()
+        scheduled = started
+
+        with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+            while (scheduled := scheduled + self._random.expovariate(rate)) < started + duration:
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                pool.submit(self._send, random.Random(self._random.getrandbits(64)), scheduled)
+
+        return LoadReport(time.perf_counter() - started, self._samples)
+
+    def _send(self, rng: random.Random, scheduled: float) -> None:
+        """Отправляет запрос случайного сценария и сохраняет результат.
+
+        Args:
+            rng: Генератор случайных чисел потока.
+            scheduled: Момент, с которого считается задержка (`time.perf_counter`).
+        """
+        scenario = rng.choices(self.scenarios, self._weights)[0]
+        status = post(self.host, self.port, self.path, json.dumps(scenario.make_body(rng)).encode('utf-8'))
+        finished = time.perf_counter()
+        sample = Sample(scenario.name, finished - scheduled, status, finished - self._started)
+        with self._lock:
+            self._samples.append(sample)
@@ -0,0 +1,153 @@
+"""Воспроизведение записанного трафика на работающем сервере.
+
+Запросы из файла записи трафика (`--capture-file` сервера, см. `scoring_api/capture.py`) отправляются
+с исходными интервалами между ними, ускоренными в `speed` раз. Токен каждого запроса рассчитывается заново
+(как в `tests/utils/auth.py`) в момент отправки, поэтому воспроизведение проходит аутентификацию,
+а токен администратора не устаревает при смене часа. Задержка считается от запланированного момента отправки,
+как в открытой модели генератора нагрузки, а итоги - тот же `LoadReport` по методам.
+
+Использование:
+    $ python -m scoring_api.server --storage memory --workers 4 &
+    $ python -m tests.load.replay traffic.jsonl --speed 5 --output replay.json
+"""
+
+import json
+import sys
+import threading
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from scoring_api.constants import ADMIN_LOGIN
+from tests.load.generator import LoadReport, post, Sample
+from tests.utils.auth import generate_auth_token
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any
+
+
+@dataclass(frozen=True)
+class CapturedRequest:
+    """Записанный запрос."""
+
+    offset: float  # Время поступления от первого запроса записи, в секундах
+    path: str
+    body: dict[str, 'Any']
+
+    @property
+    def scenario(self) -> str:
+        """Имя группы запроса в отчете: метод, для администратора - с суффиксом `_admin`."""
+        method = str(self.body.get('method', 'unknown'))
+        return f'{method}_admin' if self.body.get('login') == ADMIN_LOGIN else method
+
+
+def load_capture(path: str) -> list[CapturedRequest]:
+    """Читает файл записи трафика.
+
+    Строки рабочих процессов сервера могут идти не по порядку, поэтому запросы сортируются по времени поступления.
+
+    Args:
+        path: Путь к файлу записи трафика.
+
+    Returns:
+        Запросы по времени поступления.
+    """
+    with open(path, encoding='utf-8') as capture:
+        entries = sorted((json.loads(line) for line in capture if line.strip()), key=lambda entry: entry['ts'])
+    if not entries:
+        return []
+    first = entries[0]['ts']
+    return [CapturedRequest(entry['ts'] - first, entry['path'], entry['body']) for entry in entries]
+
+
+def with_token(body: dict[str, 'Any']) -> dict[str, 'Any']:
+    """Возвращает копию тела запроса с действительным токеном для его логина и учетной записи."""
+    return {**body, 'token': generate_auth_token(str(body.get('login', '')), str(body.get('account', '')))}
+
+
+class Replayer:
+    """Отправляет записанные запросы на сервер с исходными интервалами и собирает результаты."""
+
+    def __init__(self, url: str, requests: 'Sequence[CapturedRequest]') -> None:
+        """Создает воспроизведение.
+
+        Args:
+            url: Адрес сервера, например `http://localhost:8080`; путь берется из записи.
+            requests: Запросы по времени поступления.
+        """
+        parts = urlsplit(url)
+        self.host = parts.hostname or 'localhost'
+        self.port = parts.port or 80
+        self.requests = list(requests)
+        self._lock = threading.Lock()
+        self._samples: list[Sample] = []
+        self._started = 0.0
+
+    def run(self, speed: float = 1.0, max_in_flight: int = 256) -> LoadReport:
+        """Воспроизводит запросы.
+
+        Args:
+            speed: Во сколько раз быстрее исходного трафика отправляются запросы.
+            max_in_flight: Максимальное количество одновременно отправляемых запросов.
+
+        Returns:
+            Результаты воспроизведения.
+        """
+        self._samples = []
+        self._started = started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+            for request in self.requests:
+                scheduled = started + request.offset / speed
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                pool.submit(self._send, request, scheduled)
+
+        return LoadReport(time.perf_counter() - started, self._samples)
+
+    def _send(self, request: CapturedRequest, scheduled: float) -> None:
+        """Отправляет запрос с новым токеном и сохраняет результат.
+
+        Args:
+            request: Записанный запрос.
+            scheduled: Момент, с которого считается задержка (`time.perf_counter`).
+        """
+        status = post(self.host, self.port, request.path, json.dumps(with_token(request.body)).encode('utf-8'))
+        finished = time.perf_counter()
+        sample = Sample(request.scenario, finished - scheduled, status, finished - self._started)
+        with self._lock:
+            self._samples.append(sample)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Воспроизводит файл записи трафика, выводит итоги и при необходимости записывает их в JSON."""
+    parser = ArgumentParser(description='Replay captured Scoring API traffic')
+    parser.add_argument('capture', help='Capture file written by the server with --capture-file')
+    parser.add_argument('--url', default='http://localhost:8080', help='Server address (default: %(default)s)')
+    parser.add_argument('--speed', type=float, default=1.0, help='Replay speed relative to the capture (default: 1)')
+    parser.add_argument(
+        '--max-in-flight', type=int, default=256, help='Maximal concurrent requests (default: %(default)s)'
+    )
+    parser.add_argument('-o', '--output', default=None, help='Write the report to this JSON file')
+    args = parser.parse_args(argv)
+
+    if args.speed <= 0 or args.max_in_flight < 1:
+        parser.error('--speed and --max-in-flight must be positive')
+    requests = load_capture(args.capture)
+    if not requests:
+        parser.error(f'No requests in {args.capture}')
+
+    report = Replayer(args.url, requests).run(args.speed, args.max_in_flight)
+    sys.stdout.write(report.format() + '\n')
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            json.dump({'model': 'replay', 'speed': args.speed, **report.as_dict()}, output, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Профилирование памяти обработки запросов методов.
+
+Использование:
+    $ python -m tests.memory
+    $ python -m tests.memory -k online_score --iterations 10000 --frames 5 --output memory.json
+
+Код завершения 1, если рост памяти на запрос хотя бы одной нагрузки больше `--limit` байт.
+"""
+
+import json
+import sys
+from argparse import ArgumentParser
+
+from tests.memory.harness import (
+    DEFAULT_GROWTH_LIMIT,
+    DEFAULT_ITERATIONS,
+    DEFAULT_SAMPLES,
+    DEFAULT_TOP_LINES,
+    DEFAULT_VARIANTS,
+    format_report,
+    profile_workloads,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Профилирует нагрузки, выводит отчет и при необходимости записывает его в JSON.
+
+    Returns:
+        Код завершения: 1, если обнаружен рост памяти, иначе 0.
+    """
+    parser = ArgumentParser(description='Scoring API per-request memory profile')
+    parser.add_argument('-k', '--filter', default='', help='Profile workloads whose name contains this substring')
+    parser.add_argument(
+        '--iterations',
+        type=int,
+        default=DEFAULT_ITERATIONS,
+        help=f'Requests in each growth window ({DEFAULT_ITERATIONS})',
+    )
+    parser.add_argument('--samples', type=int, default=DEFAULT_SAMPLES, help=f'Requests to average ({DEFAULT_SAMPLES})')
+    parser.add_argument(
+        '--variants', type=int, default=DEFAULT_VARIANTS, help=f'Distinct request bodies ({DEFAULT_VARIANTS})'
+    )
+    parser.add_argument(
+        '--top', type=int, default=DEFAULT_TOP_LINES, help=f'Source lines per report ({DEFAULT_TOP_LINES})'
+    )
+    parser.add_argument('--frames', type=int, default=1, help='Traceback depth stored by tracemalloc (default: 1)')
+    parser.add_argument(
+        '--limit',
+        type=float,
+        default=DEFAULT_GROWTH_LIMIT,
+        help=f'Allowed growth per request, B ({DEFAULT_GROWTH_LIMIT})',
+    )
+    parser.add_argument('-o', '--output', default=None, help='Write the report to this JSON file')
+    args = parser.parse_args(argv)
+
+    if min(args.iterations, args.samples, args.variants, args.top, args.frames) < 1:
+        parser.error('--iterations, --samples, --variants, --top and --frames must be positive')
+
+    profiles = profile_workloads(args.filter, args.iterations, args.samples, args.variants, args.top, args.frames)
+    if not profiles:
+        parser.error(f'No workloads match {args.filter!r}')
+
+    sys.stdout.write(format_report(profiles, args.limit) + '\n')
+    if args.output is not None:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            json.dump({'limit': args.limit, 'workloads': [profile.as_dict() for profile in profiles]}, output, indent=2)
+        sys.stdout.write(f'Report written to {args.output}\n')
+    return 1 if any(profile.leaking(args.limit) for profile in profiles) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
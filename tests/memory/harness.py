@@ -0,0 +1,319 @@
+"""Профилирование памяти обработки запросов методов с помощью `tracemalloc`.
+
+Запросы передаются в `method_handler` так же, как их передает `APIHandler`: с контекстом запроса,
+измерением этапов, журналом медленных запросов и записью в журнал доступа. Журнал доступа пишется в
+`NullHandler`, поэтому запись формируется, но никуда не выводится.
+
+Для каждой нагрузки считаются:
+    - пик памяти запроса - наибольший прирост отслеживаемой памяти во время одного запроса;
+    - память запроса по строкам исходного кода - то, что запрос удерживает к моменту ответа (ответ, контекст,
+      записи журнала), в среднем на запрос. Для этого ответы `samples` запросов хранятся до снимка памяти;
+    - рост памяти - сколько памяти осталось занято после `iterations` запросов, результаты которых
+      не сохраняются. Запросы перебирают `variants` разных тел (логины, телефоны, клиенты), и прогрев проходит
+      их все, поэтому ограниченные кэши (токенов, оценок, журнал медленных запросов) заполнены до измерения.
+      Рост измеряется в двух окнах по `iterations` запросов подряд. Разовые выделения (дозаполнение кэшей,
+      внутренние структуры интерпретатора) попадают только в первое окно, а утечка - неограниченный кэш
+      или контекст журнала, который не освобождается, - растет в обоих. Поэтому рост на запрос считается
+      по меньшему из окон.
+"""
+
+import gc
+import json
+import logging
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from scoring_api.access_log import log_access
+from scoring_api.constants import ADMIN_LOGIN
+from scoring_api.handlers import method_handler, MethodName
+from scoring_api.interests import interests_key
+from scoring_api.slow_log import configure_slow_log, log_slow_request, start_slow_log, stop_slow_log
+from scoring_api.storage.constants import NO_EXPIRATION
+from scoring_api.storage.instrumented import InstrumentedStorage
+from scoring_api.storage.memory import MemoryStorage
+from scoring_api.timing import start_timing, stop_timing
+from tests.benchmarks.payloads import client_ids, client_interests, method_request, ONLINE_SCORE_ARGUMENTS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from typing import Any
+
+    from scoring_api.storage.interface import StorageInterface
+
+DEFAULT_ITERATIONS = 2000
+DEFAULT_SAMPLES = 100
+DEFAULT_VARIANTS = 100
+DEFAULT_TOP_LINES = 10
+DEFAULT_GROWTH_LIMIT = 8.0  # Допустимый рост памяти на запрос, байт: больше считается утечкой
+MAX_CLIENT_ID = 1000
+
+
+def _online_score(variant: int, admin: bool = False) -> dict[str, 'Any']:
+    """Возвращает запрос `online_score` с телефоном и логином варианта."""
+    arguments = {**ONLINE_SCORE_ARGUMENTS, 'phone': f'7917500{variant:04d}'}
+    return method_request(MethodName.ONLINE_SCORE, arguments, ADMIN_LOGIN if admin else f'user{variant}')
+
+
+def _clients_interests(variant: int, count: int, method: MethodName = MethodName.CLIENTS_INTERESTS) -> dict[str, 'Any']:
+    """Возвращает запрос `clients_interests` (или `clients_interests_top`) для `count` клиентов варианта."""
+    arguments: dict[str, Any] = {'client_ids': [(variant + cid) % MAX_CLIENT_ID + 1 for cid in range(count)]}
+    if method is MethodName.CLIENTS_INTERESTS_TOP:
+        arguments['limit'] = 5
+    return method_request(method, arguments, f'user{variant}')
+
+
+WORKLOADS: dict[str, 'Callable[[int], dict[str, Any]]'] = {
+    'online_score': _online_score,
+    'online_score_admin': lambda variant: _online_score(variant, admin=True),
+    'clients_interests_10': lambda variant: _clients_interests(variant, 10),
+    'clients_interests_100': lambda variant: _clients_interests(variant, 100),
+    'clients_interests_top_100': lambda variant: _clients_interests(variant, 100, MethodName.CLIENTS_INTERESTS_TOP),
+}
+
+
+def memory_storage() -> InstrumentedStorage:
+    """Возвращает хранилище в памяти с интересами всех клиентов нагрузок, обернутое, как на сервере."""
+    storage = MemoryStorage()
+    for cid in client_ids(MAX_CLIENT_ID):
+        storage.cache_set(interests_key(cid), json.dumps(client_interests(cid)), NO_EXPIRATION)
+    return InstrumentedStorage(storage)
+
+
+def handle(body: dict[str, 'Any'], storage: 'StorageInterface') -> tuple[dict[str, 'Any'], dict[str, 'Any']]:
+    """Обрабатывает запрос метода так же, как `APIHandler.do_POST`.
+
+    Args:
+        body: Тело запроса.
+        storage: Хранилище.
+
+    Returns:
+        Ответ и контекст запроса.
+    """
+    timer, timing_token = start_timing()
+    slow_log_token = start_slow_log()
+    try:
+        context: dict[str, Any] = {'request_id': 'memory'}
+        response, status_code = method_handler({'body': body, 'headers': {}}, context, storage)
+        context['timings'] = timer.milliseconds()
+        # Постоянное время обработки: журнал медленных запросов вытесняет записи по порядку, а не по случайной
+        # задержке, поэтому его размер после заполнения не меняется
+        log_access(context, '/method', status_code, 0.0, body, response.get('error'))
+        log_slow_request(context, '/method', status_code, 0.0)
+    finally:
+        stop_timing(timing_token)
+        if slow_log_token is not None:
+            stop_slow_log(slow_log_token)
+    return response, context
+
+
+@dataclass(frozen=True)
+class LineStat:
+    """Память, выделенная в строке исходного кода."""
+
+    location: str
+    size: float  # Байт
+    count: float  # Блоков памяти
+
+    def as_dict(self) -> dict[str, 'Any']:
+        """Возвращает строку для отчета в JSON."""
+        return {'location': self.location, 'size': round(self.size, 1), 'count': round(self.count, 2)}
+
+
+@dataclass
+class MemoryProfile:
+    """Результаты профилирования памяти одной нагрузки."""
+
+    name: str
+    iterations: int
+    peak: int = 0  # Наибольший прирост памяти во время запроса, байт
+    retained: float = 0.0  # Память, которую запрос удерживает к моменту ответа, байт
+    growth: int = 0  # Рост памяти за первые `iterations` запросов, байт
+    repeat_growth: int = 0  # Рост памяти за следующие `iterations` запросов, байт
+    lines: list[LineStat] = field(default_factory=list)
+    growth_lines: list[LineStat] = field(default_factory=list)  # Строки роста во втором окне
+
+    @property
+    def growth_per_request(self) -> float:
+        """Рост памяти на один запрос, который повторяется в обоих окнах, байт."""
+        return min(self.growth, self.repeat_growth) / self.iterations if self.iterations else 0.0
+
+    def leaking(self, limit: float = DEFAULT_GROWTH_LIMIT) -> bool:
+        """Проверяет, превышает ли рост памяти на запрос `limit` байт."""
+        return self.growth_per_request > limit
+
+    def as_dict(self) -> dict[str, 'Any']:
+        """Возвращает результаты для отчета в JSON."""
+        return {
+            'name': self.name,
+            'iterations': self.iterations,
+            'peak': self.peak,
+            'retained': round(self.retained, 1),
+            'growth': self.growth,
+            'repeat_growth': self.repeat_growth,
+            'growth_per_request': round(self.growth_per_request, 3),
+            'lines': [line.as_dict() for line in self.lines],
+            'growth_lines': [line.as_dict() for line in self.growth_lines],
+        }
+
+
+def _line_stats(
+    after: tracemalloc.Snapshot, before: tracemalloc.Snapshot, divisor: int, top: int
+) -> tuple[float, list[LineStat]]:
+    """Возвращает суммарный прирост памяти между снимками и `top` строк с наибольшим приростом на `divisor`."""
+    differences = after.compare_to(before, 'lineno')
+    total = sum(difference.size_diff for difference in differences)
+    lines = [
+        LineStat(str(difference.traceback[0]), difference.size_diff / divisor, difference.count_diff / divisor)
+        for difference in differences[:top]
+        if difference.size_diff > 0
+    ]
+    return total / divisor, lines
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    """Снимает память без учета самого `tracemalloc` и модуля профилирования."""
+    gc.collect()
+    return tracemalloc.take_snapshot().filter_traces(
+        (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+    )
+
+
+def profile_workload(  # noqa: PLR0913
+    name: str,
+    make_body: 'Callable[[int], dict[str, Any]]',
+    storage: 'StorageInterface',
+    iterations: int = DEFAULT_ITERATIONS,
+    samples: int = DEFAULT_SAMPLES,
+    variants: int = DEFAULT_VARIANTS,
+    top: int = DEFAULT_TOP_LINES,
+) -> MemoryProfile:
+    """Профилирует память нагрузки; `tracemalloc` должен быть запущен.
+
+    Args:
+        name: Имя нагрузки.
+        make_body: Функция, создающая тело запроса по номеру варианта.
+        storage: Хранилище.
+        iterations: Количество запросов в каждом из двух окон измерения роста памяти.
+        samples: Количество запросов, удерживаемая память которых усредняется.
+        variants: Количество разных тел запросов.
+        top: Количество строк исходного кода в отчете.
+
+    Returns:
+        Результаты профилирования.
+    """
+    bodies = [make_body(variant) for variant in range(variants)]
+
+    def requests(count: int) -> 'Iterator[dict[str, Any]]':
+        return (bodies[index % variants] for index in range(count))
+
+    for body in requests(2 * variants):  # Прогрев: ленивые импорты, кэши и журнал медленных запросов
+        handle(body, storage)
+
+    profile = MemoryProfile(name, iterations)
+
+    before = _snapshot()
+    held = [handle(body, storage) for body in requests(samples)]
+    profile.retained, profile.lines = _line_stats(_snapshot(), before, samples, top)
+    del held
+
+    for body in requests(samples):
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        handle(body, storage)
+        profile.peak = max(profile.peak, tracemalloc.get_traced_memory()[1] - current)
+
+    before = _snapshot()
+    for body in requests(iterations):
+        handle(body, storage)
+    middle = _snapshot()
+    for body in requests(iterations):
+        handle(body, storage)
+    growth = _line_stats(middle, before, 1, top)[0]
+    repeat_growth, profile.growth_lines = _line_stats(_snapshot(), middle, 1, top)
+    profile.growth, profile.repeat_growth = int(growth), int(repeat_growth)
+    return profile
+
+
+def profile_workloads(  # noqa: PLR0913
+    pattern: str = '',
+    iterations: int = DEFAULT_ITERATIONS,
+    samples: int = DEFAULT_SAMPLES,
+    variants: int = DEFAULT_VARIANTS,
+    top: int = DEFAULT_TOP_LINES,
+    frames: int = 1,
+) -> list[MemoryProfile]:
+    """Профилирует память нагрузок `WORKLOADS`, имя которых содержит `pattern`.
+
+    На время профилирования журнал доступа включается с `NullHandler`, а журнал медленных запросов -
+    с нулевым порогом, чтобы в измерение входили записи журналов.
+
+    Args:
+        pattern: Подстрока имени нагрузки.
+        iterations: Количество запросов в каждом из двух окон измерения роста памяти.
+        samples: Количество запросов, удерживаемая память которых усредняется.
+        variants: Количество разных тел запросов.
+        top: Количество строк исходного кода в отчете.
+        frames: Глубина стека, сохраняемого `tracemalloc` для каждого блока памяти.
+
+    Returns:
+        Результаты по нагрузкам.
+    """
+    storage = memory_storage()
+    root = logging.getLogger()
+    handler, level = logging.NullHandler(), root.level
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+    configure_slow_log(0.0)
+    tracemalloc.start(frames)
+    try:
+        return [
+            profile_workload(name, make_body, storage, iterations, samples, variants, top)
+            for name, make_body in WORKLOADS.items()
+            if pattern in name
+        ]
+    finally:
+        tracemalloc.stop()
+        configure_slow_log(None)
+        root.setLevel(level)
+        root.removeHandler(handler)
+
+
+def format_size(size: float) -> str:
+    """Форматирует размер памяти с подходящей единицей измерения."""
+    for unit, scale in (('MiB', 1024.0**2), ('KiB', 1024.0)):
+        if abs(size) >= scale:
+            return f'{size / scale:.1f} {unit}'
+    return f'{size:.0f} B'
+
+
+def format_report(profiles: list[MemoryProfile], limit: float = DEFAULT_GROWTH_LIMIT) -> str:
+    """Форматирует таблицу нагрузок и строки исходного кода с наибольшим расходом памяти.
+
+    Args:
+        profiles: Результаты профилирования.
+        limit: Допустимый рост памяти на запрос, байт.
+
+    Returns:
+        Текст отчета.
+    """
+    width = max(len('workload'), *(len(profile.name) for profile in profiles))
+    lines = [
+        f'{"workload":<{width}}  {"peak":>10}  {"retained":>10}  {"growth":>10}  {"repeat":>10}  {"per request":>11}'
+    ]
+    for profile in profiles:
+        lines.append(
+            f'{profile.name:<{width}}  {format_size(profile.peak):>10}  {format_size(profile.retained):>10}'
+            f'  {format_size(profile.growth):>10}  {format_size(profile.repeat_growth):>10}'
+            f'  {format_size(profile.growth_per_request):>11}' + ('  LEAK' if profile.leaking(limit) else '')
+        )
+
+    for profile in profiles:
+        lines.append(f'\n{profile.name}: retained per request by line')
+        lines.extend(f'  {format_size(line.size):>10}  {line.count:>7.2f}  {line.location}' for line in profile.lines)
+        if profile.leaking(limit):
+            lines.append(f'{profile.name}: growth in the second {profile.iterations} requests by line')
+            lines.extend(
+                f'  {format_size(line.size):>10}  {line.count:>7.0f}  {line.location}' for line in profile.growth_lines
+            )
+    return '\n'.join(lines)
@@ -0,0 +1,77 @@
+import json
+import logging
+import random
+from typing import TYPE_CHECKING
+
+from scoring_api.access_log import AccessLog, redact, REDACTED
+
+if TYPE_CHECKING:
+    import pytest
+
+BODY = {
+    'account': 'horns&hoofs',
+    'login': 'h&f',
+    'method': 'online_score',
+    'token': 'secret',
+    'arguments': {'phone': '79175002040', 'email': 'user@otus.ru', 'first_name': 'Ivan', 'gender': 1},
+}
+
+
+def test_redact() -> None:
+    """Тестирует, что персональные поля и токен скрываются на любом уровне вложенности."""
+    redacted = redact(BODY)
+
+    assert redacted['token'] == REDACTED
+    assert redacted['arguments'] == {'phone': REDACTED, 'email': REDACTED, 'first_name': REDACTED, 'gender': 1}
+    assert redacted['login'] == 'h&f'
+    assert BODY['token'] == 'secret'  # Исходное тело не изменяется
+
+
+def test_access_log__record() -> None:
+    """Тестирует структуру записи журнала доступа без тела запроса."""
+    context = {'request_id': 'abc', 'method': 'online_score', 'account': 'horns&hoofs', 'has': ['phone']}
+    record = json.loads(AccessLog(sample_rate=0).record(context, '/method', 200, 0.0012345, BODY))
+
+    assert record == {
+        'request_id': 'abc',
+        'path': '/method',
+        'status': 200,
+        'latency_ms': 1.234,
+        'method': 'online_score',
+        'account': 'horns&hoofs',
+        'has': ['phone'],
+    }
+
+
+def test_access_log__error() -> None:
+    """Тестирует, что описание ошибки попадает в запись."""
+    record = json.loads(
+        AccessLog(sample_rate=0).record({'request_id': 'abc'}, '/method', 403, 0.001, None, 'Forbidden')
+    )
+
+    assert record['error'] == 'Forbidden'
+    assert 'body' not in record
+
+
+def test_access_log__sampled_body() -> None:
+    """Тестирует, что при выборке в запись попадает тело запроса со скрытыми полями."""
+    record = json.loads(AccessLog(sample_rate=1).record({'request_id': 'abc'}, '/method', 200, 0.001, BODY))
+
+    assert record['body'] == redact(BODY)
+
+
+def test_access_log__sample_rate() -> None:
+    """Тестирует, что тело пишется примерно для заданной доли запросов."""
+    access_log = AccessLog(sample_rate=0.1, rng=random.Random(42))
+    sampled = sum('body' in json.loads(access_log.record({}, '/method', 200, 0.0, BODY)) for _ in range(10_000))
+
+    assert 800 < sampled < 1200  # noqa: PLR2004
+
+
+def test_access_log__log(caplog: 'pytest.LogCaptureFixture') -> None:
+    """Тестирует, что запись пишется одной строкой в логгер `scoring_api.access`."""
+    with caplog.at_level(logging.INFO, logger='scoring_api.access'):
+        AccessLog(sample_rate=0).log({'request_id': 'abc'}, '/method', 200, 0.001, BODY)
+
+    assert [record.name for record in caplog.records] == ['scoring_api.access']
+    assert json.loads(caplog.records[0].getMessage())['request_id'] == 'abc'
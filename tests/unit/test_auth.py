@@ -4,7 +4,14 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from scoring_api.auth import generate_admin_auth_token, generate_auth_token, is_authenticated
+from scoring_api import auth
+from scoring_api.auth import (
+    AdminTokenRing,
+    AuthCache,
+    generate_admin_auth_token,
+    generate_auth_token,
+    is_authenticated,
+)
 from scoring_api.constants import ADMIN_SALT, SALT
 from scoring_api.requests.requests import MethodRequest
 
@@ -64,3 +71,96 @@ def test_is_authenticated(
     request.validated_data = {'login': login, 'account': account, 'token': valid_token}
 
     assert is_authenticated(request) == expected
+
+
+class FakeClock:
+    """Управляемый источник времени."""
+
+    def __init__(self, now: float) -> None:
+        """Создает часы, показывающие `now`."""
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_is_authenticated__cached(mocker: 'MockFixture') -> None:
+    """Тестирует, что повторная проверка токена партнера не вычисляет хэш."""
+    mocker.patch('scoring_api.auth._auth_cache', AuthCache())
+    generate = mocker.spy(auth, 'generate_auth_token')
+    request = mocker.Mock(spec=MethodRequest)
+    request.is_admin = False
+    request.validated_data = {
+        'login': 'user1',
+        'account': 'account1',
+        'token': generate_auth_token('user1', 'account1'),
+    }
+
+    assert is_authenticated(request)
+    assert is_authenticated(request)
+    generate.assert_called_once()
+
+    request.validated_data = {**request.validated_data, 'token': 'invalid_token'}
+    assert not is_authenticated(request)
+    assert not is_authenticated(request)
+
+
+def test_auth_cache__ttl_and_size() -> None:
+    """Тестирует истечение записей и вытеснение самой давней записи."""
+    clock = FakeClock(0.0)
+    cache = AuthCache(max_size=2, ttl=10, clock=clock)
+
+    cache.add(('a', 'l1', 't1'))
+    cache.add(('a', 'l2', 't2'))
+    assert ('a', 'l1', 't1') in cache  # Запись становится самой свежей
+    cache.add(('a', 'l3', 't3'))
+
+    assert ('a', 'l2', 't2') not in cache
+    assert len(cache) == 2  # noqa: PLR2004
+
+    clock.now = 10.0
+    assert ('a', 'l1', 't1') not in cache
+
+
+def test_admin_token_ring__rotation_and_grace() -> None:
+    """Тестирует смену токена администратора на границе часа и окно приема токенов обоих часов."""
+    boundary = datetime.datetime(2026, 3, 1, 13).timestamp()
+    previous_token = generate_admin_auth_token(datetime.datetime(2026, 3, 1, 12))
+    current_token = generate_admin_auth_token(datetime.datetime(2026, 3, 1, 13))
+    clock = FakeClock(boundary - 600)
+    ring = AdminTokenRing(grace=60, clock=clock)
+
+    assert ring.tokens() == (previous_token,)
+
+    clock.now = boundary - 30
+    assert ring.is_valid(previous_token)
+    assert ring.is_valid(current_token)
+
+    clock.now = boundary + 30
+    assert ring.is_valid(previous_token)
+    assert ring.is_valid(current_token)
+
+    clock.now = boundary + 60
+    assert not ring.is_valid(previous_token)
+    assert ring.is_valid(current_token)
+    assert not ring.is_valid('invalid_token')
+
+
+@pytest.mark.parametrize('is_admin', [False, True], ids=['partner', 'admin'])
+@pytest.mark.parametrize('token', ['\ud800', 'токен', 42], ids=['lone_surrogate', 'not_ascii', 'not_str'])
+def test_is_authenticated__malformed_token(mocker: 'MockFixture', is_admin: bool, token: object) -> None:
+    """Тестирует, что токен, который не является строкой ASCII, отклоняется без исключения."""
+    request = mocker.Mock(spec=MethodRequest)
+    request.is_admin = is_admin
+    request.validated_data = {'login': 'user1', 'account': 'account1', 'token': token}
+
+    assert not is_authenticated(request)
+
+
+def test_is_authenticated__lone_surrogate_login(mocker: 'MockFixture') -> None:
+    """Тестирует, что логин с одиночным суррогатом не прерывает проверку токена."""
+    request = mocker.Mock(spec=MethodRequest)
+    request.is_admin = False
+    request.validated_data = {'login': '\ud800', 'account': 'account1', 'token': 'invalid_token'}
+
+    assert not is_authenticated(request)
@@ -0,0 +1,39 @@
+import pytest
+
+from tests.benchmarks.__main__ import load_benchmarks
+from tests.benchmarks.runner import benchmark, BENCHMARKS, format_time, measure
+
+
+def test_measure() -> None:
+    """Тестирует, что количество вызовов подбирается под длительность замера."""
+    calls = []
+    result = measure('noop', lambda: calls.append(1), repeat=3, min_time=0.001)
+
+    assert len(result.samples) == 3  # noqa: PLR2004
+    assert result.loops > 1
+    assert result.median > 0
+    assert set(result.as_dict()) == {'name', 'loops', 'mean', 'median', 'stdev', 'min', 'samples'}
+
+
+def test_benchmark__duplicate_name() -> None:
+    """Тестирует, что два бенчмарка не могут иметь одно имя."""
+    load_benchmarks()
+    with pytest.raises(ValueError, match='already registered'):
+        benchmark('auth.generate_auth_token')(lambda: lambda: None)
+
+
+def test_benchmarks__run() -> None:
+    """Тестирует, что каждый бенчмарк подготавливается и выполняется без ошибок."""
+    load_benchmarks()
+
+    assert {name.split('.')[0] for name in BENCHMARKS} == {'api', 'auth', 'requests', 'scoring'}
+    for setup in BENCHMARKS.values():
+        setup()()
+
+
+@pytest.mark.parametrize(
+    'seconds, expected', [(1.5, '1.500 s'), (0.0025, '2.500 ms'), (3e-6, '3.000 us'), (4.5e-7, '450.0 ns')]
+)
+def test_format_time(seconds: float, expected: str) -> None:
+    """Тестирует выбор единицы измерения времени."""
+    assert format_time(seconds) == expected
@@ -0,0 +1,94 @@
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from scoring_api.bulk import BulkStorage, read_records, run_bulk, score_record
+from scoring_api.cli import BulkConfig
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockFixture
+
+
+@pytest.fixture
+def storage() -> BulkStorage:
+    """Создает хранилище пакетного расчета без основного хранилища."""
+    return BulkStorage()
+
+
+def test_read_records__csv(tmp_path: 'Path') -> None:
+    """Тестирует чтение CSV: пустые значения отбрасываются, пол приводится к числу."""
+    path = tmp_path / 'clients.csv'
+    path.write_text('id,phone,email,gender,birthday\n1,79175002040,a@b.ru,,\n2,,,1,01.01.2000\n')
+
+    records = list(read_records(str(path), 'csv'))
+
+    assert records == [
+        (2, {'id': '1', 'phone': '79175002040', 'email': 'a@b.ru'}),
+        (3, {'id': '2', 'gender': 1, 'birthday': '01.01.2000'}),
+    ]
+
+
+def test_read_records__ndjson_skips_blank_lines(tmp_path: 'Path') -> None:
+    """Тестирует, что строки NDJSON передаются без разбора, а пустые строки пропускаются."""
+    path = tmp_path / 'clients.ndjson'
+    path.write_text('{"phone": "79175002040"}\n\n{"email": "a@b.ru"}\n')
+
+    assert [line_no for line_no, _ in read_records(str(path), 'ndjson')] == [1, 3]
+
+
+@pytest.mark.parametrize(
+    'payload, expected',
+    [
+        ('{"id": 7, "phone": "79175002040", "email": "a@b.ru"}', {'id': 7, 'score': 3.0}),
+        ({'first_name': 'a', 'last_name': 'b'}, {'score': 0.5}),
+        ('not json', {'error': 'Invalid JSON'}),
+        ('[1, 2]', {'error': 'Record must be an object'}),
+    ],
+    ids=['ndjson_ok', 'csv_ok', 'invalid_json', 'not_object'],
+)
+def test_score_record(storage: BulkStorage, payload: str | dict[str, str], expected: dict[str, object]) -> None:
+    """Тестирует расчет скоринга для одной записи."""
+    assert score_record(payload, storage) == expected
+
+
+@pytest.mark.parametrize(
+    'payload',
+    [{'phone': '89175002040', 'email': 'a@b.ru'}, {'phone': '79175002040'}],
+    ids=['invalid_field', 'missing_pair'],
+)
+def test_score_record__invalid(storage: BulkStorage, payload: dict[str, str]) -> None:
+    """Тестирует, что некорректная запись возвращает ошибку вместо скоринга."""
+    result = score_record(payload, storage)
+
+    assert 'error' in result
+    assert 'score' not in result
+
+
+def test_bulk_storage__populates_backend(mocker: 'MockFixture') -> None:
+    """Тестирует, что кэш не читается, а рассчитанные значения пишутся в основное хранилище."""
+    backend = mocker.Mock()
+    storage = BulkStorage(backend)
+
+    score_record({'phone': '79175002040', 'email': 'a@b.ru'}, storage)
+
+    backend.cache_get.assert_not_called()
+    backend.cache_set.assert_called_once()
+
+
+def test_run_bulk(tmp_path: 'Path') -> None:
+    """Тестирует пакетный расчет: результаты пишутся в порядке входных записей."""
+    input_file = tmp_path / 'clients.ndjson'
+    output_file = tmp_path / 'scores.ndjson'
+    records = [{'id': i, 'phone': '79175002040', 'email': 'a@b.ru'} for i in range(25)]
+    input_file.write_text('\n'.join(json.dumps(r) for r in records) + '\n{"phone": 1}\n')
+
+    stats = run_bulk(BulkConfig(str(input_file), str(output_file), 'ndjson', 2, 4, False, None))
+
+    results = [json.loads(line) for line in output_file.read_text().splitlines()]
+    assert stats.records == len(records) + 1
+    assert stats.errors == 1
+    assert [r['line'] for r in results] == list(range(1, len(records) + 2))
+    assert all(r['score'] == 3.0 for r in results[:-1])  # noqa: PLR2004
@@ -0,0 +1,140 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from scoring_api.cache_policy import AdaptiveCachePolicy, CacheDecision
+from scoring_api.scoring import get_score
+
+if TYPE_CHECKING:
+    from pytest_mock import MockFixture
+
+WARMUP = 10
+PROBE_INTERVAL = 50
+
+
+@pytest.fixture
+def policy() -> AdaptiveCachePolicy:
+    """Создает политику с короткими прогревом и периодом проб."""
+    return AdaptiveCachePolicy('test', warmup_samples=WARMUP, probe_interval=PROBE_INTERVAL)
+
+
+def feed(  # noqa: PLR0913
+    policy: AdaptiveCachePolicy,
+    compute_ns: int,
+    read_ns: int,
+    hit: bool | float,
+    samples: int = WARMUP,
+    write_ns: int | None = None,
+) -> None:
+    """Передает политике одинаковые замеры; `hit` - признак попадания или доля попаданий."""
+    for index in range(samples):
+        policy.decide()
+        policy.record_compute(compute_ns)
+        policy.record_write(read_ns if write_ns is None else write_ns)
+        policy.record_read(read_ns, hit if isinstance(hit, bool) else (index % 10) < hit * 10)
+
+
+def test_policy__caches_during_warmup(policy: AdaptiveCachePolicy) -> None:
+    """Тестирует, что до накопления замеров кэш используется."""
+    feed(policy, compute_ns=100, read_ns=100_000, hit=False, samples=WARMUP - 1)
+
+    assert policy.decide() is CacheDecision.READ_WRITE
+
+
+def test_policy__bypasses_cheap_model(policy: AdaptiveCachePolicy) -> None:
+    """Тестирует, что кэш обходится, если расчет дешевле обращения к хранилищу."""
+    feed(policy, compute_ns=300, read_ns=200_000, hit=True)
+
+    assert policy.decision is CacheDecision.BYPASS
+    decisions = [policy.decide() for _ in range(PROBE_INTERVAL)]
+    assert decisions.count(CacheDecision.READ_WRITE) == 1  # Пробное обращение к кэшу
+    assert policy.stats()['decision'] == CacheDecision.BYPASS.value
+
+
+@pytest.mark.parametrize(
+    'hit, expected',
+    [(True, CacheDecision.READ_WRITE), (False, CacheDecision.BYPASS)],
+    ids=['expensive_model_hits', 'expensive_model_never_hits'],
+)
+def test_policy__expensive_model(policy: AdaptiveCachePolicy, hit: bool, expected: CacheDecision) -> None:
+    """Тестирует, что дорогая модель использует кэш, пока в него есть попадания."""
+    feed(policy, compute_ns=5_000_000, read_ns=200_000, hit=hit)
+
+    assert policy.decide() is expected
+
+
+def test_policy__returns_to_cache_when_storage_gets_faster(policy: AdaptiveCachePolicy) -> None:
+    """Тестирует возврат к кэшу, когда хранилище стало быстрее расчета."""
+    feed(policy, compute_ns=300_000, read_ns=1_000_000, hit=True)
+    assert policy.stats()['decision'] == CacheDecision.BYPASS.value
+
+    feed(policy, compute_ns=300_000, read_ns=1_000, hit=True, samples=200)
+
+    assert policy.decision is CacheDecision.READ_WRITE
+
+
+@pytest.mark.parametrize(
+    'compute_ns, read_ns, write_ns, hit, expected',
+    [
+        (100_000, 20_000, 500_000, True, CacheDecision.READ_ONLY),
+        (100_000, 60_000, 10_000, 0.5, CacheDecision.WRITE_ONLY),
+    ],
+    ids=['hot_keys_expensive_write', 'read_slower_than_saved_compute'],
+)
+def test_policy__one_way_decisions(  # noqa: PLR0913
+    policy: AdaptiveCachePolicy,
+    compute_ns: int,
+    read_ns: int,
+    write_ns: int,
+    hit: bool | float,
+    expected: CacheDecision,
+) -> None:
+    """Тестирует, что чтение и запись кэша выбираются независимо по их выигрышу."""
+    feed(policy, compute_ns=compute_ns, read_ns=read_ns, hit=hit, write_ns=write_ns, samples=WARMUP * 10)
+
+    assert policy.stats()['decision'] == expected.value
+    decisions = [policy.decide() for _ in range(PROBE_INTERVAL)]
+    assert decisions.count(CacheDecision.READ_WRITE) == 1  # Пробное обращение к кэшу
+    assert decisions.count(expected) == PROBE_INTERVAL - 1
+
+
+def test_get_score__bypass_skips_storage(mocker: 'MockFixture', policy: AdaptiveCachePolicy) -> None:
+    """Тестирует, что при обходе кэша хранилище не используется."""
+    storage = mocker.Mock()
+    feed(policy, compute_ns=300, read_ns=200_000, hit=False)
+
+    assert get_score(storage, phone='79175002040', email='a@b.ru', cache_policy=policy) == 3.0  # noqa: PLR2004
+    storage.cache_get.assert_not_called()
+    storage.cache_set.assert_not_called()
+
+
+def test_get_score__measures_cache_path(mocker: 'MockFixture', policy: AdaptiveCachePolicy) -> None:
+    """Тестирует, что при работе через кэш политика получает замеры чтения, расчета и записи."""
+    storage = mocker.Mock()
+    storage.cache_get.return_value = None
+
+    assert get_score(storage, phone='79175002040', cache_policy=policy) == 1.5  # noqa: PLR2004
+    stats = policy.stats()
+
+    assert stats['calls'] == 1
+    assert stats['read_ns'] > 0
+    assert stats['compute_ns'] > 0
+    storage.cache_set.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    'decision, reads, writes',
+    [(CacheDecision.READ_ONLY, True, False), (CacheDecision.WRITE_ONLY, False, True)],
+    ids=['read_only', 'write_only'],
+)
+def test_get_score__one_way_decisions(
+    mocker: 'MockFixture', policy: AdaptiveCachePolicy, decision: CacheDecision, reads: bool, writes: bool
+) -> None:
+    """Тестирует, что при промахе только чтение не записывает оценку, а только запись не читает кэш."""
+    storage = mocker.Mock()
+    storage.cache_get.return_value = None
+    mocker.patch.object(AdaptiveCachePolicy, 'decide', return_value=decision)
+
+    assert get_score(storage, phone='79175002040', cache_policy=policy) == 1.5  # noqa: PLR2004
+    assert storage.cache_get.called is reads
+    assert storage.cache_set.called is writes
@@ -0,0 +1,104 @@
+import json
+import logging
+import random
+from typing import TYPE_CHECKING
+
+from scoring_api.capture import capture_request, configure_capture, TrafficCapture
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+    from pytest_mock import MockFixture
+
+BODY = {
+    'account': 'horns&hoofs',
+    'login': 'h&f',
+    'method': 'online_score',
+    'token': 'secret',
+    'arguments': {'phone': '79175002040', 'email': 'user@otus.ru'},
+}
+
+
+def _read(path: 'Path') -> list[dict[str, object]]:
+    """Читает строки файла записи трафика."""
+    return [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+
+
+def test_traffic_capture__record(tmp_path: 'Path') -> None:
+    """Тестирует формат строки: время поступления, путь и тело запроса без токена."""
+    path = tmp_path / 'traffic.jsonl'
+    capture = TrafficCapture(str(path), clock=lambda: 1700000000.1234567)
+
+    assert capture.record('method', BODY)
+    capture.close()
+
+    body = {key: value for key, value in BODY.items() if key != 'token'}
+    assert _read(path) == [{'ts': 1700000000.123457, 'path': '/method', 'body': body}]
+    assert path.stat().st_mode & 0o777 == 0o600  # noqa: PLR2004
+
+
+def test_traffic_capture__appends(tmp_path: 'Path') -> None:
+    """Тестирует, что запись дописывается в существующий файл."""
+    path = tmp_path / 'traffic.jsonl'
+    for _ in range(2):
+        capture = TrafficCapture(str(path))
+        capture.record('method', BODY)
+        capture.close()
+
+    assert len(_read(path)) == 2  # noqa: PLR2004
+
+
+def test_traffic_capture__sample_rate(tmp_path: 'Path') -> None:
+    """Тестирует, что записывается примерно заданная доля запросов."""
+    path = tmp_path / 'traffic.jsonl'
+    capture = TrafficCapture(str(path), sample_rate=0.1, rng=random.Random(42))
+    recorded = sum(capture.record('method', BODY) for _ in range(10_000))
+    capture.close()
+
+    assert 800 < recorded < 1200  # noqa: PLR2004
+    assert len(_read(path)) == recorded
+
+
+def test_capture_request(tmp_path: 'Path') -> None:
+    """Тестирует, что записываются только запросы методов и только при включенной записи."""
+    path = tmp_path / 'traffic.jsonl'
+    capture_request('method', BODY)
+    configure_capture(str(path))
+    try:
+        capture_request('method', BODY)
+        capture_request('profile', BODY)
+    finally:
+        configure_capture()
+    capture_request('method', BODY)
+
+    assert [entry['path'] for entry in _read(path)] == ['/method']
+
+
+def test_traffic_capture__lone_surrogate(tmp_path: 'Path') -> None:
+    """Тестирует, что строка с одиночным суррогатом из JSON-тела записывается и читается обратно."""
+    path = tmp_path / 'traffic.jsonl'
+    capture = TrafficCapture(str(path))
+
+    assert capture.record('method', {'login': '\ud800'})
+    capture.close()
+
+    assert _read(path)[0]['body'] == {'login': '\ud800'}
+
+
+def test_capture_request__write_error(
+    tmp_path: 'Path', mocker: 'MockFixture', caplog: 'pytest.LogCaptureFixture'
+) -> None:
+    """Тестирует, что ошибка записи не передается обработчику запроса и пишется в журнал один раз."""
+    configure_capture(str(tmp_path / 'traffic.jsonl'))
+    mocker.patch('scoring_api.capture.os.write', side_effect=OSError(28, 'No space left on device'))
+    try:
+        with caplog.at_level(logging.ERROR, logger='scoring_api.capture'):
+            capture_request('method', BODY)
+            capture_request('method', BODY)
+    finally:
+        configure_capture()
+
+    assert [record.getMessage() for record in caplog.records] == [
+        'Traffic capture failed, further errors are only counted'
+    ]
@@ -1,6 +1,6 @@
 import pytest
 
-from scoring_api.cli import parse_arguments, ServerConfig
+from scoring_api.cli import BulkConfig, parse_arguments, parse_bulk_arguments, ServerConfig
 
 
 @pytest.mark.parametrize(
@@ -10,15 +10,89 @@ from scoring_api.cli import parse_arguments, ServerConfig
         (['--port', '9090'], ServerConfig(9090, None)),
         (['--log', 'server.log'], ServerConfig(8080, 'server.log')),
         (['--port', '9090', '--log', 'app.log'], ServerConfig(9090, 'app.log')),
+        (['--scoring-config', 'scoring.json'], ServerConfig(8080, None, 'scoring.json')),
+        (
+            ['-w', '4', '--rate-limit', '2.5', '--rate-burst', '10'],
+            ServerConfig(8080, None, None, workers=4, rate_limit=2.5, rate_burst=10),
+        ),
+        (['--log-sample-rate', '0.5'], ServerConfig(8080, None, log_sample_rate=0.5)),
+        (['--server-timing'], ServerConfig(8080, None, server_timing=True)),
+        (['--profile-dir', '/tmp/profiles'], ServerConfig(8080, None, profile_dir='/tmp/profiles')),
+        (
+            ['--slow-request-ms', '50', '--slow-request-buffer', '10'],
+            ServerConfig(8080, None, slow_request_ms=50.0, slow_request_buffer=10),
+        ),
+        (['--storage', 'memory'], ServerConfig(8080, None, storage='memory')),
+        (
+            ['--capture-file', 'traffic.jsonl', '--capture-sample-rate', '0.1'],
+            ServerConfig(8080, None, capture_file='traffic.jsonl', capture_sample_rate=0.1),
+        ),
     ],
     ids=[
         'test_parse_arguments__default_values',
         'test_parse_arguments__custom_port',
         'test_parse_arguments__custom_log_file',
         'test_parse_arguments__custom_all',
+        'test_parse_arguments__scoring_config',
+        'test_parse_arguments__workers_and_rate_limit',
+        'test_parse_arguments__log_sample_rate',
+        'test_parse_arguments__server_timing',
+        'test_parse_arguments__profile_dir',
+        'test_parse_arguments__slow_request_log',
+        'test_parse_arguments__memory_storage',
+        'test_parse_arguments__capture',
     ],
 )
 def test_parse_arguments__ok(monkeypatch: pytest.MonkeyPatch, args: list[str], expected: ServerConfig) -> None:
     """Тестирует разбор аргументов командной строки с корректными значениями."""
     monkeypatch.setattr('sys.argv', ['scoring_api'] + args)
     assert parse_arguments() == expected
+
+
+@pytest.mark.parametrize(
+    'args',
+    [
+        ['-w', '0'],
+        ['--rate-limit', '0'],
+        ['--rate-burst', '0'],
+        ['--log-sample-rate', '1.5'],
+        ['--slow-request-ms', '-1'],
+        ['--slow-request-buffer', '0'],
+        ['--capture-sample-rate', '0'],
+    ],
+)
+def test_parse_arguments__invalid(monkeypatch: pytest.MonkeyPatch, args: list[str]) -> None:
+    """Тестирует, что некорректное число процессов и параметры лимита отклоняются."""
+    monkeypatch.setattr('sys.argv', ['scoring_api'] + args)
+    with pytest.raises(SystemExit):
+        parse_arguments()
+
+
+@pytest.mark.parametrize(
+    'args, expected',
+    [
+        (['in.csv', 'out.ndjson'], BulkConfig('in.csv', 'out.ndjson', 'csv', None, 1000, False, None)),
+        (['in.json', 'out.ndjson'], BulkConfig('in.json', 'out.ndjson', 'ndjson', None, 1000, False, None)),
+        (
+            ['in.txt', 'out.ndjson', '--format', 'csv', '-w', '4', '-c', '50', '--populate-cache', '-a', 'h&f'],
+            BulkConfig('in.txt', 'out.ndjson', 'csv', 4, 50, True, None, None, 'h&f'),
+        ),
+    ],
+    ids=[
+        'test_parse_bulk_arguments__csv_by_extension',
+        'test_parse_bulk_arguments__ndjson_by_default',
+        'test_parse_bulk_arguments__custom_all',
+    ],
+)
+def test_parse_bulk_arguments__ok(monkeypatch: pytest.MonkeyPatch, args: list[str], expected: BulkConfig) -> None:
+    """Тестирует разбор аргументов пакетного расчета скоринга."""
+    monkeypatch.setattr('sys.argv', ['scoring_api.bulk'] + args)
+    assert parse_bulk_arguments() == expected
+
+
+@pytest.mark.parametrize('args', [['in.csv', 'out.ndjson', '-w', '0'], ['in.csv', 'out.ndjson', '-c', '0']])
+def test_parse_bulk_arguments__invalid(monkeypatch: pytest.MonkeyPatch, args: list[str]) -> None:
+    """Тестирует, что некорректное число процессов или размер порции отклоняются."""
+    monkeypatch.setattr('sys.argv', ['scoring_api.bulk'] + args)
+    with pytest.raises(SystemExit):
+        parse_bulk_arguments()
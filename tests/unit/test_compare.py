@@ -0,0 +1,107 @@
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.benchmarks.compare import compare, main, mann_whitney_u, Measurement, Verdict
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+BASE = [1.00, 1.01, 0.99, 1.02, 0.98, 1.00, 1.01, 0.99, 1.00, 1.02]
+
+
+def scaled(factor: float) -> list[float]:
+    """Возвращает замеры базового запуска, умноженные на `factor`."""
+    return [value * factor for value in BASE]
+
+
+@pytest.mark.parametrize(
+    'first, second, expected',
+    [
+        ([1, 2, 3, 4, 5], [6, 7, 8, 9, 10], 0.0122),
+        ([1, 2, 3, 4, 5], [1, 2, 3, 4, 5], 1.0),
+        ([1, 1, 1], [1, 1, 1], 1.0),
+    ],
+)
+def test_mann_whitney_u(first: list[float], second: list[float], expected: float) -> None:
+    """Тестирует p-значение критерия Манна-Уитни (значения совпадают с `scipy.stats.mannwhitneyu`)."""
+    assert mann_whitney_u(first, second) == pytest.approx(expected, abs=1e-4)
+
+
+@pytest.mark.parametrize(
+    'factor, higher_is_better, expected',
+    [
+        (1.2, False, Verdict.REGRESSION),
+        (0.8, False, Verdict.IMPROVEMENT),
+        (1.05, False, Verdict.UNCHANGED),  # Изменение меньше порога шума
+        (0.8, True, Verdict.REGRESSION),  # Пропускная способность упала
+    ],
+)
+def test_compare(factor: float, higher_is_better: bool, expected: Verdict) -> None:
+    """Тестирует итог сравнения по порогу шума и направлению показателя."""
+    baseline = {'scoring.evaluate': Measurement('scoring.evaluate', BASE, higher_is_better)}
+    current = {'scoring.evaluate': Measurement('scoring.evaluate', scaled(factor), higher_is_better)}
+
+    assert compare(baseline, current)[0].verdict is expected
+
+
+def test_compare__not_significant() -> None:
+    """Тестирует, что изменение медианы без значимого различия выборок не считается регрессией."""
+    baseline = {'api.post': Measurement('api.post', [1.0, 1.0, 2.0, 2.0])}
+    current = {'api.post': Measurement('api.post', [1.0, 2.0, 2.0, 2.0])}
+
+    comparison = compare(baseline, current)[0]
+    assert comparison.change == pytest.approx(1 / 3)
+    assert comparison.verdict is Verdict.UNCHANGED
+
+
+def test_compare__limits_and_missing() -> None:
+    """Тестирует пороги групп и показатели, которых нет в одном из запусков."""
+    baseline = {
+        'api.post': Measurement('api.post', BASE),
+        'auth.token': Measurement('auth.token', BASE),
+    }
+    current = {
+        'api.post': Measurement('api.post', scaled(1.2)),
+        'scoring.new': Measurement('scoring.new', BASE),
+    }
+
+    verdicts = {comparison.name: comparison.verdict for comparison in compare(baseline, current, limits={'api.': 0.3})}
+    assert verdicts == {'api.post': Verdict.UNCHANGED, 'auth.token': Verdict.MISSING, 'scoring.new': Verdict.NEW}
+
+
+def test_main(tmp_path: 'Path', capsys: pytest.CaptureFixture[str]) -> None:
+    """Тестирует отчет и код завершения при регрессии бенчмарка и нагрузочного теста."""
+
+    def write(name: str, data: object) -> str:
+        path = tmp_path / name
+        path.write_text(json.dumps(data))
+        return str(path)
+
+    baseline = write('baseline.json', {'benchmarks': [{'name': 'scoring.evaluate', 'samples': BASE}]})
+    same = write('same.json', {'benchmarks': [{'name': 'scoring.evaluate', 'samples': scaled(1.01)}]})
+    slower = write('slower.json', {'benchmarks': [{'name': 'scoring.evaluate', 'samples': scaled(1.5)}]})
+    load_base = write('load-base.json', {'rps_samples': scaled(100), 'total': {'p50_ms': 1.0, 'p99_ms': 5.0}})
+    load_slow = write('load.json', {'rps_samples': scaled(50), 'total': {'p50_ms': 1.0, 'p99_ms': 5.1}})
+
+    assert main([baseline, same]) == 0
+    assert main([baseline, slower]) == 1
+    assert main([baseline, same, '--load-baseline', load_base, '--load', load_slow]) == 1
+
+    output = capsys.readouterr().out
+    assert '[load]' in output
+    assert 'load.rps' in output
+    assert '1 regression(s) in 4 benchmark(s)' in output
+
+
+def test_main__missing_baseline(tmp_path: 'Path', capsys: pytest.CaptureFixture[str]) -> None:
+    """Тестирует, что без базового запуска выводится подсказка, как его записать."""
+    current = tmp_path / 'current.json'
+    current.write_text(json.dumps({'benchmarks': []}))
+
+    with pytest.raises(SystemExit) as error:
+        main([str(tmp_path / 'baseline.json'), str(current)])
+
+    assert error.value.code == 2  # noqa: PLR2004
+    assert 'make bench-baseline' in capsys.readouterr().err
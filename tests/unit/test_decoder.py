@@ -0,0 +1,22 @@
+import pytest
+
+from scoring_api.decoder import decode_json_object, DecodeError
+
+
+def test_decode_json_object__ok() -> None:
+    """Тестирует декодирование JSON-объекта из байтов."""
+    assert decode_json_object(b'{"login": "h&f", "arguments": {"phone": 7}}') == {
+        'login': 'h&f',
+        'arguments': {'phone': 7},
+    }
+
+
+@pytest.mark.parametrize(
+    'raw',
+    [b'', b'{"login": ', b'[1, 2]', b'"text"', b'null', b'\xff\xfe{'],
+    ids=['empty', 'truncated', 'array', 'string', 'null', 'invalid_utf8'],
+)
+def test_decode_json_object__error(raw: bytes) -> None:
+    """Тестирует отклонение тела, которое не является JSON-объектом."""
+    with pytest.raises(DecodeError):
+        decode_json_object(raw)
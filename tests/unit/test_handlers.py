@@ -1,12 +1,19 @@
+import datetime
 from typing import TYPE_CHECKING
 
 import pytest
 
-from scoring_api.constants import ADMIN_LOGIN, HTTPStatus
-from scoring_api.handlers import method_handler, MethodName
+from scoring_api.constants import ADMIN_LOGIN, HTTPStatus, MAX_TOP_INTERESTS_CLIENTS
+from scoring_api.handlers import method_handler, MethodName, profile_handler, ProfileAction
+from scoring_api.interests import InterestsIndex, record_interests
+from scoring_api.profiling import configure_profiling
+from scoring_api.ratelimit import configure_rate_limiter
+from scoring_api.storage.memory import MemoryStorage
+from scoring_api.timing import start_timing, stop_timing
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from pathlib import Path
     from typing import Any
 
     from pytest_mock import MockFixture
@@ -15,7 +22,7 @@ if TYPE_CHECKING:
 
 
 @pytest.fixture
-def context() -> dict[str, int]:
+def context() -> dict[str, 'Any']:
     """Создает фикстуру для контекста запроса."""
     return {}
 
@@ -35,7 +42,7 @@ def storage_mock(mocker: 'MockFixture') -> 'StorageInterface':
 def get_response(
     request: dict[str, str],
     headers: dict[str, str],
-    context: dict[str, int],
+    context: dict[str, 'Any'],
     storage_mock: 'StorageInterface',
 ) -> tuple[dict[str, 'Any'], int]:
     """Вызывает `method_handler` и возвращает ответ."""
@@ -48,7 +55,7 @@ def get_response(
     ids=['test_method_handler__empty_request'],
 )
 def test_method_handler__empty_request(
-    request_data: dict[str, str], headers: dict[str, str], context: dict[str, int], storage_mock: 'StorageInterface'
+    request_data: dict[str, str], headers: dict[str, str], context: dict[str, 'Any'], storage_mock: 'StorageInterface'
 ) -> None:
     """Тестирует пустой запрос."""
     response, code = get_response(request_data, headers, context, storage_mock)
@@ -66,7 +73,7 @@ def test_method_handler__empty_request(
     ids=lambda req: f'test_method_handler__invalid_request: {req}',
 )
 def test_method_handler__invalid_request(
-    request_data: dict[str, str], headers: dict[str, str], context: dict[str, int], storage_mock: 'StorageInterface'
+    request_data: dict[str, str], headers: dict[str, str], context: dict[str, 'Any'], storage_mock: 'StorageInterface'
 ) -> None:
     """Тестирует обработку запроса с недопустимой структурой метода."""
     response, code = get_response(request_data, headers, context, storage_mock)
@@ -84,7 +91,7 @@ def test_method_handler__unauthorized_request(
     make_valid_api_request: 'Callable[..., dict[str, Any]]',
     auth_valid: bool,
     headers: dict[str, str],
-    context: dict[str, int],
+    context: dict[str, 'Any'],
     storage_mock: 'StorageInterface',
 ) -> None:
     """Тестирует обработку запроса с неудачной аутентификацией."""
@@ -97,6 +104,25 @@ def test_method_handler__unauthorized_request(
     assert 'error' in response
 
 
+def test_method_handler__rate_limited(
+    make_valid_api_request: 'Callable[..., dict[str, Any]]',
+    headers: dict[str, str],
+    context: dict[str, 'Any'],
+    storage_mock: 'StorageInterface',
+) -> None:
+    """Тестирует, что запросы сверх лимита частоты отклоняются с кодом 429."""
+    storage_mock.cache_get.return_value = None
+    request_data = make_valid_api_request(method=MethodName.ONLINE_SCORE)
+
+    configure_rate_limiter(0.001, burst=2)
+    try:
+        codes = [get_response(request_data, headers, context, storage_mock)[1] for _ in range(3)]
+    finally:
+        configure_rate_limiter(None)
+
+    assert codes == [HTTPStatus.OK.value, HTTPStatus.OK.value, HTTPStatus.TOO_MANY_REQUESTS.value]
+
+
 @pytest.mark.parametrize(
     'arguments',
     [
@@ -128,7 +154,7 @@ def test_handle_online_score__invalid_request(
     make_valid_api_request: 'Callable[..., dict[str, Any]]',
     storage_mock: 'StorageInterface',
     headers: dict[str, str],
-    context: dict[str, int],
+    context: dict[str, 'Any'],
 ) -> None:
     """Тестирует обработку запроса `online_score` с некорректными аргументами."""
     mocker.patch('scoring_api.auth.is_authenticated', return_value=True)
@@ -176,7 +202,7 @@ def test_handle_online_score__request_ok(
     expected_score: float,
     make_valid_api_request: 'Callable[..., dict[str, Any]]',
     headers: dict[str, str],
-    context: dict[str, int],
+    context: dict[str, 'Any'],
     storage_mock: 'StorageInterface',
 ) -> None:
     """Тестирует валидные запросы `handle_online_score`."""
@@ -189,12 +215,32 @@ def test_handle_online_score__request_ok(
     assert 'score' in response
     assert isinstance(response['score'], float)
     assert response['score'] == expected_score  # ✅ Now matches correct values
+    assert context['method'] == MethodName.ONLINE_SCORE
+
+
+def test_method_handler__phase_timings(
+    make_valid_api_request: 'Callable[..., dict[str, Any]]',
+    headers: dict[str, str],
+    context: dict[str, 'Any'],
+    storage_mock: 'StorageInterface',
+) -> None:
+    """Тестирует, что при включенном измерении записывается время этапов проверки и аутентификации."""
+    storage_mock.cache_get.return_value = None
+    request_data = make_valid_api_request(method=MethodName.ONLINE_SCORE)
+
+    timer, token = start_timing()
+    try:
+        get_response(request_data, headers, context, storage_mock)
+    finally:
+        stop_timing(token)
+
+    assert list(timer.timings) == ['validate', 'auth', 'arguments']
 
 
 def test_handle_online_score__admin_request_ok(
     make_valid_api_request: 'Callable[..., dict[str, Any]]',
     headers: dict[str, str],
-    context: dict[str, int],
+    context: dict[str, 'Any'],
     storage_mock: 'StorageInterface',
 ) -> None:
     """Тестирует `handle_online_score` для администратора."""
@@ -232,18 +278,217 @@ def test_handle_clients_interests__ok(  # noqa: PLR0913
     storage_data: dict[str, str],
     expected_response: dict[str, list[str]],
     headers: dict[str, str],
-    context: dict[str, int],
+    context: dict[str, 'Any'],
     storage_mock: 'StorageInterface',
 ) -> None:
     """Тестирует `handle_clients_interests` с валидными client_ids."""
 
-    def mock_get(key: str) -> str | None:
-        return storage_data.get(key)
+    def mock_get_many(keys: list[str]) -> dict[str, str]:
+        return {key: storage_data[key] for key in keys if key in storage_data}
 
-    storage_mock.get.side_effect = mock_get
+    storage_mock.get_many.side_effect = mock_get_many
 
     request_data = make_valid_api_request(method=MethodName.CLIENTS_INTERESTS, arguments={'client_ids': client_ids})
     response, code = get_response(request_data, headers, context, storage_mock)
 
     assert code == HTTPStatus.OK.value
     assert response == expected_response
+
+
+def test_handle_clients_interests__with_date(
+    make_valid_api_request: 'Callable[..., dict[str, Any]]',
+    headers: dict[str, str],
+    context: dict[str, 'Any'],
+) -> None:
+    """Тестирует `handle_clients_interests` с датой: возвращаются интересы на эту дату."""
+    storage = MemoryStorage()
+    record_interests(storage, 7, datetime.date(2017, 7, 1), ['books'], InterestsIndex())
+    record_interests(storage, 7, datetime.date(2017, 8, 1), ['travel'], InterestsIndex())
+
+    request_data = make_valid_api_request(
+        method=MethodName.CLIENTS_INTERESTS, arguments={'client_ids': [7, 8], 'date': '20.07.2017'}
+    )
+    response, code = get_response(request_data, headers, context, storage)
+
+    assert code == HTTPStatus.OK.value
+    assert response == {'7': ['books'], '8': []}
+
+
+@pytest.mark.parametrize(
+    'arguments, expected_response',
+    [
+        ({'client_ids': [1, 2]}, {'clients': 2, 'top': [['books', 2], ['tv', 1]]}),
+        ({'client_ids': [1, 2], 'limit': 1}, {'clients': 2, 'top': [['books', 2]]}),
+    ],
+    ids=['test_handle_clients_interests_top__default_limit', 'test_handle_clients_interests_top__limit'],
+)
+def test_handle_clients_interests_top__ok(
+    make_valid_api_request: 'Callable[..., dict[str, Any]]',
+    arguments: dict[str, 'Any'],
+    expected_response: dict[str, 'Any'],
+    headers: dict[str, str],
+    context: dict[str, 'Any'],
+) -> None:
+    """Тестирует `handle_clients_interests_top` с валидными аргументами."""
+    storage = MemoryStorage()
+    storage.cache_set('i:1', '["books", "tv"]')
+    storage.cache_set('i:2', '["books"]')
+
+    request_data = make_valid_api_request(method=MethodName.CLIENTS_INTERESTS_TOP, arguments=arguments)
+    response, code = get_response(request_data, headers, context, storage)
+
+    assert code == HTTPStatus.OK.value
+    assert response == expected_response
+    assert context['nclients'] == len(arguments['client_ids'])
+
+
+@pytest.mark.parametrize('limit', [0, -1, True, '5', 1001])
+def test_handle_clients_interests_top__invalid_limit(
+    make_valid_api_request: 'Callable[..., dict[str, Any]]',
+    limit: object,
+    headers: dict[str, str],
+    context: dict[str, 'Any'],
+    storage_mock: 'StorageInterface',
+) -> None:
+    """Тестирует `handle_clients_interests_top` с некорректным `limit`."""
+    request_data = make_valid_api_request(
+        method=MethodName.CLIENTS_INTERESTS_TOP, arguments={'client_ids': [1], 'limit': limit}
+    )
+    response, code = get_response(request_data, headers, context, storage_mock)
+
+    assert code == HTTPStatus.INVALID_REQUEST.value
+    assert 'limit' in response['error']
+
+
+def test_handle_clients_interests_top__too_many_clients(
+    make_valid_api_request: 'Callable[..., dict[str, Any]]',
+    headers: dict[str, str],
+    context: dict[str, 'Any'],
+    storage_mock: 'StorageInterface',
+) -> None:
+    """Тестирует, что запрос с количеством клиентов больше `MAX_TOP_INTERESTS_CLIENTS` отклоняется без чтения."""
+    request_data = make_valid_api_request(
+        method=MethodName.CLIENTS_INTERESTS_TOP, arguments={'client_ids': list(range(MAX_TOP_INTERESTS_CLIENTS + 1))}
+    )
+    response, code = get_response(request_data, headers, context, storage_mock)
+
+    assert code == HTTPStatus.INVALID_REQUEST.value
+    assert 'client_ids' in response['error']
+
+
+def test_handle_clients_interests__pagination(
+    make_valid_api_request: 'Callable[..., dict[str, Any]]',
+    headers: dict[str, str],
+    mocker: 'MockFixture',
+) -> None:
+    """Тестирует обход большого списка клиентов по курсору: из хранилища читается только страница."""
+    storage = MemoryStorage()
+    for cid in range(1, 6):
+        storage.cache_set(f'i:{cid}', f'["interest {cid}"]')
+    get_many = mocker.spy(storage, 'get_many')
+
+    arguments: dict[str, Any] = {'client_ids': [1, 2, 3, 4, 5], 'page_size': 2}
+    pages = []
+    while True:
+        context: dict[str, Any] = {}
+        request_data = make_valid_api_request(method=MethodName.CLIENTS_INTERESTS, arguments=arguments)
+        response, code = get_response(request_data, headers, context, storage)
+
+        assert code == HTTPStatus.OK.value
+        pages.append(sorted(response))
+        if 'next_cursor' not in context:
+            break
+        arguments = {**arguments, 'cursor': context['next_cursor']}
+
+    assert pages == [['1', '2'], ['3', '4'], ['5']]
+    assert [len(call.args[0]) for call in get_many.call_args_list] == [2, 2, 1]
+
+
+@pytest.mark.parametrize(
+    'arguments',
+    [
+        {'client_ids': [1, 2, 3], 'cursor': 'garbage'},
+        {'client_ids': [1, 2, 3], 'page_size': 1001},
+        {'client_ids': [1, 2, 3], 'page_size': 0},
+    ],
+    ids=['invalid_cursor', 'page_size_too_large', 'page_size_zero'],
+)
+def test_handle_clients_interests__invalid_page(
+    make_valid_api_request: 'Callable[..., dict[str, Any]]',
+    arguments: dict[str, 'Any'],
+    headers: dict[str, str],
+    context: dict[str, 'Any'],
+    storage_mock: 'StorageInterface',
+) -> None:
+    """Тестирует `handle_clients_interests` с некорректными параметрами страницы."""
+    request_data = make_valid_api_request(method=MethodName.CLIENTS_INTERESTS, arguments=arguments)
+    response, code = get_response(request_data, headers, context, storage_mock)
+
+    assert code == HTTPStatus.INVALID_REQUEST.value
+    assert 'next_cursor' not in context
+
+
+def test_handle_clients_interests__duplicate_ids(
+    make_valid_api_request: 'Callable[..., dict[str, Any]]',
+    headers: dict[str, str],
+    context: dict[str, 'Any'],
+    mocker: 'MockFixture',
+) -> None:
+    """Тестирует, что повторяющиеся идентификаторы читаются из хранилища один раз."""
+    storage = MemoryStorage()
+    storage.cache_set('i:1', '["books"]')
+    get_many = mocker.spy(storage, 'get_many')
+
+    request_data = make_valid_api_request(method=MethodName.CLIENTS_INTERESTS, arguments={'client_ids': [1, 2, 1, 1]})
+    response, code = get_response(request_data, headers, context, storage)
+
+    assert code == HTTPStatus.OK.value
+    assert response == {'1': ['books'], '2': []}
+    assert context['nclients'] == 2  # noqa: PLR2004
+    get_many.assert_called_once_with(['i:1', 'i:2'])
+
+
+def test_profile_handler__forbidden_for_non_admin(
+    make_valid_api_request: 'Callable[..., dict[str, Any]]',
+    headers: dict[str, str],
+    context: dict[str, 'Any'],
+    storage_mock: 'StorageInterface',
+) -> None:
+    """Тестирует, что управлять профилированием может только администратор."""
+    request_data = make_valid_api_request(method=ProfileAction.START, arguments={})
+    response, code = profile_handler({'body': request_data, 'headers': headers}, context, storage_mock)
+
+    assert code == HTTPStatus.FORBIDDEN.value
+
+
+def test_profile_handler__start_and_stop(
+    make_valid_api_request: 'Callable[..., dict[str, Any]]',
+    headers: dict[str, str],
+    context: dict[str, 'Any'],
+    storage_mock: 'StorageInterface',
+    tmp_path: 'Path',
+) -> None:
+    """Тестирует запуск и остановку профиля администратором."""
+
+    def call(action: ProfileAction, arguments: dict[str, 'Any']) -> tuple[dict[str, 'Any'], int]:
+        request_data = make_valid_api_request(method=action, login=ADMIN_LOGIN, arguments=arguments)
+        return profile_handler({'body': request_data, 'headers': headers}, context, storage_mock)
+
+    configure_profiling(str(tmp_path))
+    try:
+        response, code = call(ProfileAction.START, {'mode': 'deterministic', 'duration': 10})
+        assert code == HTTPStatus.OK.value
+        assert response['mode'] == 'deterministic'
+
+        response, code = call(ProfileAction.START, {})
+        assert code == HTTPStatus.INVALID_REQUEST.value
+
+        response, code = call(ProfileAction.STOP, {})
+        assert code == HTTPStatus.OK.value
+        assert response['output'].endswith('.pstats')
+
+        response, code = call(ProfileAction.START, {'mode': 'unknown'})
+        assert code == HTTPStatus.INVALID_REQUEST.value
+        assert response['error'].startswith('mode: Unknown profile mode')
+    finally:
+        configure_profiling()
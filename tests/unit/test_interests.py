@@ -0,0 +1,202 @@
+import datetime
+from array import array
+from typing import TYPE_CHECKING
+
+import pytest
+
+from scoring_api.interests import (
+    bucket_key,
+    get_current_interests,
+    get_interests_as_of,
+    get_top_interests,
+    index_key,
+    InterestsIndex,
+    record_interests,
+    unique_client_ids,
+)
+from scoring_api.scoring import get_interests
+from scoring_api.storage.memory import MemoryStorage
+
+if TYPE_CHECKING:
+    from pytest_mock import MockFixture
+
+
+@pytest.fixture
+def storage() -> MemoryStorage:
+    """Создает хранилище с историей интересов двух клиентов."""
+    storage = MemoryStorage()
+    index = InterestsIndex()
+
+    record_interests(storage, 1, datetime.date(2017, 7, 10), ['books'], index)
+    record_interests(storage, 1, datetime.date(2017, 7, 20), ['books', 'hi-tech'], index)
+    record_interests(storage, 2, datetime.date(2017, 7, 15), ['pets'], index)
+
+    return storage
+
+
+def test_record_interests__writes_bucket_and_index(storage: MemoryStorage) -> None:
+    """Тестирует формат ключей корзины и индекса."""
+    day = datetime.date(2017, 7, 20).toordinal()
+
+    assert bucket_key(1, day) == 'i:1:20170720'
+    assert storage.get('i:1:20170720') == '["books", "hi-tech"]'
+    assert storage.get(index_key(1)) == f'{datetime.date(2017, 7, 10).toordinal()},{day}'
+
+
+@pytest.mark.parametrize(
+    'date, expected',
+    [
+        (datetime.date(2017, 7, 1), {'1': [], '2': [], '3': []}),
+        (datetime.date(2017, 7, 10), {'1': ['books'], '2': [], '3': []}),
+        (datetime.date(2017, 7, 16), {'1': ['books'], '2': ['pets'], '3': []}),
+        (datetime.date(2018, 1, 1), {'1': ['books', 'hi-tech'], '2': ['pets'], '3': []}),
+    ],
+    ids=['before_history', 'exact_bucket_day', 'between_buckets', 'after_history'],
+)
+def test_get_interests_as_of(storage: MemoryStorage, date: datetime.date, expected: dict[str, list[str]]) -> None:
+    """Тестирует выбор последней корзины не позже даты."""
+    assert get_interests_as_of(storage, [1, 2, 3], date, InterestsIndex()) == expected
+
+
+def test_get_interests_as_of__bulk_reads(mocker: 'MockFixture', storage: MemoryStorage) -> None:
+    """Тестирует, что холодный запрос читает индекс и корзины двумя пакетными чтениями, а теплый - одним."""
+    index = InterestsIndex()
+    get_many = mocker.spy(storage, 'get_many')
+    date = datetime.date(2018, 1, 1)
+
+    get_interests_as_of(storage, [1, 2, 3], date, index)
+    assert get_many.call_count == 2  # noqa: PLR2004
+
+    get_interests_as_of(storage, [1, 2, 3], date, index)
+    assert get_many.call_count == 3  # noqa: PLR2004
+    assert get_many.call_args.args[0] == ['i:1:20170720', 'i:2:20170715']
+
+
+def test_interests_index__expires_and_evicts(mocker: 'MockFixture', storage: MemoryStorage) -> None:
+    """Тестирует ограничение размера индекса: записи одной загрузки не вытесняют друг друга."""
+    index = InterestsIndex(max_clients=2)
+
+    days = index.load(storage, [1, 2, 3])
+
+    assert sorted(days) == [1, 2, 3]
+    assert list(days[1]) == [datetime.date(2017, 7, 10).toordinal(), datetime.date(2017, 7, 20).toordinal()]
+    assert len(days[3]) == 0  # Нет корзин
+    assert len(index) == 2  # noqa: PLR2004
+
+    index.load(storage, [3])
+    get_many = mocker.spy(storage, 'get_many')
+    index.load(storage, [1, 2])
+
+    get_many.assert_called_once_with(['ix:1'])  # Клиент 1 вытеснен следующей загрузкой, клиент 2 остался
+
+
+@pytest.mark.parametrize('value', ['garbage', '1,,2', '-5'], ids=['not_number', 'empty_day', 'negative'])
+def test_get_interests_as_of__corrupted_index(
+    storage: MemoryStorage, value: str, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Тестирует, что поврежденный индекс клиента считается отсутствующим и не прерывает запрос."""
+    storage.cache_set(index_key(2), value)
+
+    result = get_interests_as_of(storage, [1, 2], datetime.date(2018, 1, 1), InterestsIndex())
+
+    assert result == {'1': ['books', 'hi-tech'], '2': []}
+    assert 'Corrupted interests index ix:2' in caplog.text
+
+
+def test_interests_index__reloads_expired(mocker: 'MockFixture', storage: MemoryStorage) -> None:
+    """Тестирует, что устаревшие записи индекса перечитываются из хранилища."""
+    index = InterestsIndex(ttl=0)
+    get_many = mocker.spy(storage, 'get_many')
+
+    index.load(storage, [1])
+    index.load(storage, [1])
+
+    assert get_many.call_count == 2  # noqa: PLR2004
+
+
+@pytest.fixture
+def many_clients() -> MemoryStorage:
+    """Создает хранилище с корзиной интересов у каждого из пяти клиентов."""
+    storage = MemoryStorage()
+    index = InterestsIndex()
+    for cid in range(1, 6):
+        record_interests(storage, cid, datetime.date(2017, 7, 10), ['books'], index)
+    return storage
+
+
+def test_get_interests_as_of__more_clients_than_index(many_clients: MemoryStorage) -> None:
+    """Тестирует, что интересы на дату верны для запроса, в котором клиентов больше, чем помещается в индекс."""
+    index = InterestsIndex(max_clients=3)
+
+    result = get_interests_as_of(many_clients, [1, 2, 3, 4, 5], datetime.date(2018, 1, 1), index)
+
+    assert result == {str(cid): ['books'] for cid in range(1, 6)}
+    assert len(index) == 3  # noqa: PLR2004
+
+
+def test_get_top_interests__more_clients_than_index(many_clients: MemoryStorage) -> None:
+    """Тестирует, что популярные интересы на дату учитывают всех клиентов, даже если индекс меньше запроса."""
+    index = InterestsIndex(max_clients=3)
+
+    result = get_top_interests(many_clients, [1, 2, 3, 4, 5], 10, datetime.date(2018, 1, 1), index)
+
+    assert result == {'clients': 5, 'top': [['books', 5]]}
+
+
+def test_get_interests__with_date(storage: MemoryStorage) -> None:
+    """Тестирует, что `get_interests` учитывает дату, а без даты читает недатированные интересы."""
+    storage.cache_set('i:1', '["undated"]')
+
+    assert get_interests(storage, [1], datetime.date(2017, 7, 12)) == {'1': ['books']}
+    assert get_interests(storage, [1]) == {'1': ['undated']}
+
+
+def test_get_top_interests__counts_clients_per_interest(mocker: 'MockFixture') -> None:
+    """Тестирует подсчет клиентов по интересам одним пакетным чтением."""
+    storage = MemoryStorage()
+    storage.cache_set('i:1', '["books", "tv", "books"]')
+    storage.cache_set('i:2', '["tv", "pets"]')
+    storage.cache_set('i:3', '["tv", "pets"]')
+    get_many = mocker.spy(storage, 'get_many')
+
+    result = get_top_interests(storage, [1, 2, 3, 3, 4], limit=2)
+
+    assert result == {'clients': 4, 'top': [['tv', 3], ['pets', 2]]}
+    assert get_many.call_count == 1
+    assert get_many.call_args.args[0] == ['i:1', 'i:2', 'i:3', 'i:4']
+
+
+def test_get_top_interests__chunks(mocker: 'MockFixture') -> None:
+    """Тестирует, что интересы читаются частями, а топ считается по всем клиентам."""
+    storage = MemoryStorage()
+    storage.cache_set('i:1', '["books"]')
+    storage.cache_set('i:2', '["tv"]')
+    storage.cache_set('i:3', '["tv"]')
+    get_many = mocker.spy(storage, 'get_many')
+
+    result = get_top_interests(storage, [1, 2, 1, 3], limit=1, chunk_size=2)
+
+    assert result == {'clients': 3, 'top': [['tv', 2]]}
+    assert [call.args[0] for call in get_many.call_args_list] == [['i:1', 'i:2'], ['i:3']]
+
+
+def test_get_top_interests__with_date(storage: MemoryStorage) -> None:
+    """Тестирует подсчет интересов на дату; при равенстве интересы упорядочены по названию."""
+    result = get_top_interests(storage, [1, 2], limit=10, date=datetime.date(2017, 7, 16), index=InterestsIndex())
+
+    assert result == {'clients': 2, 'top': [['books', 1], ['pets', 1]]}
+
+
+def test_get_current_interests__single_bulk_read(mocker: 'MockFixture') -> None:
+    """Тестирует, что текущие интересы читаются одним пакетным запросом."""
+    storage = MemoryStorage()
+    storage.cache_set('i:1', '["books"]')
+    get_many = mocker.spy(storage, 'get_many')
+
+    assert get_current_interests(storage, array('q', [1, 2])) == {'1': ['books'], '2': []}
+    get_many.assert_called_once_with(['i:1', 'i:2'])
+
+
+def test_unique_client_ids() -> None:
+    """Тестирует удаление повторов с сохранением порядка."""
+    assert unique_client_ids(array('q', [3, 1, 3, 2, 1])) == array('q', [3, 1, 2])
@@ -0,0 +1,76 @@
+import datetime
+import hashlib
+from typing import TYPE_CHECKING
+
+import pytest
+
+from scoring_api.keys import legacy_score_key, score_key
+from scoring_api.scoring import get_score
+
+if TYPE_CHECKING:
+    from pytest_mock import MockFixture
+
+
+@pytest.mark.parametrize(
+    'first_name, last_name, phone, birthday, raw',
+    [
+        ('John', 'Doe', '79175002040', datetime.date(2000, 1, 1), 'JohnDoe7917500204020000101'),
+        (None, None, 79175002040, None, '79175002040'),
+        (None, None, None, None, 'None'),
+    ],
+    ids=['all_fields', 'int_phone', 'no_phone_quirk'],
+)
+def test_legacy_score_key(
+    first_name: str | None, last_name: str | None, phone: str | int | None, birthday: datetime.date | None, raw: str
+) -> None:
+    """Тестирует, что ключ прежнего формата совпадает с исходным алгоритмом."""
+    expected = 'uid:' + hashlib.md5(raw.encode('utf-8')).hexdigest()
+
+    assert legacy_score_key(first_name, last_name, phone, birthday) == expected
+
+
+def test_score_key__format() -> None:
+    """Тестирует формат ключа: версионированное пространство имен и компактный дайджест."""
+    key = score_key('John', 'Doe', '79175002040', datetime.date(2000, 1, 1))
+    prefix, version, digest = key.split(':')
+
+    assert (prefix, version) == ('uid', 'v2')
+    assert len(digest) == 20  # noqa: PLR2004
+    assert score_key('John', 'Doe', '79175002040', None, namespace='alt').startswith('alt:v2:')
+
+
+@pytest.mark.parametrize(
+    'first, second',
+    [
+        (('John', 'Doe', '79175002040', None), ('John', 'Doe', 79175002040, None)),
+    ],
+    ids=['str_and_int_phone'],
+)
+def test_score_key__equal(first: tuple[str, str, str | int, None], second: tuple[str, str, str | int, None]) -> None:
+    """Тестирует, что одинаковые данные дают одинаковый ключ."""
+    assert score_key(*first) == score_key(*second)
+
+
+@pytest.mark.parametrize(
+    'first, second',
+    [
+        ((None, None, None, None), (None, None, 'None', None)),
+        (('ab', '', None, None), ('a', 'b', None, None)),
+    ],
+    ids=['missing_phone_is_not_none_string', 'field_boundaries'],
+)
+def test_score_key__distinct(
+    first: tuple[str | None, str | None, str | None, None], second: tuple[str | None, str | None, str | None, None]
+) -> None:
+    """Тестирует, что разные данные не дают одинаковый ключ."""
+    assert score_key(*first) != score_key(*second)
+
+
+def test_get_score__migrates_legacy_key(mocker: 'MockFixture') -> None:
+    """Тестирует перенос значения из ключа прежнего формата под новый ключ."""
+    legacy_key = legacy_score_key(None, None, '79175002040', None)
+    storage = mocker.Mock()
+    storage.cache_get.side_effect = lambda key: '4.5' if key == legacy_key else None
+
+    assert get_score(storage, phone='79175002040') == 4.5  # noqa: PLR2004
+    storage.cache_set.assert_called_once_with(score_key(None, None, '79175002040', None), '4.5', 60 * 60)
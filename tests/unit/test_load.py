@@ -0,0 +1,164 @@
+import json
+import random
+import threading
+from http.server import HTTPServer
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+import pytest
+
+from scoring_api.api import APIHandler
+from scoring_api.capture import configure_capture
+from scoring_api.constants import ADMIN_LOGIN
+from scoring_api.storage.memory import MemoryStorage
+from tests.benchmarks.payloads import clients_interests_request, online_score_request
+from tests.load.generator import build_scenarios, LoadGenerator, LoadReport, percentile, post, Sample
+from tests.load.replay import CapturedRequest, load_capture, Replayer, with_token
+from tests.utils.auth import generate_auth_token
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+    from typing import Any
+
+
+@pytest.fixture
+def server_url() -> 'Generator[str]':
+    """Запускает `APIHandler` с хранилищем в памяти на свободном порту."""
+    storage = MemoryStorage()
+
+    def handler(*args: 'Any', **kwargs: 'Any') -> APIHandler:
+        return APIHandler(*args, storage=storage, **kwargs)
+
+    server = HTTPServer(('localhost', 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://localhost:{server.server_address[1]}/method'
+    server.shutdown()
+    server.server_close()
+
+
+def test_build_scenarios() -> None:
+    """Тестирует разбор смеси сценариев: сценарии с нулевым весом не используются."""
+    scenarios = build_scenarios('online_score=3, online_score_admin=0, clients_interests=1', [5])
+
+    assert [(scenario.name, scenario.weight) for scenario in scenarios] == [
+        ('online_score', 3.0),
+        ('clients_interests', 1.0),
+    ]
+    body = scenarios[1].make_body(random.Random(0))
+    assert len(body['arguments']['client_ids']) == 5  # noqa: PLR2004
+
+
+@pytest.mark.parametrize('mix', ['unknown=1', 'online_score=x', 'online_score=0'])
+def test_build_scenarios__invalid(mix: str) -> None:
+    """Тестирует, что неизвестный сценарий, нечисловой и нулевой вес отклоняются."""
+    with pytest.raises(ValueError):
+        build_scenarios(mix)
+
+
+@pytest.mark.parametrize('q, expected', [(50, 5.0), (95, 10.0), (99.9, 10.0), (10, 1.0)])
+def test_percentile(q: float, expected: float) -> None:
+    """Тестирует перцентиль методом ближайшего ранга."""
+    assert percentile([float(value) for value in range(1, 11)], q) == expected
+
+
+def test_load_report() -> None:
+    """Тестирует итоги: пропускную способность, долю ошибок и разбивку по сценариям и кодам ответа."""
+    samples = [Sample('online_score', 0.001, 200)] * 3 + [Sample('clients_interests', 0.004, 0)]
+    report = LoadReport(2.0, samples).as_dict()
+
+    assert report['total']['requests'] == 4  # noqa: PLR2004
+    assert report['total']['rps'] == 2.0  # noqa: PLR2004
+    assert report['total']['error_rate'] == 0.25  # noqa: PLR2004
+    assert report['total']['p99_ms'] == 4.0  # noqa: PLR2004
+    assert report['scenarios']['online_score']['error_rate'] == 0.0
+    assert report['statuses'] == {'200': 3, 'no_response': 1}
+
+
+def test_load_report__throughput() -> None:
+    """Тестирует пропускную способность по полным окнам: неполное последнее окно не учитывается."""
+    samples = [Sample('online_score', 0.001, 200, finished) for finished in (0.1, 0.2, 0.9, 1.5, 2.1)]
+
+    assert LoadReport(2.5, samples).throughput() == [3.0, 1.0]
+
+
+def test_load_generator__closed(server_url: str) -> None:
+    """Тестирует закрытую модель нагрузки: все запросы смеси аутентифицируются и обрабатываются."""
+    generator = LoadGenerator(server_url, build_scenarios('online_score=1,online_score_admin=1,clients_interests=1'), 1)
+    report = generator.run_closed(concurrency=2, duration=0.3)
+
+    assert report.samples
+    assert {sample.status for sample in report.samples} == {200}
+    assert 'total' in report.format()
+
+
+def test_load_generator__open(server_url: str) -> None:
+    """Тестирует открытую модель нагрузки."""
+    generator = LoadGenerator(server_url, build_scenarios('online_score=1'), 1)
+    report = generator.run_open(rate=100, duration=0.3)
+
+    assert report.samples
+    assert report.as_dict()['total']['error_rate'] == 0.0
+
+
+def test_load_capture(tmp_path: 'Path') -> None:
+    """Тестирует, что запросы записи сортируются по времени поступления и получают смещение от первого."""
+    path = tmp_path / 'traffic.jsonl'
+    path.write_text(
+        '{"ts":12.5,"path":"/method","body":{"method":"online_score","login":"admin"}}\n'
+        '{"ts":10.0,"path":"/method","body":{"method":"clients_interests"}}\n'
+        '\n',
+        encoding='utf-8',
+    )
+
+    requests = load_capture(str(path))
+
+    assert [(request.offset, request.scenario) for request in requests] == [
+        (0.0, 'clients_interests'),
+        (2.5, 'online_score_admin'),
+    ]
+
+
+@pytest.mark.parametrize('login', ['h&f', ADMIN_LOGIN])
+def test_with_token(login: str) -> None:
+    """Тестирует, что токен рассчитывается заново для логина и учетной записи запроса."""
+    body = with_token({'account': 'horns&hoofs', 'login': login, 'method': 'online_score'})
+
+    assert body['token'] == generate_auth_token(login, 'horns&hoofs')
+
+
+def test_replayer__timing() -> None:
+    """Тестирует, что интервалы между запросами сохраняются с учетом ускорения."""
+    requests = [CapturedRequest(offset, '/method', {'method': 'online_score'}) for offset in (0.0, 0.4)]
+    replayer = Replayer('http://localhost:1', requests)  # Соединение отклоняется сразу
+
+    report = replayer.run(speed=2.0)
+
+    assert 0.2 <= report.elapsed < 0.4  # noqa: PLR2004
+    assert {sample.status for sample in report.samples} == {0}
+
+
+def test_capture_and_replay(server_url: str, tmp_path: 'Path') -> None:
+    """Тестирует, что записанный сервером трафик воспроизводится с новыми токенами."""
+    path = tmp_path / 'traffic.jsonl'
+    address = urlsplit(server_url)
+    host, port = address.hostname or 'localhost', address.port or 80
+    configure_capture(str(path))
+    try:
+        for body in (online_score_request(), online_score_request(admin=True), clients_interests_request(3)):
+            assert post(host, port, '/method/', json.dumps(body).encode('utf-8')) == 200  # noqa: PLR2004
+    finally:
+        configure_capture()
+
+    requests = load_capture(str(path))
+    assert all('token' not in request.body for request in requests)
+
+    report = Replayer(f'http://{host}:{port}', requests).run(speed=10.0)
+
+    assert sorted(sample.scenario for sample in report.samples) == [
+        'clients_interests',
+        'online_score',
+        'online_score_admin',
+    ]
+    assert {sample.status for sample in report.samples} == {200}
@@ -0,0 +1,113 @@
+import logging
+import multiprocessing
+import warnings
+from typing import TYPE_CHECKING
+
+import pytest
+
+from scoring_api import logger as logger_module
+from scoring_api.logger import BoundedQueueHandler, configure_logger, OverflowPolicy, stop_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+def make_record(message: str, *args: object) -> logging.LogRecord:
+    """Создает запись журнала уровня INFO."""
+    return logging.LogRecord('test', logging.INFO, __file__, 0, message, args, None)
+
+
+def drain(handler: BoundedQueueHandler) -> list[str]:
+    """Забирает все записи из очереди обработчика и возвращает их сообщения."""
+    messages = []
+    while not handler.records.empty():
+        record = handler.records.get_nowait()
+        assert record is not None
+        messages.append(record.getMessage())
+    return messages
+
+
+@pytest.fixture
+def root_logger() -> 'Iterator[logging.Logger]':
+    """Восстанавливает обработчики и уровень корневого логгера после теста."""
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield root
+    stop_logger()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_bounded_queue_handler__lazy_formatting() -> None:
+    """Тестирует, что запись попадает в очередь без форматирования сообщения."""
+    handler = BoundedQueueHandler(queue_size=2)
+    handler.handle(make_record('value %s', 42))
+
+    record = handler.records.get_nowait()
+    assert record is not None
+    assert record.msg == 'value %s'
+    assert record.args == (42,)
+
+
+def test_bounded_queue_handler__drop_new() -> None:
+    """Тестирует, что при переполнении отбрасываются новые записи и их количество попадает в журнал."""
+    handler = BoundedQueueHandler(queue_size=2, overflow=OverflowPolicy.DROP_NEW)
+    for index in range(5):
+        handler.handle(make_record('record %d', index))
+
+    assert handler.dropped == 3  # noqa: PLR2004
+    assert drain(handler) == ['record 0', 'record 1']
+
+    handler.handle(make_record('record %d', 5))
+    assert drain(handler) == ['Log queue overflow: 3 records dropped', 'record 5']
+    assert handler.dropped == 0
+
+
+def test_bounded_queue_handler__drop_oldest() -> None:
+    """Тестирует, что при политике DROP_OLDEST в очереди остаются самые новые записи."""
+    handler = BoundedQueueHandler(queue_size=2, overflow=OverflowPolicy.DROP_OLDEST)
+    for index in range(5):
+        handler.handle(make_record('record %d', index))
+
+    assert handler.dropped == 3  # noqa: PLR2004
+    assert drain(handler) == ['record 3', 'record 4']
+
+
+@pytest.mark.usefixtures('root_logger')
+def test_configure_logger__writes_file(tmp_path: 'Path') -> None:
+    """Тестирует, что записи пишутся в файл фоновым потоком и дописываются при остановке."""
+    log_file = tmp_path / 'server.log'
+    configure_logger(str(log_file))
+
+    logging.getLogger('scoring_api.test').info('Request %s done', 'abc')
+    stop_logger()
+
+    assert log_file.read_text().rstrip().endswith('I Request abc done')
+
+
+def _log_in_child() -> None:
+    """Пишет запись журнала в дочернем процессе и дописывает очередь."""
+    logging.getLogger('scoring_api.test').info('From child')
+    stop_logger()
+
+
+@pytest.mark.usefixtures('root_logger')
+def test_configure_logger__after_fork(tmp_path: 'Path') -> None:
+    """Тестирует, что дочерний процесс, созданный `fork`, запускает свой поток записи журнала."""
+    log_file = tmp_path / 'server.log'
+    configure_logger(str(log_file))
+    assert logger_module._listener is not None
+
+    process = multiprocessing.get_context('fork').Process(target=_log_in_child)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always', DeprecationWarning)
+        process.start()
+    process.join()
+    logging.getLogger('scoring_api.test').info('From parent')
+    stop_logger()
+
+    assert process.exitcode == 0
+    assert not [warning for warning in caught if 'multi-threaded' in str(warning.message)]
+    assert 'From child' in log_file.read_text()
+    assert 'From parent' in log_file.read_text()
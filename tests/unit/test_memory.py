@@ -0,0 +1,92 @@
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import pytest
+
+from scoring_api.storage.memory import MemoryStorage
+from tests.memory.harness import (
+    format_report,
+    format_size,
+    memory_storage,
+    MemoryProfile,
+    profile_workload,
+    profile_workloads,
+    WORKLOADS,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+
+class _LeakyStorage(MemoryStorage):
+    """Хранилище в памяти, которое запоминает ключи каждого чтения."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads: list[list[str]] = []
+
+    def get_many(self, keys: 'Iterable[str]') -> dict[str, str]:
+        keys = list(keys)
+        self.reads.append(keys)
+        return super().get_many(keys)
+
+
+@pytest.fixture
+def tracing() -> 'Generator[None]':
+    """Запускает `tracemalloc` на время теста."""
+    tracemalloc.start()
+    yield
+    tracemalloc.stop()
+
+
+@pytest.mark.usefixtures('tracing')
+def test_profile_workload() -> None:
+    """Тестирует профиль нагрузки без утечки: ответ запроса учтен по строкам, роста памяти нет."""
+    profile = profile_workload(
+        'clients_interests_10', WORKLOADS['clients_interests_10'], memory_storage(), iterations=300, samples=20
+    )
+
+    assert profile.peak >= profile.retained > 0
+    assert any('interests.py' in line.location for line in profile.lines)
+    assert not profile.leaking()
+
+
+@pytest.mark.usefixtures('tracing')
+def test_profile_workload__leak() -> None:
+    """Тестирует, что память, которая растет с каждым запросом, обнаруживается и указывается строка выделения."""
+    profile = profile_workload(
+        'clients_interests_10', WORKLOADS['clients_interests_10'], _LeakyStorage(), iterations=300, samples=20
+    )
+
+    assert profile.leaking()
+    assert 'interests.py' in profile.growth_lines[0].location  # Строка, где созданы удерживаемые ключи
+
+
+def test_profile_workloads() -> None:
+    """Тестирует выбор нагрузок по подстроке имени и остановку `tracemalloc` после профилирования."""
+    profiles = profile_workloads('admin', iterations=50, samples=5, variants=5)
+
+    assert [profile.name for profile in profiles] == ['online_score_admin']
+    assert not tracemalloc.is_tracing()
+
+
+@pytest.mark.parametrize(
+    'size, expected', [(512, '512 B'), (1536, '1.5 KiB'), (3 * 1024**2, '3.0 MiB'), (-2048, '-2.0 KiB')]
+)
+def test_format_size(size: float, expected: str) -> None:
+    """Тестирует форматирование размера памяти."""
+    assert format_size(size) == expected
+
+
+def test_format_report() -> None:
+    """Тестирует, что нагрузка с ростом памяти больше допустимого отмечена в отчете."""
+    profiles = [
+        MemoryProfile('stable', 1000, growth=100_000, repeat_growth=1000),  # Разовое выделение в первом окне
+        MemoryProfile('leaking', 1000, growth=100_000, repeat_growth=100_000),
+    ]
+
+    report = format_report(profiles, limit=8.0)
+
+    assert 'LEAK' not in report.splitlines()[1]
+    assert report.splitlines()[2].endswith('LEAK')
+    assert 'leaking: growth in the second 1000 requests by line' in report
@@ -0,0 +1,92 @@
+import multiprocessing
+
+import pytest
+
+from scoring_api.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    """Создает пустой реестр метрик."""
+    return MetricsRegistry()
+
+
+def test_counter_and_gauge(registry: MetricsRegistry) -> None:
+    """Тестирует счетчик с метками и изменяемое значение."""
+    requests = registry.counter('requests_total', 'Requests.', {'method': ('a', 'b'), 'status': ('200', '404')})
+    in_flight = registry.gauge('in_flight', 'In flight.')
+
+    requests.inc(('a', '200'))
+    requests.inc(('a', '200'))
+    requests.inc(('b', '404'), 3)
+    in_flight.inc()
+    in_flight.inc()
+    in_flight.dec()
+
+    lines = registry.render().splitlines()
+    assert '# TYPE requests_total counter' in lines
+    assert 'requests_total{method="a",status="200"} 2' in lines
+    assert 'requests_total{method="a",status="404"} 0' in lines
+    assert 'requests_total{method="b",status="404"} 3' in lines
+    assert 'in_flight 1' in lines
+
+
+def test_counter__unknown_labels(registry: MetricsRegistry) -> None:
+    """Тестирует, что необъявленные значения меток отклоняются."""
+    requests = registry.counter('requests_total', 'Requests.', {'method': ('a',)})
+
+    with pytest.raises(KeyError):
+        requests.inc(('b',))
+
+
+def test_histogram(registry: MetricsRegistry) -> None:
+    """Тестирует накопительные корзины, сумму и количество наблюдений гистограммы."""
+    duration = registry.histogram('duration_seconds', 'Duration.', (0.1, 1.0), {'method': ('a',)})
+
+    for value in (0.05, 0.1, 0.5, 2.0):
+        duration.observe(value, ('a',))
+
+    lines = registry.render().splitlines()
+    assert lines[1] == '# TYPE duration_seconds histogram'
+    assert lines[2:] == [
+        'duration_seconds_bucket{method="a",le="0.1"} 2',
+        'duration_seconds_bucket{method="a",le="1"} 3',
+        'duration_seconds_bucket{method="a",le="+Inf"} 4',
+        'duration_seconds_sum{method="a"} 2.65',
+        'duration_seconds_count{method="a"} 4',
+    ]
+
+
+def test_registry__declare_after_use(registry: MetricsRegistry) -> None:
+    """Тестирует, что объявление метрики после записи значений сохраняет записанные значения."""
+    first = registry.counter('first_total', 'First.')
+    first.inc()
+    registry.counter('second_total', 'Second.')
+
+    assert 'first_total 1' in registry.render().splitlines()
+
+
+def _record_in_worker(registry: MetricsRegistry, index: int) -> None:
+    """Записывает метрику в своей части таблицы в дочернем процессе."""
+    registry.table.set_worker(index)
+    registry.metrics[0].inc(amount=index + 1)  # type: ignore[attr-defined]
+
+
+def test_registry__shared_between_workers(registry: MetricsRegistry) -> None:
+    """Тестирует, что метрики рабочих процессов суммируются."""
+    registry.counter('requests_total', 'Requests.')
+    registry.configure(workers=3, shared=True)
+    try:
+        context = multiprocessing.get_context('fork')
+        processes = [context.Process(target=_record_in_worker, args=(registry, index)) for index in range(3)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        assert 'requests_total 6' in registry.render().splitlines()
+
+        with pytest.raises(RuntimeError):
+            registry.counter('late_total', 'Declared too late.')
+    finally:
+        registry.configure()
@@ -0,0 +1,34 @@
+import datetime
+from array import array
+
+import pytest
+
+from scoring_api.pagination import decode_cursor, encode_cursor, request_fingerprint
+from scoring_api.requests.exceptions import ValidationError
+
+
+def test_cursor__roundtrip() -> None:
+    """Тестирует, что курсор непрозрачен и возвращает исходное смещение."""
+    fingerprint = request_fingerprint(array('q', [1, 2, 3]), datetime.date(2017, 7, 20))
+    cursor = encode_cursor(2, fingerprint)
+
+    assert '2' not in cursor
+    assert decode_cursor(cursor, fingerprint, 3) == 2  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    'cursor, client_ids, date',
+    [
+        ('garbage', [1, 2, 3], None),
+        ('!' * 16, [1, 2, 3], None),
+        (encode_cursor(2, request_fingerprint(array('q', [1, 2, 3]), None)), [1, 2, 4], None),
+        (encode_cursor(2, request_fingerprint(array('q', [1, 2, 3]), None)), [1, 2, 3], datetime.date(2017, 7, 20)),
+        (encode_cursor(3, request_fingerprint(array('q', [1, 2, 3]), None)), [1, 2, 3], None),
+        (encode_cursor(0, request_fingerprint(array('q', [1, 2, 3]), None)), [1, 2, 3], None),
+    ],
+    ids=['malformed', 'not_base64', 'other_ids', 'other_date', 'past_end', 'zero_offset'],
+)
+def test_decode_cursor__invalid(cursor: str, client_ids: list[int], date: datetime.date | None) -> None:
+    """Тестирует отклонение поврежденных и чужих курсоров."""
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor, request_fingerprint(array('q', client_ids), date), len(client_ids))
@@ -0,0 +1,117 @@
+import os
+import pstats
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from scoring_api import profiling
+from scoring_api.constants import MAX_PROFILE_DURATION_SECONDS
+from scoring_api.profiling import ProfileMode, ProfilingError, ProfilingSession, StackSampler
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+
+@pytest.fixture
+def session(tmp_path: 'Path') -> 'Generator[ProfilingSession]':
+    """Создает сессию профилирования с файлами во временном каталоге и останавливает ее после теста."""
+    session = ProfilingSession(str(tmp_path))
+    yield session
+    session.stop()
+
+
+def test_profiling_session__deterministic(session: ProfilingSession) -> None:
+    """Тестирует, что детерминированный профиль записывается в формате pstats."""
+    output = session.start(ProfileMode.DETERMINISTIC)
+    sum(range(1000))
+
+    assert session.stop() == output
+    assert output.endswith('.pstats')
+    assert os.path.basename(output).startswith(f'deterministic-{os.getpid()}-')
+    assert pstats.Stats(output).get_stats_profile().func_profiles
+    assert not session.active
+
+
+def test_profiling_session__sampling(session: ProfilingSession) -> None:
+    """Тестирует, что выборочный профиль записывает свернутые стеки."""
+    output = session.start(ProfileMode.SAMPLING)
+    time.sleep(0.05)
+    session.stop()
+
+    with open(output, encoding='utf-8') as profile:
+        lines = profile.read().splitlines()
+    assert output.endswith('.folded')
+    stacks = dict(line.rsplit(' ', 1) for line in lines)
+    assert any('test_profiling_session__sampling' in stack for stack in stacks)
+    assert all(int(count) > 0 for count in stacks.values())
+
+
+def test_profiling_session__already_running(session: ProfilingSession) -> None:
+    """Тестирует, что второй профиль нельзя запустить, пока работает первый."""
+    session.start(ProfileMode.SAMPLING)
+    with pytest.raises(ProfilingError):
+        session.start(ProfileMode.DETERMINISTIC)
+
+
+@pytest.mark.parametrize('duration', [0, -1, MAX_PROFILE_DURATION_SECONDS + 1])
+def test_profiling_session__invalid_duration(session: ProfilingSession, duration: float) -> None:
+    """Тестирует, что длительность профиля ограничена."""
+    with pytest.raises(ProfilingError):
+        session.start(ProfileMode.SAMPLING, duration)
+    assert not session.active
+
+
+def test_profiling_session__stops_after_duration(session: ProfilingSession) -> None:
+    """Тестирует, что профиль останавливается сам по истечении длительности."""
+    output = session.start(ProfileMode.DETERMINISTIC, 0.05)
+    deadline = time.monotonic() + 5
+    while session.active and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert not session.active
+    assert os.path.exists(output)
+
+
+def test_profiling_session__status(session: ProfilingSession) -> None:
+    """Тестирует состояние профиля до запуска и во время работы."""
+    assert session.status() == {'mode': None, 'output': None, 'remaining': None}
+
+    duration = 10
+    output = session.start(ProfileMode.SAMPLING, duration)
+    status = session.status()
+    assert status['mode'] == 'sampling'
+    assert status['output'] == output
+    remaining = status['remaining']
+    assert isinstance(remaining, float)
+    assert 0 < remaining <= duration
+
+
+def test_profiling_session__stop_inactive(session: ProfilingSession) -> None:
+    """Тестирует, что остановка без запущенного профиля ничего не делает."""
+    assert session.stop() is None
+
+
+def test_stack_sampler__write_folded(tmp_path: 'Path') -> None:
+    """Тестирует формат свернутых стеков."""
+    sampler = StackSampler()
+    sampler.stacks.update({'main;handle': 3, 'main;idle': 1})
+    path = tmp_path / 'profile.folded'
+    sampler.write_folded(str(path))
+
+    assert path.read_text(encoding='utf-8') == 'main;handle 3\nmain;idle 1\n'
+
+
+def test_toggle(tmp_path: 'Path') -> None:
+    """Тестирует, что сигнал запускает профиль, а повторный сигнал останавливает его."""
+    profiling.configure_profiling(str(tmp_path))
+    try:
+        profiling._toggle(ProfileMode.SAMPLING)
+        assert profiling.get_profiling_session().mode is ProfileMode.SAMPLING
+
+        profiling._toggle(ProfileMode.SAMPLING)
+        assert not profiling.get_profiling_session().active
+        assert [path.suffix for path in tmp_path.iterdir()] == ['.folded']
+    finally:
+        profiling.configure_profiling()
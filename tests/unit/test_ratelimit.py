@@ -0,0 +1,118 @@
+import multiprocessing
+from typing import TYPE_CHECKING
+
+import pytest
+
+from scoring_api import ratelimit
+from scoring_api.ratelimit import allow_request, configure_rate_limiter, RateLimiter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class FakeClock:
+    """Управляемый источник времени."""
+
+    def __init__(self, now: float) -> None:
+        """Создает часы, показывающие `now`."""
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def configured_limiter() -> RateLimiter | None:
+    """Возвращает лимит, настроенный для обработчиков."""
+    return ratelimit._limiter
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Создает управляемые часы."""
+    return FakeClock(100.0)
+
+
+@pytest.fixture
+def limiter(clock: FakeClock) -> 'Iterator[RateLimiter]':
+    """Создает лимитер на 2 запроса в секунду с ведром на 3 запроса."""
+    limiter = RateLimiter(rate=2.0, burst=3, stripes=2, slots_per_stripe=4, max_probes=2, clock=clock)
+    yield limiter
+    limiter.close()
+
+
+def test_rate_limiter__burst_then_deny(limiter: RateLimiter) -> None:
+    """Тестирует, что после исчерпания ведра запросы отклоняются."""
+    assert [limiter.allow('acc', 'user') for _ in range(4)] == [True, True, True, False]
+
+
+def test_rate_limiter__refill(limiter: RateLimiter, clock: FakeClock) -> None:
+    """Тестирует пополнение ведра со временем, но не сверх его вместимости."""
+    for _ in range(3):
+        limiter.allow('acc', 'user')
+
+    clock.now += 0.5
+    assert limiter.allow('acc', 'user')
+    assert not limiter.allow('acc', 'user')
+
+    clock.now += 60
+    assert [limiter.allow('acc', 'user') for _ in range(4)] == [True, True, True, False]
+
+
+def test_rate_limiter__separate_keys(limiter: RateLimiter) -> None:
+    """Тестирует, что у разных пар учетной записи и логина свои ведра."""
+    for _ in range(3):
+        limiter.allow('acc', 'user')
+
+    assert not limiter.allow('acc', 'user')
+    assert limiter.allow('acc', 'other')
+    assert limiter.allow('other', 'user')
+
+
+def test_rate_limiter__evicts_least_recently_updated(clock: FakeClock) -> None:
+    """Тестирует, что при заполнении таблицы вытесняется давно не использованное ведро."""
+    limiter = RateLimiter(rate=0.001, burst=1, stripes=1, slots_per_stripe=2, max_probes=2, clock=clock)
+    try:
+        assert limiter.allow('acc', 'first')
+        clock.now += 1
+        assert limiter.allow('acc', 'second')
+        clock.now += 1
+        assert limiter.allow('acc', 'third')  # Вытесняет ведро 'first'
+
+        assert not limiter.allow('acc', 'third')
+        assert limiter.allow('acc', 'first')  # Ведро создано заново
+    finally:
+        limiter.close()
+
+
+def _take_tokens(limiter: RateLimiter, count: int) -> None:
+    """Забирает токены в дочернем процессе."""
+    for _ in range(count):
+        limiter.allow('acc', 'user')
+
+
+def test_rate_limiter__shared_between_processes() -> None:
+    """Тестирует, что процессы, созданные `fork`, расходуют общее ведро."""
+    limiter = RateLimiter(rate=0.001, burst=5)
+    try:
+        process = multiprocessing.get_context('fork').Process(target=_take_tokens, args=(limiter, 4))
+        process.start()
+        process.join()
+
+        assert process.exitcode == 0
+        assert [limiter.allow('acc', 'user') for _ in range(2)] == [True, False]
+    finally:
+        limiter.close()
+
+
+def test_configure_rate_limiter() -> None:
+    """Тестирует включение и отключение лимита для обработчиков."""
+    configure_rate_limiter(0.001, burst=1)
+    try:
+        assert configured_limiter() is not None
+        assert allow_request('acc', 'user')
+        assert not allow_request('acc', 'user')
+    finally:
+        configure_rate_limiter(None)
+
+    assert configured_limiter() is None
+    assert allow_request('acc', 'user')
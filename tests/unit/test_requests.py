@@ -0,0 +1,190 @@
+import datetime
+import itertools
+from array import array
+from typing import TYPE_CHECKING
+
+import pytest
+
+from scoring_api.requests.base import BaseRequest
+from scoring_api.requests.exceptions import ValidationError
+from scoring_api.requests.fields import (
+    BirthDayField,
+    CharField,
+    CHECK_NAMESPACE,
+    ClientIDsField,
+    parse_date,
+    PhoneField,
+    PositiveIntField,
+)
+from scoring_api.requests.requests import (
+    ClientsInterestsRequest,
+    ClientsInterestsTopRequest,
+    MethodRequest,
+    OnlineScoreRequest,
+)
+
+if TYPE_CHECKING:
+    from typing import Any, ClassVar
+
+    from pytest_mock import MockFixture
+
+VALUES: list['Any'] = [
+    None,
+    '',
+    0,
+    1,
+    2,
+    3,
+    -1,
+    True,
+    False,
+    1.5,
+    'text',
+    'user@example.com',
+    'user.example.com',
+    '79175002040',
+    79175002040,
+    '89175002040',
+    '7917500204',
+    '01.01.2000',
+    '01.01.1900',
+    '31.02.2000',
+    '2000-01-01',
+    [],
+    [1, 2],
+    [1, 'a'],
+    {},
+    {'a': 1},
+]
+
+
+@pytest.mark.parametrize(
+    'request_class',
+    [MethodRequest, OnlineScoreRequest, ClientsInterestsRequest, ClientsInterestsTopRequest],
+)
+def test_generated_validate__matches_reference(request_class: type[BaseRequest]) -> None:
+    """Тестирует, что сгенерированная проверка совпадает с проверкой через `Field.validate`."""
+    assert request_class.validate is not BaseRequest.validate
+
+    for field_name, value in itertools.product(request_class._fields, VALUES):
+        data = {
+            name: value if name == field_name else VALUES[index % len(VALUES)]
+            for index, name in enumerate(request_class._fields)
+        }
+
+        generated = request_class.__new__(request_class)
+        generated._errors, generated.validated_data = None, {}
+        generated.validate(data)
+
+        reference = request_class.__new__(request_class)
+        reference._errors, reference.validated_data = None, {}
+        BaseRequest.validate(reference, data)
+
+        assert (generated.errors, generated.validated_data) == (reference.errors, reference.validated_data), data
+
+
+@pytest.mark.parametrize(
+    'field, value, message',
+    [
+        (CharField(required=True), None, 'This field is required'),
+        (CharField(nullable=False), '', 'This field cannot be empty'),
+        (CharField(nullable=True), 1, 'Must be a string'),
+        (PhoneField(), '89175002040', 'Invalid phone number format'),
+        (ClientIDsField(), [], 'Client IDs cannot be empty'),
+        (ClientIDsField(max_items=2), [1, 2, 3], 'Must contain at most 2 distinct client IDs'),
+        (PositiveIntField(max_value=5), 6, 'Must not be greater than 5'),
+    ],
+)
+def test_field_validate__messages(field: CharField, value: object, message: str) -> None:
+    """Тестирует сообщения об ошибках при проверке отдельного значения."""
+    with pytest.raises(ValidationError, match=f'^{message}$'):
+        field.validate(value)
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        ('20.07.2017', datetime.date(2017, 7, 20)),
+        ('1.7.2017', datetime.date(2017, 7, 1)),
+        ('29.02.2016', datetime.date(2016, 2, 29)),
+        ('29.02.2017', None),
+        ('00.01.2017', None),
+        ('2017.07.20', None),
+        ('20-07-2017', None),
+        ('２０.07.2017', None),
+        ('', None),
+    ],
+)
+def test_parse_date(value: str, expected: datetime.date | None) -> None:
+    """Тестирует разбор даты: результат совпадает со `strptime` в формате DD.MM.YYYY."""
+    assert parse_date(value) == expected
+
+
+def test_online_score_request__parses_birthday_once(mocker: 'MockFixture') -> None:
+    """Тестирует, что день рождения разбирается один раз и сохраняется как `datetime.date`."""
+    parse = mocker.patch.dict(CHECK_NAMESPACE, {'parse_date': mocker.Mock(wraps=parse_date)})['parse_date']
+
+    class BirthdayRequest(BaseRequest):
+        birthday: 'ClassVar[BirthDayField]' = BirthDayField(nullable=True)
+
+    request = BirthdayRequest({'birthday': '01.01.2000'})
+
+    assert request.validated_data == {'birthday': datetime.date(2000, 1, 1)}
+    assert parse.call_count == 1
+    assert OnlineScoreRequest({'birthday': '01.01.2000'}).validated_data == {'birthday': datetime.date(2000, 1, 1)}
+
+
+@pytest.mark.parametrize(
+    'request_class',
+    [MethodRequest, OnlineScoreRequest, ClientsInterestsRequest, ClientsInterestsTopRequest],
+)
+def test_request__slotted_with_lazy_errors(request_class: type[BaseRequest]) -> None:
+    """Тестирует, что запросы не создают `__dict__`, а словарь ошибок создается только при ошибке."""
+    request = request_class({})
+
+    assert not hasattr(request, '__dict__')
+
+    valid_request = request_class.__new__(request_class)
+    valid_request._errors, valid_request.validated_data = None, {}
+    valid_request.add_error('field', 'message')
+    valid_request.add_error('field', 'other')
+
+    assert valid_request.errors == {'field': ['message', 'other']}
+    assert not valid_request.is_valid()
+
+
+def test_online_score_request__valid_without_errors_container() -> None:
+    """Тестирует, что корректный запрос не создает словарь ошибок."""
+    request = OnlineScoreRequest({'phone': '79175002040', 'email': 'user@example.com'})
+
+    assert request.is_valid()
+    assert request._errors is None
+    assert request.errors == {}
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        ([3, 1, 3], array('q', [3, 1, 3])),
+        ([1, 'a'], None),
+        ([1, 1.5], None),
+        ([2**63], None),
+    ],
+    ids=['ints', 'string', 'float', 'out_of_range'],
+)
+def test_client_ids_field__array(value: list[object], expected: 'array[int] | None') -> None:
+    """Тестирует преобразование идентификаторов клиентов в `array('q')` за одну проверку."""
+    field = ClientIDsField(required=True)
+
+    if expected is None:
+        with pytest.raises(ValidationError, match='^Must be a list of integers$'):
+            field.validate(value)
+    else:
+        assert field.validate(value) == expected
+
+
+def test_client_ids_field__max_items_distinct() -> None:
+    """Тестирует, что повторы не учитываются в ограничении количества идентификаторов."""
+    field = ClientIDsField(max_items=2)
+
+    assert field.validate([1, 2, 1, 2]) == array('q', [1, 2, 1, 2])
@@ -0,0 +1,178 @@
+import datetime
+import itertools
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from scoring_api.rules import (
+    configure_scoring_models,
+    DEFAULT_SCORING_MODEL,
+    get_scoring_model,
+    render_cache_policy_stats,
+    ScoringConfigError,
+    ScoringModel,
+    ScoringModelRegistry,
+)
+from scoring_api.scoring import get_score
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+    from typing import Any
+
+    from pytest_mock import MockFixture
+
+CONFIG: dict[str, 'Any'] = {
+    'default': 'base',
+    'accounts': {'horns&hoofs': 'strict'},
+    'models': {
+        'base': {'cache_namespace': 'uid', 'rules': [{'when': {'phone': 'present'}, 'weight': 1.5}]},
+        'strict': {'rules': [{'when': {'phone': 'present', 'email': 'present'}, 'weight': 3.0}]},
+    },
+}
+
+
+@pytest.fixture
+def default_models() -> 'Generator[None]':
+    """Восстанавливает встроенную модель скоринга после теста."""
+    yield
+    configure_scoring_models(None)
+
+
+def reference_score(*values: 'Any') -> float:
+    """Исходная реализация правил скоринга."""
+    phone, email, birthday, gender, first, last = values
+    return sum(
+        [
+            1.5 if phone else float(0),
+            1.5 if email else float(0),
+            1.5 if birthday and gender is not None else float(0),
+            0.5 if first and last else float(0),
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    'values',
+    list(
+        itertools.product(
+            [None, '79175002040'],
+            [None, 'a@b.ru'],
+            [None, datetime.date(2000, 1, 1)],
+            [None, 0, 1],
+            [None, '', 'John'],
+            [None, 'Doe'],
+        )
+    ),
+)
+def test_default_model__matches_reference(values: tuple['Any', ...]) -> None:
+    """Тестирует, что встроенная модель совпадает с исходными правилами."""
+    assert DEFAULT_SCORING_MODEL.evaluate(*values) == reference_score(*values)
+
+
+def test_model__evaluation_table_size_is_bounded_by_conditions() -> None:
+    """Тестирует, что число правил не влияет на размер таблицы: он зависит только от числа условий."""
+    rules = [{'when': {'phone': 'present', 'email': 'present'}, 'weight': 0.1}] * 1000
+    model = ScoringModel('many', rules)
+
+    assert model.rules_count == 1000  # noqa: PLR2004
+    assert model.evaluate.__globals__['table'] == (0.0, 0.0, 0.0, pytest.approx(100.0))
+    assert model.evaluate(phone='79175002040', email='a@b.ru') == pytest.approx(100.0)
+
+
+@pytest.mark.parametrize(
+    'rules',
+    [
+        [{'when': {}, 'weight': 1}],
+        [{'when': {'phone': 'present'}, 'weight': '1'}],
+        [{'when': {'unknown': 'present'}, 'weight': 1}],
+        [{'when': {'phone': 'sometimes'}, 'weight': 1}],
+        ['phone'],
+    ],
+    ids=['empty_when', 'weight_not_number', 'unknown_field', 'unknown_condition', 'rule_not_object'],
+)
+def test_model__invalid_rules(rules: list['Any']) -> None:
+    """Тестирует ошибки компиляции некорректных правил."""
+    with pytest.raises(ScoringConfigError):
+        ScoringModel('invalid', rules)
+
+
+def test_registry__selects_model_by_account() -> None:
+    """Тестирует выбор модели по учетной записи партнера."""
+    registry = ScoringModelRegistry.from_config(CONFIG)
+
+    assert registry.get('horns&hoofs').name == 'strict'
+    assert registry.get('other').name == 'base'
+    assert registry.get(None).name == 'base'
+    assert registry.get('horns&hoofs').cache_namespace == 'strict'
+
+
+@pytest.mark.parametrize(
+    'config',
+    [
+        {},
+        {'models': {'base': {}}},
+        {'models': {'base': {'rules': []}}, 'default': 'missing'},
+        {'models': {'base': {'rules': []}}, 'accounts': {'a': 'missing'}},
+        {'models': {'base': {'rules': []}}, 'default': ['base']},
+        {'models': {'a': {'rules': []}, 'b': {'rules': [], 'cache_namespace': 'a'}}},
+        {'models': {'base': {'rules': []}, 'custom': {'rules': [], 'cache_namespace': 'uid'}}},
+        {'models': {'base': {'rules': [], 'cache_namespace': 1}}},
+    ],
+    ids=[
+        'no_models',
+        'no_rules',
+        'unknown_default',
+        'unknown_account_model',
+        'default_not_string',
+        'shared_namespace',
+        'reserved_namespace',
+        'namespace_not_string',
+    ],
+)
+def test_registry__invalid_config(config: dict[str, 'Any']) -> None:
+    """Тестирует ошибки загрузки некорректной конфигурации."""
+    with pytest.raises(ScoringConfigError):
+        ScoringModelRegistry.from_config(config)
+
+
+@pytest.mark.usefixtures('default_models')
+def test_configure_scoring_models__from_file(tmp_path: 'Path') -> None:
+    """Тестирует загрузку моделей из файла конфигурации."""
+    path = tmp_path / 'scoring.json'
+    path.write_text(json.dumps(CONFIG))
+
+    configure_scoring_models(str(path))
+
+    assert get_scoring_model('horns&hoofs').name == 'strict'
+
+
+@pytest.mark.usefixtures('default_models')
+def test_render_cache_policy_stats(tmp_path: 'Path') -> None:
+    """Тестирует, что статистика отдается по моделям с адаптивной политикой кэширования."""
+    config = json.loads(json.dumps(CONFIG))
+    config['models']['base']['cache_policy'] = 'always'
+    path = tmp_path / 'scoring.json'
+    path.write_text(json.dumps(config))
+    configure_scoring_models(str(path))
+    policy = get_scoring_model('horns&hoofs').cache_policy
+    assert policy is not None
+    policy.decide()
+
+    stats = json.loads(render_cache_policy_stats())
+
+    assert list(stats) == ['strict']
+    assert stats['strict']['decision'] == 'read_write'
+    assert stats['strict']['calls'] == 1
+
+
+def test_get_score__uses_model_namespace(mocker: 'MockFixture') -> None:
+    """Тестирует, что оценка кэшируется в пространстве имен модели, без чтения ключей прежнего формата."""
+    storage = mocker.Mock()
+    storage.cache_get.return_value = None
+    model = ScoringModelRegistry.from_config(CONFIG).get('horns&hoofs')
+
+    assert get_score(storage, phone='79175002040', email='a@b.ru', model=model) == 3.0  # noqa: PLR2004
+    storage.cache_get.assert_called_once()
+    assert storage.cache_set.call_args.args[0].startswith('strict:v2:')
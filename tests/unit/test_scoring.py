@@ -37,9 +37,10 @@ def test_get_score__cache_behavior(
 
     if cache_value is not None:
         assert result == expected_score
+        storage_mock.cache_get.assert_called_once()
     else:
         assert result > 0
-    storage_mock.cache_get.assert_called_once()
+        assert storage_mock.cache_get.call_count == 2  # noqa: PLR2004 Новый ключ и ключ прежнего формата
 
 
 @pytest.mark.parametrize(
@@ -104,7 +105,7 @@ def test_get_score__calculation_logic(  # noqa: PLR0913
 )
 def test_get_interests__cache_behavior(storage_data, expected_output, storage_mock: 'StorageInterface') -> None:
     """Тестирует извлечение интересов из кеша."""
-    storage_mock.get.side_effect = lambda key: storage_data.get(key)
+    storage_mock.get_many.side_effect = lambda keys: {key: storage_data[key] for key in keys if storage_data.get(key)}
 
     result = get_interests(storage_mock, [1, 2])
 
@@ -113,7 +114,7 @@ def test_get_interests__cache_behavior(storage_data, expected_output, storage_mo
 
 def test_get_interests__connection_error(storage_mock: 'StorageInterface') -> None:
     """Тестирует, что функция выбрасывает ConnectionError, если хранилище недоступно."""
-    storage_mock.get.side_effect = ConnectionError('Storage unavailable')
+    storage_mock.get_many.side_effect = ConnectionError('Storage unavailable')
 
     with pytest.raises(ConnectionError, match='Storage unavailable'):
         get_interests(storage_mock, [1, 2])
@@ -0,0 +1,104 @@
+import json
+import logging
+from typing import TYPE_CHECKING
+
+from scoring_api.slow_log import (
+    configure_slow_log,
+    get_slow_log,
+    log_slow_request,
+    render_slow_requests,
+    SlowRequestLog,
+    start_slow_log,
+    stop_slow_log,
+)
+from scoring_api.storage.instrumented import InstrumentedStorage
+from scoring_api.storage.memory import MemoryStorage
+
+if TYPE_CHECKING:
+    import pytest
+
+    from scoring_api.slow_log import StorageCall
+
+CONTEXT = {'request_id': 'abc', 'method': 'clients_interests', 'account': 'horns&hoofs', 'nclients': 3}
+
+
+def test_slow_request_log__below_threshold() -> None:
+    """Тестирует, что запрос быстрее порога не сохраняется."""
+    slow_log = SlowRequestLog(0.1)
+
+    assert slow_log.record(CONTEXT, '/method', 200, 0.05, []) is None
+    assert slow_log.slowest() == []
+    assert slow_log.recent() == []
+
+
+def test_slow_request_log__record(caplog: 'pytest.LogCaptureFixture') -> None:
+    """Тестирует состав записи о медленном запросе и то, что она пишется в журнал."""
+    slow_log = SlowRequestLog(0.1)
+    calls: list[StorageCall] = [
+        ('cache_get', 'uid:1', 0.002, False),
+        ('get_many', ['i:1', 'i:2', 'i:3'], 0.1, 2),
+        ('cache_set', 'uid:1', 0.001, None),
+    ]
+
+    with caplog.at_level(logging.WARNING, logger='scoring_api.slow'):
+        entry = slow_log.record(CONTEXT, '/method', 200, 0.25, calls)
+
+    assert entry is not None
+    assert entry['latency_ms'] == 250.0  # noqa: PLR2004
+    assert entry['method'] == 'clients_interests'
+    assert entry['nclients'] == 3  # noqa: PLR2004
+    assert entry['storage_ms'] == 103.0  # noqa: PLR2004
+    assert entry['storage_calls'] == [
+        {'operation': 'cache_get', 'latency_ms': 2.0, 'key': 'uid:1', 'hit': False},
+        {'operation': 'get_many', 'latency_ms': 100.0, 'key': 'i:1', 'keys': 3, 'hits': 2},
+        {'operation': 'cache_set', 'latency_ms': 1.0, 'key': 'uid:1'},
+    ]
+    message = caplog.records[0].getMessage()
+    assert json.loads(message.removeprefix('Slow request: ')) == entry
+
+
+def test_slow_request_log__buffers() -> None:
+    """Тестирует, что хранятся самые медленные и последние медленные запросы."""
+    slow_log = SlowRequestLog(0.0, capacity=2)
+    for index, latency in enumerate([0.3, 0.1, 0.5, 0.2]):
+        slow_log.record({'request_id': str(index)}, '/method', 200, latency, [])
+
+    assert [entry['request_id'] for entry in slow_log.slowest()] == ['2', '0']
+    assert [entry['request_id'] for entry in slow_log.recent()] == ['3', '2']
+
+
+def test_slow_log__storage_calls() -> None:
+    """Тестирует, что обращения к хранилищу во время запроса попадают в запись."""
+    configure_slow_log(0.0)
+    storage = InstrumentedStorage(MemoryStorage())
+    try:
+        token = start_slow_log()
+        assert token is not None
+        try:
+            storage.cache_get('missing')
+            storage.get_many(['a', 'b'])
+            log_slow_request(CONTEXT, '/method', 200, 0.01)
+        finally:
+            stop_slow_log(token)
+
+        storage.get('outside')  # Обращение вне запроса не записывается
+        slowest = json.loads(render_slow_requests())['slowest']
+        assert [call['operation'] for call in slowest[0]['storage_calls']] == ['cache_get', 'get_many']
+        assert 'account' not in slowest[0]
+        assert all('key' not in call for call in slowest[0]['storage_calls'])
+
+        slow_log = get_slow_log()
+        assert slow_log is not None
+        entry = slow_log.slowest()[0]  # В журнале и буфере поля остаются
+        assert entry['account'] == CONTEXT['account']
+        assert entry['storage_calls'][0]['key'] == 'missing'
+    finally:
+        configure_slow_log()
+
+
+def test_slow_log__disabled() -> None:
+    """Тестирует, что выключенный журнал не записывает обращения."""
+    configure_slow_log()
+
+    assert start_slow_log() is None
+    assert json.loads(render_slow_requests()) == {'threshold_ms': None, 'slowest': [], 'recent': []}
@@ -0,0 +1,60 @@
+from typing import TYPE_CHECKING
+
+from scoring_api.metrics import REGISTRY
+from scoring_api.storage.constants import NO_EXPIRATION
+from scoring_api.storage.instrumented import InstrumentedStorage
+from scoring_api.storage.memory import MemoryStorage
+
+if TYPE_CHECKING:
+    from pytest_mock import MockFixture
+
+
+def test_memory_storage__set_get() -> None:
+    """Тестирует запись и чтение значений, значения хранятся строками."""
+    storage = MemoryStorage()
+    storage.cache_set('key', 1.5)
+
+    assert storage.get('key') == '1.5'
+    assert storage.cache_get('key') == '1.5'
+    assert storage.get('missing') is None
+
+
+def test_memory_storage__expiration(mocker: 'MockFixture') -> None:
+    """Тестирует истечение времени жизни и бессрочное хранение."""
+    monotonic = mocker.patch('scoring_api.storage.memory.time.monotonic', return_value=100.0)
+    storage = MemoryStorage()
+    storage.cache_set('temporary', 'value', 10)
+    storage.cache_set('permanent', 'value', NO_EXPIRATION)
+
+    monotonic.return_value = 110.0
+
+    assert storage.get('temporary') is None
+    assert storage.get('permanent') == 'value'
+
+
+def test_storage__get_many() -> None:
+    """Тестирует, что пакетное чтение возвращает только найденные ключи."""
+    storage = MemoryStorage()
+    storage.cache_set('a', '1')
+    storage.cache_set('b', '2')
+
+    assert storage.get_many(['a', 'b', 'c']) == {'a': '1', 'b': '2'}
+
+
+def test_instrumented_storage() -> None:
+    """Тестирует, что обертка передает обращения хранилищу и считает попадания и промахи кэша."""
+    REGISTRY.configure()
+    storage = InstrumentedStorage(MemoryStorage())
+
+    storage.cache_set('key', 'value', NO_EXPIRATION)
+    assert storage.cache_get('key') == 'value'
+    assert storage.cache_get('missing') is None
+    assert storage.get('key') == 'value'
+    assert storage.get_many(['key', 'missing']) == {'key': 'value'}
+
+    lines = REGISTRY.render().splitlines()
+    assert 'scoring_api_storage_cache_requests_total{result="hit"} 1' in lines
+    assert 'scoring_api_storage_cache_requests_total{result="miss"} 1' in lines
+    assert 'scoring_api_storage_operation_duration_seconds_count{operation="get"} 1' in lines
+    assert 'scoring_api_storage_operation_duration_seconds_count{operation="get_many"} 1' in lines
+    assert 'scoring_api_storage_operation_duration_seconds_count{operation="cache_set"} 1' in lines
@@ -0,0 +1,42 @@
+from scoring_api.timing import add_phase_time, current_timer, phase, start_timing, stop_timing
+
+
+def test_phase__disabled() -> None:
+    """Тестирует, что без `start_timing` этапы не измеряются."""
+    with phase('decode'):
+        pass
+    add_phase_time('storage', 1.0)
+
+    assert current_timer() is None
+
+
+def test_phase__enabled() -> None:
+    """Тестирует суммирование времени этапов и формат заголовка `Server-Timing`."""
+    timer, token = start_timing()
+    try:
+        with phase('decode'):
+            pass
+        add_phase_time('storage', 0.001)
+        add_phase_time('storage', 0.0005)
+        assert current_timer() is timer
+    finally:
+        stop_timing(token)
+
+    assert current_timer() is None
+    assert list(timer.timings) == ['decode', 'storage']
+    assert timer.milliseconds()['storage'] == 1.5  # noqa: PLR2004
+    assert timer.server_timing().endswith(', storage;dur=1.5')
+
+
+def test_phase__measured_on_error() -> None:
+    """Тестирует, что время этапа записывается и при исключении."""
+    timer, token = start_timing()
+    try:
+        with phase('auth'):
+            raise ValueError
+    except ValueError:
+        pass
+    finally:
+        stop_timing(token)
+
+    assert 'auth' in timer.timings